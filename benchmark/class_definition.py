@@ -0,0 +1,55 @@
+import timeit
+from dataclasses import field, make_dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from mashumaro import DataClassDictMixin
+
+REPETITIONS = 10
+FIELDS_COUNT = 250
+CHAIN_LENGTH = 10
+FIELD_TYPES = [int, str, Optional[float], List[int], Dict[str, datetime]]
+
+
+def make_fields(start, stop, with_defaults=True):
+    required = []
+    optional = []
+    for i in range(start, stop):
+        ftype = FIELD_TYPES[i % len(FIELD_TYPES)]
+        if with_defaults and i % 2:
+            optional.append((f"field_{i}", ftype, field(default=None)))
+        else:
+            required.append((f"field_{i}", ftype))
+    return required + optional
+
+
+def define_class():
+    make_dataclass(
+        "Model", make_fields(0, FIELDS_COUNT), bases=(DataClassDictMixin,)
+    )
+
+
+def define_class_chain():
+    base = DataClassDictMixin
+    step = FIELDS_COUNT // CHAIN_LENGTH
+    for i in range(0, FIELDS_COUNT, step):
+        fields = make_fields(i, i + step, with_defaults=False)
+        base = make_dataclass("Model", fields, bases=(base,))
+
+
+class_definition = min(
+    timeit.repeat(define_class, number=REPETITIONS, repeat=5)
+)
+class_chain_definition = min(
+    timeit.repeat(define_class_chain, number=REPETITIONS, repeat=5)
+)
+
+print(
+    f"Definition of a class with {FIELDS_COUNT} fields: "
+    f"{class_definition / REPETITIONS * 1000:.2f} ms"
+)
+print(
+    f"Definition of {CHAIN_LENGTH} inherited classes with "
+    f"{FIELDS_COUNT} fields in total: "
+    f"{class_chain_definition / REPETITIONS * 1000:.2f} ms"
+)
@@ -0,0 +1,91 @@
+import timeit
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import List
+from uuid import UUID
+
+from benchmark.enums import MyEnum, MyStrEnum
+from mashumaro import DataClassDictMixin, DataClassJSONMixin
+from mashumaro.config import BaseConfig
+from mashumaro.serializer.json import JSON_BACKEND_NAMES, JSON_BACKENDS
+
+REPETITIONS = 1000
+ITEMS_COUNT = 20
+
+
+@dataclass
+class Item(DataClassDictMixin):
+    id: int
+    price: float
+    name: str
+    active: bool
+    created: datetime
+    day: date
+    enum: MyEnum
+    str_enum: MyStrEnum
+    uuid: UUID
+
+
+def make_model(backend_name):
+    @dataclass
+    class Model(DataClassJSONMixin):
+        items: List[Item]
+        tags: List[str]
+
+        class Config(BaseConfig):
+            json_backend = backend_name
+
+    return Model(
+        items=[
+            Item(
+                id=i,
+                price=i * 1.25,
+                name=f"item {i}",
+                active=bool(i % 2),
+                created=datetime(2021, 1, 1, 12, 30, i),
+                day=date(2021, 1, i + 1),
+                enum=MyEnum.a,
+                str_enum=MyStrEnum.b,
+                uuid=UUID(int=i),
+            )
+            for i in range(ITEMS_COUNT)
+        ],
+        tags=["foo", "bar", "baz"],
+    )
+
+
+results = {}
+for name in reversed(JSON_BACKEND_NAMES):
+    if name not in JSON_BACKENDS:
+        print(f"{name}: not installed")
+        continue
+    obj = make_model(name)
+    data = obj.to_json()
+    to_json = min(timeit.repeat(obj.to_json, number=REPETITIONS, repeat=5))
+    from_json = min(
+        timeit.repeat(
+            lambda: type(obj).from_json(data), number=REPETITIONS, repeat=5
+        )
+    )
+    results[name] = (to_json, from_json)
+    backend = JSON_BACKENDS[name]
+    if backend.native_flags:
+        # the same backend with all the values converted by to_dict
+        to_json = min(
+            timeit.repeat(
+                lambda: obj.to_json(encoder=backend.dumps),
+                number=REPETITIONS,
+                repeat=5,
+            )
+        )
+        results[f"{name}*"] = (to_json, from_json)
+
+base_to_json, base_from_json = results["json"]
+print(f"{'Backend':<10} {'To JSON':>20} {'From JSON':>20}")
+for name, (to_json, from_json) in results.items():
+    print(
+        f"{name:<10} "
+        f"{to_json:>10.5f} ({base_to_json / to_json:.2f}x) "
+        f"{from_json:>10.5f} ({base_from_json / from_json:.2f}x)"
+    )
+print("* without the dict_params preset of the backend")
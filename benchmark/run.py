@@ -28,6 +28,17 @@ mashumaro_to_dict = min(
         number=REPETITIONS,
     )
 )
+mashumaro_simple_from_dict = min(
+    timeit.repeat(
+        "MASHUMAROSimpleClass.from_dict(sample)",
+        setup=(
+            "from benchmark.sample import sample_1;"
+            "from benchmark.mashumaro_setup import MASHUMAROSimpleClass;"
+            "sample = sample_1['list_simple'][0];"
+        ),
+        number=REPETITIONS,
+    )
+)
 cattrs_from_dict = min(
     timeit.repeat(
         "converter.structure(sample, CATTRClass)",
@@ -175,6 +186,10 @@ data = [
     ["dacite", dacite_from_dict, "—", " / ".join(slowdown["dacite"])],
 ]
 tt.print(data, header=header)
+print(
+    f"mashumaro from dict for MASHUMAROSimpleClass: "
+    f"{mashumaro_simple_from_dict / REPETITIONS * 1e6:.2f} µs"
+)
 
 writer = HtmlTableWriter(
     table_name="Comp",
@@ -1,6 +1,7 @@
 from mashumaro.exceptions import MissingField
 from mashumaro.helper import field_options
 from mashumaro.serializer.base.dict import DataClassDictMixin
+from mashumaro.serializer.base.file_cache import FileCache
 from mashumaro.serializer.json import DataClassJSONMixin
 from mashumaro.serializer.msgpack import DataClassMessagePackMixin
 from mashumaro.serializer.yaml import DataClassYAMLMixin
@@ -12,4 +13,5 @@ __all__ = [
     "DataClassMessagePackMixin",
     "DataClassYAMLMixin",
     "field_options",
+    "FileCache",
 ]
@@ -0,0 +1,155 @@
+import argparse
+import importlib
+import os
+import pkgutil
+import sys
+import types
+import typing
+
+from mashumaro.meta.helpers import (
+    is_dataclass_dict_mixin,
+    is_dataclass_dict_mixin_subclass,
+)
+from mashumaro.serializer.base.code_cache import GENERATED_MODULE_PREFIX
+from mashumaro.serializer.base.metaprogramming import (
+    TO_JSON,
+    CodeBuilder,
+    CodeLines,
+)
+
+METHOD_NAMES = (
+    "from_dict",
+    "to_dict",
+    "from_dict_many",
+    "to_dict_many",
+    "from_columns",
+    "to_columns",
+    "to_json",
+)
+
+
+def iter_modules(module_name: str) -> typing.Iterator[types.ModuleType]:
+    module = importlib.import_module(module_name)
+    yield module
+    for module_info in pkgutil.walk_packages(
+        getattr(module, "__path__", ()), prefix=f"{module_name}."
+    ):
+        if module_info.name.rpartition(".")[2].startswith(
+            GENERATED_MODULE_PREFIX
+        ):
+            continue
+        yield importlib.import_module(module_info.name)
+
+
+def iter_dataclasses(
+    module: types.ModuleType, namespace: typing.Any = None
+) -> typing.Iterator[type]:
+    if namespace is None:
+        namespace = module
+    for value in list(vars(namespace).values()):
+        if (
+            isinstance(value, type)
+            and value.__module__ == module.__name__
+            and "<locals>" not in value.__qualname__
+            and is_dataclass_dict_mixin_subclass(value)
+            and not is_dataclass_dict_mixin(value)
+        ):
+            yield value
+            yield from iter_dataclasses(module, value)
+
+
+def generate_module_source(module: types.ModuleType) -> typing.Optional[str]:
+    units = []
+    module_names = set()
+    classes = {cls.__qualname__: cls for cls in iter_dataclasses(module)}
+    for qualname, cls in classes.items():
+        builder = CodeBuilder(cls, use_saved_code=False)
+        for method_name in METHOD_NAMES:
+            if (
+                method_name == "to_json"
+                and getattr(cls, TO_JSON, None) is None
+            ):
+                continue
+            fingerprint = builder.get_code_fingerprint(method_name)
+            if fingerprint is None:
+                print(
+                    f"Skipping {module.__name__}.{qualname}.{method_name}: "
+                    f"the code depends on user defined callables",
+                    file=sys.stderr,
+                )
+                continue
+            try:
+                getattr(builder, f"add_{method_name}")()
+            except Exception as e:
+                print(
+                    f"Skipping {module.__name__}.{qualname}.{method_name}: "
+                    f"{type(e).__name__}: {e}",
+                    file=sys.stderr,
+                )
+                continue
+            module_names.update(builder.module_names)
+            units.append((qualname, method_name, fingerprint, builder.sources))
+    if not units:
+        return None
+    lines = CodeLines()
+    lines.append(f"# Generated by mashumaro.codegen from {module.__name__}")
+    lines.append("# Do not edit this file, regenerate it instead")
+    for module_name in sorted(module_names):
+        lines.append(f"import {module_name}  # noqa")
+    lines.append(
+        "from mashumaro.serializer.base.metaprogramming import *  # noqa"
+    )
+    for i, (_, _, _, sources) in enumerate(units):
+        lines.append("")
+        lines.append("")
+        lines.append(f"def _unit_{i}(cls):")
+        with lines.indent():
+            for source in sources:
+                for line in source.splitlines():
+                    lines.append(line)
+    lines.append("")
+    lines.append("")
+    lines.append("UNITS = {")
+    with lines.indent():
+        for i, (qualname, method_name, fingerprint, _) in enumerate(units):
+            key = f"({qualname!r}, {method_name!r})"
+            lines.append(f"{key}: ({fingerprint!r}, _unit_{i}),")
+    lines.append("}")
+    lines.append("")
+    return lines.as_text()
+
+
+def get_generated_module_path(
+    module: types.ModuleType,
+) -> typing.Optional[str]:
+    path = getattr(module, "__file__", None)
+    if not path or not path.endswith(".py"):
+        return None
+    directory, filename = os.path.split(path)
+    return os.path.join(directory, f"{GENERATED_MODULE_PREFIX}{filename}")
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m mashumaro.codegen",
+        description="Generate modules with the code of from_dict and to_dict "
+        "methods for all dataclasses in the given modules or packages.",
+    )
+    parser.add_argument(
+        "modules", nargs="+", metavar="module", help="module or package name"
+    )
+    args = parser.parse_args(argv)
+    for module_name in args.modules:
+        for module in iter_modules(module_name):
+            path = get_generated_module_path(module)
+            if path is None:
+                continue
+            source = generate_module_source(module)
+            if source is None:
+                continue
+            with open(path, "w", encoding="utf8") as f:
+                f.write(source)
+            print(f"Generated {path}")
+
+
+__all__ = ["generate_module_source", "main"]
@@ -0,0 +1,3 @@
+from mashumaro.codegen import main
+
+main()
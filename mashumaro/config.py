@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, List, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from mashumaro.types import SerializationStrategy
 
@@ -17,3 +17,14 @@ class BaseConfig:
     serialization_strategy: Dict[Any, SerializationStrategyValueType] = {}
     aliases: Dict[str, str] = {}
     serialize_by_alias: bool = False
+    code_cache_dir: Optional[str] = None
+    lazy_compilation: bool = False
+    inline_nested_depth: int = 0
+    direct_to_json: bool = False
+    json_backend: str = "json"
+    msgpack_ext_types: bool = False
+    positional_encoding: bool = False
+    yaml_base_loader: bool = False
+    json_object_pairs_hook: bool = False
+    trusted_input: bool = False
+    bypass_init: bool = False
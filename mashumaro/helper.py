@@ -8,12 +8,14 @@ def field_options(
     deserialize: Optional[Union[str, Callable[[Any], Any]]] = None,
     serialization_strategy: Optional[SerializationStrategy] = None,
     alias: Optional[str] = None,
+    discriminator: Optional[str] = None,
 ):
     return {
         "serialize": serialize,
         "deserialize": deserialize,
         "serialization_strategy": serialization_strategy,
         "alias": alias,
+        "discriminator": discriminator,
     }
 
 
@@ -0,0 +1,105 @@
+import hashlib
+import importlib
+import importlib.util
+import marshal
+import os
+import sys
+import tempfile
+import types
+import typing
+
+from mashumaro.version import __version__
+
+CACHE_FILE_SUFFIX = ".mashumaro"
+GENERATED_MODULE_PREFIX = "_mashumaro_"
+
+CachedCode = typing.Tuple[
+    typing.Tuple[str, ...], typing.Tuple[types.CodeType, ...]
+]
+
+_generated_modules: typing.Dict[str, typing.Optional[types.ModuleType]] = {}
+
+
+def get_fingerprint(data: typing.Any) -> str:
+    data = repr((__version__, sys.implementation.cache_tag, data)).encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+def get_cache_path(cache_dir: str, fingerprint: str) -> str:
+    return os.path.join(cache_dir, f"{fingerprint}{CACHE_FILE_SUFFIX}")
+
+
+def load_code(path: str) -> typing.Optional[CachedCode]:
+    try:
+        with open(path, "rb") as f:
+            module_names, code_objects = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return module_names, code_objects
+
+
+def dump_code(
+    path: str,
+    module_names: typing.Iterable[str],
+    code_objects: typing.Iterable[types.CodeType],
+) -> None:
+    data = marshal.dumps((tuple(module_names), tuple(code_objects)))
+    cache_dir = os.path.dirname(path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+def get_generated_module_name(module_name: str) -> typing.Optional[str]:
+    module = sys.modules.get(module_name)
+    if module is None or module_name == "__main__":
+        return None
+    if hasattr(module, "__path__"):
+        return f"{module_name}.{GENERATED_MODULE_PREFIX}__init__"
+    package, _, name = module_name.rpartition(".")
+    if name.startswith(GENERATED_MODULE_PREFIX):
+        return None
+    elif package:
+        return f"{package}.{GENERATED_MODULE_PREFIX}{name}"
+    else:
+        return f"{GENERATED_MODULE_PREFIX}{name}"
+
+
+def load_generated_module(
+    module_name: str,
+) -> typing.Optional[types.ModuleType]:
+    try:
+        return _generated_modules[module_name]
+    except KeyError:
+        pass
+    generated_module = None
+    generated_module_name = get_generated_module_name(module_name)
+    if generated_module_name:
+        try:
+            if importlib.util.find_spec(generated_module_name):
+                generated_module = importlib.import_module(
+                    generated_module_name
+                )
+        except ImportError:
+            pass
+    _generated_modules[module_name] = generated_module
+    return generated_module
+
+
+__all__ = [
+    "get_fingerprint",
+    "get_cache_path",
+    "load_code",
+    "dump_code",
+    "get_generated_module_name",
+    "load_generated_module",
+]
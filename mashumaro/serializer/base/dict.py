@@ -1,4 +1,15 @@
-from typing import Any, Dict, Mapping, Type, TypeVar
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+)
 
 from mashumaro.serializer.base.metaprogramming import CodeBuilder
 
@@ -8,8 +19,30 @@ T = TypeVar("T", bound="DataClassDictMixin")
 class DataClassDictMixin:
     __slots__ = ()
 
+    __mashumaro_trusted_input__: ClassVar[bool] = False
+
     def __init_subclass__(cls: Type[T], **kwargs):
         builder = CodeBuilder(cls)
+        cls.__mashumaro_trusted_input__ = builder.get_config().trusted_input
+        builder.add_variant_tables()
+        builder.add_trampoline(
+            "from_dict_many", builder.add_from_dict_many, is_classmethod=True
+        )
+        builder.add_trampoline(
+            "to_dict_many", builder.add_to_dict_many, is_classmethod=True
+        )
+        builder.add_trampoline(
+            "from_columns", builder.add_from_columns, is_classmethod=True
+        )
+        builder.add_trampoline(
+            "to_columns", builder.add_to_columns, is_classmethod=True
+        )
+        if builder.get_config().lazy_compilation:
+            builder.add_trampoline(
+                "from_dict", builder.add_from_dict, is_classmethod=True
+            )
+            builder.add_trampoline("to_dict", builder.add_to_dict)
+            return
         exc = None
         try:
             builder.add_from_dict()
@@ -42,9 +75,60 @@ class DataClassDictMixin:
         use_bytes: bool = False,
         use_enum: bool = False,
         use_datetime: bool = False,
+        *,
+        trusted: bool = False,
     ) -> T:
         ...
 
+    @classmethod
+    def from_dict_many(
+        cls: Type[T],
+        iterable: Iterable[Mapping],
+        use_bytes: bool = False,
+        use_enum: bool = False,
+        use_datetime: bool = False,
+        *,
+        errors: Optional[List[Any]] = None,
+        trusted: bool = False,
+    ) -> List[T]:
+        ...
+
+    @classmethod
+    def to_dict_many(
+        cls: Type[T],
+        objs: Iterable[T],
+        use_bytes: bool = False,
+        use_enum: bool = False,
+        use_datetime: bool = False,
+        # *
+        # keyword-only flags that are exist with the code generation options:
+        # omit_none: bool = False
+        # by_alias: bool = False
+        **kwargs,
+    ) -> List[dict]:
+        ...
+
+    @classmethod
+    def from_columns(
+        cls: Type[T],
+        columns: Mapping[str, Sequence],
+        use_bytes: bool = False,
+        use_enum: bool = False,
+        use_datetime: bool = False,
+    ) -> List[T]:
+        ...
+
+    @classmethod
+    def to_columns(
+        cls: Type[T],
+        objs: Iterable[T],
+        use_bytes: bool = False,
+        use_enum: bool = False,
+        use_datetime: bool = False,
+        use_numpy: bool = False,
+    ) -> Dict[str, Sequence]:
+        ...
+
     @classmethod
     def __pre_deserialize__(cls: Type[T], d: Dict[Any, Any]) -> Dict[Any, Any]:
         ...
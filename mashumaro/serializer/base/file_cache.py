@@ -0,0 +1,125 @@
+import hashlib
+import os
+import threading
+import typing
+from collections import OrderedDict
+
+DEFAULT_MAXSIZE = 128
+
+PathType = typing.Union[str, "os.PathLike[str]"]
+T = typing.TypeVar("T")
+
+
+def read_file(path: PathType) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class FileCache:
+    """
+    LRU cache of objects loaded from files. An object is loaded again
+    only if the file has changed, which is detected by its modification
+    time, size and inode, or by the hash of its content if use_hash is
+    true. The cached objects are returned as they are, so they are shared
+    between the callers and shouldn't be modified.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, use_hash: bool = False):
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive number")
+        self.maxsize = maxsize
+        self.use_hash = use_hash
+        self._entries: typing.OrderedDict[
+            typing.Tuple[typing.Any, ...], typing.Tuple[typing.Any, typing.Any]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(
+        self,
+        path: PathType,
+        loader: typing.Callable[[bytes], T],
+        key: typing.Hashable = None,
+    ) -> T:
+        """
+        Returns the object loaded by the loader from the content of the file
+        or the cached one. The key identifies the loader, so that the same
+        file can be cached for different classes and parameters.
+        """
+        path = os.path.abspath(path)
+        entry_key = (path, key)
+        data: typing.Optional[bytes] = None
+        if self.use_hash:
+            data = read_file(path)
+            state: typing.Any = hashlib.sha256(data).digest()
+        else:
+            # the file is checked before it's read, so if it changes in
+            # between, it's just loaded again on the next call
+            stat = os.stat(path)
+            state = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None and entry[0] == state:
+                self._entries.move_to_end(entry_key)
+                return entry[1]
+        if data is None:
+            data = read_file(path)
+        obj = loader(data)
+        with self._lock:
+            self._entries[entry_key] = (state, obj)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return obj
+
+    def invalidate(self, path: typing.Optional[PathType] = None) -> None:
+        """
+        Removes the objects loaded from the file or all the objects if
+        the path isn't passed.
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            path = os.path.abspath(path)
+            for entry_key in [k for k in self._entries if k[0] == path]:
+                del self._entries[entry_key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def load_file(
+    path: PathType,
+    loader: typing.Callable[[bytes], T],
+    cache: typing.Optional[FileCache] = None,
+    key: typing.Hashable = None,
+) -> T:
+    if cache is None or not is_hashable(key):
+        # the objects loaded with unhashable options, such as lists,
+        # can't be found by the key, so they aren't cached
+        return loader(read_file(path))
+    return cache.load(path, loader, key)
+
+
+def is_hashable(value: typing.Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def get_loader_key(
+    cls: typing.Any,
+    method_name: str,
+    decoder: typing.Any,
+    dict_params: typing.Mapping,
+    decoder_kwargs: typing.Mapping,
+) -> typing.Hashable:
+    return (
+        cls,
+        method_name,
+        decoder,
+        tuple(sorted(dict_params.items())),
+        tuple(sorted(decoder_kwargs.items())),
+    )
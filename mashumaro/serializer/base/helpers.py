@@ -1,5 +1,7 @@
 import datetime
+import json
 import re
+from json.encoder import encode_basestring_ascii  # noqa
 
 
 def parse_timezone(s: str):
@@ -21,6 +23,83 @@ def parse_timezone(s: str):
         return datetime.timezone.utc
 
 
+def dump_float(value) -> str:
+    value = float(value)
+    if value - value == 0:
+        return float.__repr__(value)
+    # NaN and infinities are written as JavaScript constants by json module
+    return json.dumps(value)
+
+
+# the plain scalars that YAML 1.1 resolves to booleans and special floats
+_BOOL_STRINGS = {
+    **dict.fromkeys(
+        ("true", "True", "TRUE", "yes", "Yes", "YES", "on", "On", "ON"), True
+    ),
+    **dict.fromkeys(
+        ("false", "False", "FALSE", "no", "No", "NO", "off", "Off", "OFF"),
+        False,
+    ),
+}
+_FLOAT_STRINGS = {
+    ".inf": float("inf"),
+    ".Inf": float("inf"),
+    ".INF": float("inf"),
+    "+.inf": float("inf"),
+    "+.Inf": float("inf"),
+    "+.INF": float("inf"),
+    "-.inf": float("-inf"),
+    "-.Inf": float("-inf"),
+    "-.INF": float("-inf"),
+    ".nan": float("nan"),
+    ".NaN": float("nan"),
+    ".NAN": float("nan"),
+}
+
+
+def parse_bool_string(s: str) -> bool:
+    try:
+        return _BOOL_STRINGS[s]
+    except (KeyError, TypeError):
+        raise ValueError(f"{s!r} is not a boolean value") from None
+
+
+def parse_int_string(s: str) -> int:
+    # the same rules as in construct_yaml_int of PyYAML
+    value = s.replace("_", "")
+    sign = -1 if value[:1] == "-" else 1
+    if value[:1] in ("+", "-"):
+        value = value[1:]
+    if value.startswith("0b"):
+        return sign * int(value[2:], 2)
+    elif value.startswith("0x"):
+        return sign * int(value[2:], 16)
+    elif value[:1] == "0" and value != "0":
+        try:
+            return sign * int(value, 8)
+        except ValueError:
+            # strings like "08" aren't resolved to octal numbers by YAML
+            pass
+    elif ":" in value:
+        result = 0
+        for part in value.split(":"):
+            result = result * 60 + int(part)
+        return sign * result
+    return sign * int(value)
+
+
+def parse_float_string(s: str) -> float:
+    value = _FLOAT_STRINGS.get(s)
+    if value is None:
+        return float(s)
+    return value
+
+
 __all__ = [
     "parse_timezone",
+    "dump_float",
+    "encode_basestring_ascii",
+    "parse_bool_string",
+    "parse_int_string",
+    "parse_float_string",
 ]
@@ -1,16 +1,21 @@
 import collections
 import collections.abc
+import dataclasses
 import datetime
 import enum
 import importlib
 import inspect
 import ipaddress
+import json
 import os
 import pathlib
 import sys
+import threading
 import types
 import typing
 import uuid
+import weakref
+import zlib
 from base64 import decodebytes, encodebytes  # noqa
 from contextlib import contextmanager, suppress
 
@@ -18,6 +23,7 @@ from contextlib import contextmanager, suppress
 from dataclasses import _FIELDS, MISSING, Field, is_dataclass  # type: ignore
 from decimal import Decimal
 from fractions import Fraction
+from itertools import repeat  # noqa
 from types import MappingProxyType
 
 from mashumaro.config import (
@@ -48,6 +54,13 @@ from mashumaro.meta.helpers import (
 )
 from mashumaro.meta.macros import PY_37_MIN
 from mashumaro.meta.patch import patch_fromisoformat
+from mashumaro.serializer.base.code_cache import (
+    dump_code,
+    get_cache_path,
+    get_fingerprint,
+    load_code,
+    load_generated_module,
+)
 from mashumaro.serializer.base.helpers import *  # noqa
 from mashumaro.types import SerializableType, SerializationStrategy
 
@@ -59,6 +72,10 @@ try:
     import pendulum
 except ImportError:  # pragma no cover
     pendulum: typing.Optional[types.ModuleType] = None  # type: ignore
+try:
+    import numpy
+except ImportError:  # pragma no cover
+    numpy: typing.Optional[types.ModuleType] = None  # type: ignore
 
 patch_fromisoformat()
 
@@ -71,6 +88,81 @@ __PRE_DESERIALIZE__ = "__pre_deserialize__"
 __POST_SERIALIZE__ = "__post_serialize__"
 __POST_DESERIALIZE__ = "__post_deserialize__"
 
+# str_scalars and prebuilt aren't keyword arguments of from_dict, their
+# variants are used for the data where all scalars are strings, such as YAML
+# loaded without implicit type resolution, and for the data where nested
+# dataclasses may have already been built by a JSON object hook, trusted is
+# a keyword-only argument whose default value comes from the config,
+# native_types variants accept the values of the types left by native_*
+# flags of to_dict as well as their strings
+FROM_DICT_FLAGS = (
+    "use_bytes",
+    "use_enum",
+    "use_datetime",
+    "str_scalars",
+    "prebuilt",
+    "trusted",
+    "native_types",
+)
+# native_* flags aren't keyword arguments of to_dict, their variants leave
+# the values of these types as they are for the encoders that handle them by
+# themselves, unlike use_* flags the overridden serialization is still used
+NATIVE_TO_DICT_FLAGS = (
+    "native_datetime",
+    "native_enum",
+    "native_uuid",
+    "native_decimal",
+    "native_fraction",
+)
+TO_DICT_FLAGS = (
+    "use_bytes",
+    "use_enum",
+    "use_datetime",
+    "omit_none",
+    "by_alias",
+    *NATIVE_TO_DICT_FLAGS,
+)
+FROM_DICT_VARIANTS = "__mashumaro_from_dict_variants__"
+TO_DICT_VARIANTS = "__mashumaro_to_dict_variants__"
+FROM_DICT_MANY_VARIANTS = "__mashumaro_from_dict_many_variants__"
+TO_DICT_MANY_VARIANTS = "__mashumaro_to_dict_many_variants__"
+FROM_COLUMNS_VARIANTS = "__mashumaro_from_columns_variants__"
+TO_COLUMNS_VARIANTS = "__mashumaro_to_columns_variants__"
+TO_JSON = "__mashumaro_to_json__"
+
+# field types that are stored in NumPy arrays by to_columns method
+_NUMPY_DTYPES = {
+    int: "int64",
+    float: "float64",
+    bool: "bool",
+    datetime.datetime: "datetime64[us]",
+    datetime.date: "datetime64[D]",
+}
+
+_compilation_lock = threading.RLock()
+
+_STRING_TYPES = (
+    datetime.timezone,
+    uuid.UUID,
+    Decimal,
+    Fraction,
+    ipaddress.IPv4Address,
+    ipaddress.IPv6Address,
+    ipaddress.IPv4Network,
+    ipaddress.IPv6Network,
+    ipaddress.IPv4Interface,
+    ipaddress.IPv6Interface,
+)
+
+_ABSTRACT_COLLECTION_TYPES = {
+    collections.abc.Mapping: (dict,),
+    collections.abc.MutableMapping: (dict,),
+    collections.abc.Sequence: (list, tuple),
+    collections.abc.MutableSequence: (list,),
+    collections.abc.Set: (set, frozenset),
+    collections.abc.MutableSet: (set,),
+}
+
 
 class CodeLines:
     def __init__(self):
@@ -96,15 +188,204 @@ class CodeLines:
         self._current_indent = ""
 
 
+def _has_user_callables(value) -> bool:
+    if isinstance(value, SerializationStrategy):
+        return True
+    elif isinstance(value, typing.Mapping):
+        return any(_has_user_callables(v) for v in value.values())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        return any(_has_user_callables(v) for v in value)
+    return callable(value)
+
+
+_own_type_hints: "weakref.WeakKeyDictionary[typing.Any, typing.Any]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_own_type_hints(cls, globalns=None) -> typing.Dict[str, typing.Any]:
+    annotations = cls.__dict__.get("__annotations__")
+    if not annotations:
+        return {}
+    try:
+        return _own_type_hints[cls]
+    except KeyError:
+        pass
+    if globalns is None:
+        globalns = getattr(sys.modules.get(cls.__module__), "__dict__", {})
+    # a class without ancestors is used to resolve only the annotations
+    # that the class itself declares, inherited ones are cached separately
+    holder = type(cls.__name__, (), {"__annotations__": annotations})
+    type_hints = typing.get_type_hints(holder, globalns)
+    _own_type_hints[cls] = type_hints
+    return type_hints
+
+
+def _iter_nested_types(t) -> typing.Generator[typing.Any, None, None]:
+    yield t
+    for arg in getattr(t, "__args__", ()):
+        yield from _iter_nested_types(arg)
+
+
+def _needs_union_helper(t) -> bool:
+    for arg in _iter_nested_types(t):
+        if is_union(arg):
+            args: typing.Tuple[typing.Any, ...] = arg.__args__
+            if not (len(args) == 2 and args[1] == NoneType):
+                return True
+    return False
+
+
+def _get_enum_value_type_names(
+    enum_type: typing.Type[enum.Enum],
+) -> typing.List[str]:
+    return sorted(
+        {type_name(type(m.value)) for m in enum_type.__members__.values()}
+    )
+
+
+def _has_hashable_values(enum_type: typing.Type[enum.Enum]) -> bool:
+    try:
+        for member in enum_type.__members__.values():
+            hash(member.value)
+    except TypeError:
+        return False
+    return True
+
+
+def _is_json_scalar_type(t) -> bool:
+    if not isinstance(t, type):
+        return False
+    return t in (
+        bool,
+        int,
+        float,
+        datetime.datetime,
+        datetime.date,
+        datetime.time,
+        datetime.timedelta,
+    ) or issubclass(
+        t, (str, bytes, bytearray, enum.Enum, os.PathLike, *_STRING_TYPES)
+    )
+
+
+def _get_enum_value_type(
+    enum_type: typing.Type[enum.Enum],
+) -> typing.Optional[type]:
+    # enums with numeric values of the same type are loaded from strings
+    # by converting them to this type first
+    value_types = {type(member.value) for member in enum_type}
+    if len(value_types) == 1:
+        value_type = value_types.pop()
+        if value_type in (int, float):
+            return value_type
+    return None
+
+
+def get_variant(flags: typing.Iterable[typing.Any]) -> str:
+    return "".join("1" if flag else "0" for flag in flags)
+
+
+def get_variant_name(method_name: str, variant: str) -> str:
+    return f"__mashumaro_{method_name}_{variant}__"
+
+
+def get_native_to_dict_variant(
+    cls, dict_params: typing.Mapping, native_flags: typing.AbstractSet[str]
+) -> str:
+    """
+    Returns the to_dict variant for the keyword arguments of to_dict and
+    the types an encoder handles by itself, such as "native_datetime".
+    """
+    for name in dict_params:
+        if name in TO_DICT_FLAGS[:3]:
+            continue
+        elif name not in CodeBuilder(cls).get_to_dict_flag_names():
+            raise TypeError(
+                f"to_dict() got an unexpected keyword argument {name!r}"
+            )
+    return get_variant(
+        dict_params.get(flag) or flag in native_flags for flag in TO_DICT_FLAGS
+    )
+
+
+def call_to_dict_variant(variant: str, obj) -> typing.Dict[str, typing.Any]:
+    # the instances of subclasses are dumped by their own variants
+    return getattr(type(obj), TO_DICT_VARIANTS)[variant](obj)
+
+
+def get_native_from_dict_variant(cls, dict_params: typing.Mapping) -> str:
+    """
+    Returns the from_dict variant for the keyword arguments of from_dict
+    and the values of the types a decoder makes by itself.
+    """
+    for name in dict_params:
+        if name not in FROM_DICT_FLAGS[:3] and name != "trusted":
+            raise TypeError(
+                f"from_dict() got an unexpected keyword argument {name!r}"
+            )
+    flags = dict(dict_params, native_types=True)
+    flags.setdefault("trusted", cls.__mashumaro_trusted_input__)
+    return get_variant(flags.get(flag) for flag in FROM_DICT_FLAGS)
+
+
+class MethodVariants(dict):
+    """
+    Functions compiled for the particular flag values of from_dict or to_dict
+    method, the missing ones are compiled on the first lookup. The generated
+    code looks them up by strings like "010", which hashes faster than tuples
+    of flags passed to the public methods, those are stored as aliases.
+    """
+
+    def __init__(self, cls, method_name: str):
+        super().__init__()
+        self.cls = cls
+        self.method_name = method_name
+
+    def __missing__(self, variant):
+        if isinstance(variant, tuple):
+            function = self[get_variant(variant)]
+            self[variant] = function
+            return function
+        with _compilation_lock:
+            if variant not in self:
+                builder = CodeBuilder(self.cls)
+                getattr(builder, f"add_{self.method_name}")(variant)
+        return dict.__getitem__(self, variant)
+
+
 class CodeBuilder:
-    def __init__(self, cls):
+    def __init__(self, cls, use_saved_code: bool = True):
         self.cls = cls
+        self.use_saved_code = use_saved_code
         self.lines: CodeLines = CodeLines()
         self.globals: typing.Dict[str, typing.Any] = {}
+        self.module_names: typing.List[str] = []
+        self.sources: typing.List[str] = []
+        self.code_objects: typing.List[types.CodeType] = []
+        self.flags: typing.Dict[str, bool] = dict.fromkeys(
+            TO_DICT_FLAGS, False
+        )
+        self.inline_depth = 0
+        self.inline_chain: typing.Tuple[typing.Any, ...] = ()
+        self.has_inlined_code = False
+        self._fingerprints: typing.Dict[str, typing.Optional[str]] = {}
+        self._type_hints: typing.Optional[typing.Dict[str, typing.Any]] = None
+        self._field_types: typing.Optional[typing.Dict[str, typing.Any]] = None
+        self._dataclass_fields: typing.Optional[typing.Dict[str, Field]] = None
+        self._defaults: typing.Optional[typing.Dict[str, typing.Any]] = None
+        self._metadatas: typing.Optional[
+            typing.Dict[str, typing.Mapping[str, typing.Any]]
+        ] = None
+        self._configs: typing.Dict[typing.Any, typing.Type[BaseConfig]] = {}
+        self._init_arg_names: typing.Optional[typing.List[str]] = None
 
     def reset(self) -> None:
         self.lines.reset()
         self.globals = globals().copy()
+        self.module_names = []
+        self.sources = []
+        self.code_objects = []
 
     @property
     def namespace(self) -> typing.Dict[typing.Any, typing.Any]:
@@ -114,57 +395,73 @@ class CodeBuilder:
     def annotations(self) -> typing.Dict[str, typing.Any]:
         return self.namespace.get("__annotations__", {})
 
-    def __get_field_types(
-        self, recursive=True
-    ) -> typing.Dict[str, typing.Any]:
-        fields = {}
-        globalns = sys.modules[self.cls.__module__].__dict__.copy()
-        globalns[self.cls.__name__] = self.cls
-        for fname, ftype in typing.get_type_hints(self.cls, globalns).items():
-            if is_class_var(ftype) or is_init_var(ftype):
-                continue
-            if recursive or fname in self.annotations:
-                fields[fname] = ftype
-        return fields
+    @property
+    def own_field_names(self) -> typing.List[str]:
+        return [f for f in self.field_types if f in self.annotations]
+
+    @property
+    def type_hints(self) -> typing.Dict[str, typing.Any]:
+        if self._type_hints is None:
+            globalns = sys.modules[self.cls.__module__].__dict__.copy()
+            globalns[self.cls.__name__] = self.cls
+            type_hints = {}
+            for ancestor in self.cls.__mro__[-1:0:-1]:
+                type_hints.update(get_own_type_hints(ancestor))
+            type_hints.update(get_own_type_hints(self.cls, globalns))
+            self._type_hints = type_hints
+        return self._type_hints
 
     @property
     def field_types(self) -> typing.Dict[str, typing.Any]:
-        return self.__get_field_types()
+        if self._field_types is None:
+            self._field_types = {
+                fname: ftype
+                for fname, ftype in self.type_hints.items()
+                if not is_class_var(ftype) and not is_init_var(ftype)
+            }
+        return self._field_types
+
+    @property
+    def dataclass_fields(self) -> typing.Dict[str, Field]:
+        if self._dataclass_fields is None:
+            if _FIELDS in self.namespace:
+                # the class has already been processed by dataclass decorator
+                self._dataclass_fields = dict(self.namespace[_FIELDS])
+                return self._dataclass_fields
+            fields = {}
+            for ancestor in self.cls.__mro__[-1:0:-1]:
+                if is_dataclass(ancestor):
+                    fields.update(getattr(ancestor, _FIELDS))
+            for name in self.own_field_names:
+                field = self.namespace.get(name, MISSING)
+                if not isinstance(field, Field):
+                    field = dataclasses.field(default=field)
+                    field.name = name
+                fields[name] = field
+            self._dataclass_fields = fields
+        return self._dataclass_fields
 
     @property
     def defaults(self) -> typing.Dict[str, typing.Any]:
-        d = {}
-        for ancestor in self.cls.__mro__[-1:0:-1]:
-            if is_dataclass(ancestor):
-                for field in getattr(ancestor, _FIELDS).values():
-                    if field.default is not MISSING:
-                        d[field.name] = field.default
-                    else:
-                        d[field.name] = field.default_factory
-        for name in self.__get_field_types(recursive=False):
-            field = self.namespace.get(name, MISSING)
-            if isinstance(field, Field):
+        if self._defaults is None:
+            d = {}
+            for name, field in self.dataclass_fields.items():
                 if field.default is not MISSING:
                     d[name] = field.default
                 else:
                     # https://github.com/python/mypy/issues/6910
                     d[name] = field.default_factory  # type: ignore
-            else:
-                d[name] = field
-        return d
+            self._defaults = d
+        return self._defaults
 
     @property
     def metadatas(self) -> typing.Dict[str, typing.Mapping[str, typing.Any]]:
-        d = {}
-        for ancestor in self.cls.__mro__[-1:0:-1]:
-            if is_dataclass(ancestor):
-                for field in getattr(ancestor, _FIELDS).values():
-                    d[field.name] = field.metadata
-        for name in self.__get_field_types(recursive=False):
-            field = self.namespace.get(name, MISSING)
-            if isinstance(field, Field):
-                d[name] = field.metadata
-        return d
+        if self._metadatas is None:
+            self._metadatas = {
+                name: field.metadata
+                for name, field in self.dataclass_fields.items()
+            }
+        return self._metadatas
 
     def _add_type_modules(self, *types_) -> None:
         for t in types_:
@@ -180,7 +477,9 @@ class CodeBuilder:
                 self._add_type_modules(*constraints)
 
     def ensure_module_imported(self, module: types.ModuleType) -> None:
-        self.globals.setdefault(module.__name__, module)
+        if module.__name__ not in self.globals:
+            self.module_names.append(module.__name__)
+            self.globals[module.__name__] = module
         package = module.__name__.split(".")[0]
         self.globals.setdefault(package, importlib.import_module(package))
 
@@ -192,13 +491,192 @@ class CodeBuilder:
         with self.lines.indent():
             yield
 
+    @contextmanager
+    def native_flags_disabled(self) -> typing.Generator[None, None, None]:
+        flags = self.flags
+        self.flags = dict(flags, **dict.fromkeys(NATIVE_TO_DICT_FLAGS, False))
+        try:
+            yield
+        finally:
+            self.flags = flags
+
     def compile(self) -> None:
         code = self.lines.as_text()
         if self.get_config().debug:
             print(self.cls)
             print(code)
+        self._exec(code)
+
+    def _exec(self, source: str) -> None:
+        code = compile(source, "<string>", "exec")
+        self.sources.append(source)
+        self.code_objects.append(code)
         exec(code, self.globals, self.__dict__)
 
+    def get_code_fingerprint(self, method_name: str) -> typing.Optional[str]:
+        try:
+            return self._fingerprints[method_name]
+        except KeyError:
+            pass
+        fingerprint = self._get_code_fingerprint(method_name)
+        self._fingerprints[method_name] = fingerprint
+        return fingerprint
+
+    def _get_code_fingerprint(self, method_name: str) -> typing.Optional[str]:
+        shape = self.get_shape(self.get_config().inline_nested_depth)
+        if shape is None:
+            return None
+        return get_fingerprint((method_name, shape))
+
+    def has_user_callables(self) -> bool:
+        if _has_user_callables(self.get_config().serialization_strategy):
+            return True
+        return any(
+            _has_user_callables(dict(self.metadatas.get(fname, {})))
+            for fname in self.field_types
+        )
+
+    def get_shape(self, inline_depth: int = 0) -> typing.Optional[tuple]:
+        # user defined callables are bound to the class while the code
+        # is being built, so there is nothing to take from the cache
+        if self.has_user_callables():
+            return None
+        config = self.get_config()
+        fields = []
+        nested_classes = []
+        enum_types = []
+        discriminated_classes: typing.List[typing.Tuple[str, str, str]] = []
+        for fname, ftype in self.field_types.items():
+            metadata = self.metadatas.get(fname, {})
+            fields.append(
+                (
+                    fname,
+                    repr(ftype),
+                    self.defaults[fname] is MISSING,
+                    sorted(metadata.items()),
+                )
+            )
+            discriminator = metadata.get("discriminator")
+            if discriminator:
+                discriminated_classes.extend(
+                    (type_name(cls), key, repr(tag))
+                    for cls, key, tag in self._get_discriminated_classes(
+                        list(_iter_nested_types(ftype)), discriminator
+                    )
+                )
+            for t in _iter_nested_types(ftype):
+                if not isinstance(t, type):
+                    continue
+                elif issubclass(t, enum.Enum):
+                    # the code depends on the types of the member values,
+                    # such as the types dispatched to the enum in unions
+                    enum_types.append(
+                        (type_name(t), _get_enum_value_type_names(t))
+                    )
+                elif is_dataclass_dict_mixin_subclass(t):
+                    nested_class: tuple = (
+                        type_name(t),
+                        sorted(self.get_config(t).code_generation_options),
+                        getattr(t, TO_JSON, None) is not None,
+                        self.get_config(t).positional_encoding,
+                    )
+                    if inline_depth > 0:
+                        # the code of inlined classes is a part of the code
+                        nested_class += (
+                            CodeBuilder(t).get_shape(inline_depth - 1),
+                        )
+                    nested_classes.append(nested_class)
+        hooks = []
+        for hook_name in (
+            __PRE_SERIALIZE__,
+            __PRE_DESERIALIZE__,
+            __POST_SERIALIZE__,
+            __POST_DESERIALIZE__,
+        ):
+            hook = self.get_declared_hook(hook_name)
+            if hook:
+                hooks.append((hook_name, type(hook).__name__))
+        config_options = sorted(
+            (name, repr(getattr(config, name)))
+            for name in dir(config)
+            if not name.startswith("_")
+        )
+        return (
+            type_name(self.cls),
+            fields,
+            nested_classes,
+            enum_types,
+            discriminated_classes,
+            hooks,
+            config_options,
+            self.can_bypass_init(),
+            self.get_init_arg_names(),
+        )
+
+    def get_code_cache_path(self, method_name: str) -> typing.Optional[str]:
+        cache_dir = self.get_config().code_cache_dir
+        if cache_dir is None:
+            return None
+        fingerprint = self.get_code_fingerprint(method_name)
+        if fingerprint is None:
+            return None
+        return get_cache_path(cache_dir, fingerprint)
+
+    def load_saved_code(self, method_name: str) -> bool:
+        if not self.use_saved_code:
+            return False
+        generated_module = load_generated_module(self.cls.__module__)
+        if generated_module is not None:
+            unit = generated_module.UNITS.get(
+                (self.cls.__qualname__, method_name)
+            )
+            if unit is not None:
+                fingerprint, build = unit
+                if fingerprint == self.get_code_fingerprint(method_name):
+                    build(self.cls)
+                    return True
+        cache_path = self.get_code_cache_path(method_name)
+        if cache_path is None:
+            return False
+        cached = load_code(cache_path)
+        if cached is None:
+            return False
+        module_names, code_objects = cached
+        for module_name in module_names:
+            self.ensure_module_imported(importlib.import_module(module_name))
+        for code in code_objects:
+            exec(code, self.globals, self.__dict__)
+        return True
+
+    def save_code(self, method_name: str) -> None:
+        if not self.use_saved_code:
+            return
+        cache_path = self.get_code_cache_path(method_name)
+        if cache_path:
+            dump_code(cache_path, self.module_names, self.code_objects)
+
+    def add_trampoline(
+        self,
+        method_name: str,
+        build: typing.Callable[[], None],
+        is_classmethod: bool = False,
+    ) -> None:
+        cls = self.cls
+
+        def trampoline(obj, *args, **kwargs):
+            with _compilation_lock:
+                if cls.__dict__.get(method_name) is descriptor:
+                    build()
+            if is_classmethod:
+                method = cls.__dict__[method_name].__get__(None, obj)
+            else:
+                method = cls.__dict__[method_name].__get__(obj, type(obj))
+            return method(*args, **kwargs)
+
+        trampoline.__name__ = trampoline.__qualname__ = method_name
+        descriptor = classmethod(trampoline) if is_classmethod else trampoline
+        setattr(cls, method_name, descriptor)
+
     def get_declared_hook(self, method_name: str):
         if not hasattr(self.cls, method_name):
             return
@@ -206,234 +684,1182 @@ class CodeBuilder:
         if not is_dataclass_dict_mixin(cls):
             return cls.__dict__[method_name]
 
-    def add_from_dict(self) -> None:
+    def add_variant_tables(self) -> None:
+        setattr(
+            self.cls, FROM_DICT_VARIANTS, MethodVariants(self.cls, "from_dict")
+        )
+        setattr(
+            self.cls, TO_DICT_VARIANTS, MethodVariants(self.cls, "to_dict")
+        )
+        setattr(
+            self.cls,
+            FROM_DICT_MANY_VARIANTS,
+            MethodVariants(self.cls, "from_dict_many"),
+        )
+        setattr(
+            self.cls,
+            TO_DICT_MANY_VARIANTS,
+            MethodVariants(self.cls, "to_dict_many"),
+        )
+        setattr(
+            self.cls,
+            FROM_COLUMNS_VARIANTS,
+            MethodVariants(self.cls, "from_columns"),
+        )
+        setattr(
+            self.cls,
+            TO_COLUMNS_VARIANTS,
+            MethodVariants(self.cls, "to_columns"),
+        )
+
+    def add_from_dict(self, variant: typing.Optional[str] = None) -> None:
+
+        config = self.get_config()
+        self.reset()
+        if variant is None:
+            method_name = "from_dict"
+            self.flags = dict.fromkeys(FROM_DICT_FLAGS, False)
+            self.flags["trusted"] = config.trusted_input
+        else:
+            method_name = get_variant_name("from_dict", variant)
+            self.flags = {
+                flag: bit == "1" for flag, bit in zip(FROM_DICT_FLAGS, variant)
+            }
+        self.inline_depth = config.inline_nested_depth
+        self.inline_chain = (self.cls,)
+        if self.load_saved_code(method_name):
+            return
+        if variant is None:
+            self.add_line("@classmethod")
+            self.add_line(
+                "def from_dict(cls, d, use_bytes=False, use_enum=False, "
+                f"use_datetime=False, *, trusted={config.trusted_input}):"
+            )
+        else:
+            self.add_line(f"def {method_name}(cls, d):")
+        with self.indent():
+            if variant is None:
+                self._add_from_dict_dispatch(FROM_DICT_VARIANTS, "d")
+            self.add_line(f"return {self._add_from_dict_body()}")
+        if variant is None:
+            self.add_line("setattr(cls, 'from_dict', from_dict)")
+        else:
+            self.add_line(
+                f"cls.{FROM_DICT_VARIANTS}[{variant!r}] = {method_name}"
+            )
+        self.compile()
+        self.save_code(method_name)
 
+    def add_from_dict_many(self, variant: typing.Optional[str] = None) -> None:
         config = self.get_config()
         self.reset()
-        self.add_line("@classmethod")
-        self.add_line(
-            "def from_dict(cls, d, use_bytes=False, use_enum=False, "
-            "use_datetime=False):"
+        if variant is None:
+            method_name = "from_dict_many"
+            self.flags = dict.fromkeys(FROM_DICT_FLAGS, False)
+            self.flags["trusted"] = config.trusted_input
+        else:
+            method_name = get_variant_name("from_dict_many", variant)
+            self.flags = {
+                flag: bit == "1" for flag, bit in zip(FROM_DICT_FLAGS, variant)
+            }
+        self.inline_depth = config.inline_nested_depth
+        self.inline_chain = (self.cls,)
+        if self.load_saved_code(method_name):
+            return
+        if variant is None:
+            self.add_line("@classmethod")
+            self.add_line(
+                "def from_dict_many(cls, iterable, use_bytes=False, "
+                "use_enum=False, use_datetime=False, *, errors=None, "
+                f"trusted={config.trusted_input}):"
+            )
+        else:
+            self.add_line(f"def {method_name}(cls, iterable, errors=None):")
+        with self.indent():
+            if variant is None:
+                self._add_from_dict_dispatch(
+                    FROM_DICT_MANY_VARIANTS, "iterable, errors"
+                )
+            self.add_line("result = []")
+            self.add_line("for i, d in enumerate(iterable):")
+            with self.indent():
+                self.add_line("try:")
+                with self.indent():
+                    self.add_line(
+                        f"result.append({self._add_from_dict_body()})"
+                    )
+                self._add_many_error_handler()
+            self.add_line("return result")
+        if variant is None:
+            self.add_line("setattr(cls, 'from_dict_many', from_dict_many)")
+        else:
+            self.add_line(
+                f"cls.{FROM_DICT_MANY_VARIANTS}[{variant!r}] = {method_name}"
+            )
+        self.compile()
+        self.save_code(method_name)
+
+    def _add_from_dict_dispatch(self, variants_name: str, args: str) -> None:
+        # the variant for the default value of trusted is the method itself
+        if self.flags["trusted"]:
+            condition = "use_bytes or use_enum or use_datetime or not trusted"
+        else:
+            condition = "use_bytes or use_enum or use_datetime or trusted"
+        self.add_line(f"if {condition}:")
+        with self.indent():
+            self.add_line(
+                f"return cls.{variants_name}[(bool(use_bytes), "
+                f"bool(use_enum), bool(use_datetime), False, False, "
+                f"bool(trusted), False)](cls, {args})"
+            )
+
+    def _add_many_error_handler(self) -> None:
+        self.add_line("except Exception as e:")
+        with self.indent():
+            self.add_line("if errors is None:")
+            with self.indent():
+                self.add_line("raise")
+            self.add_line("errors.append((i, e))")
+
+    def _add_from_dict_body(self) -> str:
+        config = self.get_config()
+        pre_deserialize = self.get_declared_hook(__PRE_DESERIALIZE__)
+        if pre_deserialize:
+            if not isinstance(pre_deserialize, classmethod):
+                raise BadHookSignature(
+                    f"`{__PRE_DESERIALIZE__}` must be a class method with "
+                    f"Callable[[Dict[Any, Any]], Dict[Any, Any]] signature"
+                )
+            else:
+                self.add_line(f"d = cls.{__PRE_DESERIALIZE__}(d)")
+        if config.positional_encoding:
+            result = self._add_from_list_body()
+        else:
+            result = self._add_from_dict_items()
+        post_deserialize = self.get_declared_hook(__POST_DESERIALIZE__)
+        if post_deserialize:
+            if not isinstance(post_deserialize, classmethod):
+                raise BadHookSignature(
+                    f"`{__POST_DESERIALIZE__}` must be a class method "
+                    f"with Callable[[{type_name(self.cls)}], "
+                    f"{type_name(self.cls)}] signature"
+                )
+            else:
+                return f"cls.{__POST_DESERIALIZE__}({result})"
+        return result
+
+    def _add_from_dict_items(self) -> str:
+        config = self.get_config()
+        self.add_line("try:")
+        with self.indent():
+            if not self.field_types:
+                self.add_line("pass")
+            self._add_kwargs()
+            for fname, ftype in self.field_types.items():
+                self._add_type_modules(ftype)
+                metadata = self.metadatas.get(fname, {})
+                alias = metadata.get("alias")
+                if alias is None:
+                    alias = config.aliases.get(fname)
+                self._from_dict_set_value(fname, ftype, metadata, alias)
+        self.add_line("except AttributeError:")
+        with self.indent():
+            self.add_line("if not isinstance(d, dict):")
+            with self.indent():
+                self.add_line(
+                    f"raise ValueError('Argument for "
+                    f"{type_name(self.cls)}.from_dict method "
+                    f"should be a dict instance') from None"
+                )
+            self.add_line("else:")
+            with self.indent():
+                self.add_line("raise")
+        return self._add_instance()
+
+    def _from_dict_set_value(
+        self, fname, ftype, metadata, alias=None, value_expr=None
+    ):
+        if value_expr is None:
+            value_expr = f"d.get('{alias or fname}', MISSING)"
+        target = self._get_field_target(fname)
+        self.add_line(f"value = {value_expr}")
+        self.add_line("if value is None:")
+        with self.indent():
+            self.add_line(f"{target} = None")
+        if self.defaults[fname] is MISSING:
+            self.add_line("elif value is MISSING:")
+            with self.indent():
+                self.add_line(
+                    f"raise MissingField('{fname}'," f"{type_name(ftype)},cls)"
+                )
+            self.add_line("else:")
+            with self.indent():
+                self._add_unpacked_value(fname, ftype, metadata)
+        else:
+            self.add_line("elif value is not MISSING:")
+            with self.indent():
+                self._add_unpacked_value(fname, ftype, metadata)
+            if self.can_bypass_init():
+                # there is no __init__ to set the default value
+                field = f"cls.__dataclass_fields__['{fname}']"
+                if self.dataclass_fields[fname].default is MISSING:
+                    default = f"{field}.default_factory()"
+                else:
+                    default = f"{field}.default"
+                self.add_line("else:")
+                with self.indent():
+                    self.add_line(f"{target} = {default}")
+
+    def can_bypass_init(self) -> bool:
+        if not self.get_config().bypass_init:
+            return False
+        # the instances can be created without __init__ only if it would
+        # just assign the values of all the fields
+        if self.has_own_init() or hasattr(self.cls, "__post_init__"):
+            return False
+        elif any(map(is_init_var, self.type_hints.values())):
+            return False
+        return all(field.init for field in self.dataclass_fields.values())
+
+    def has_own_init(self) -> bool:
+        init = self.namespace.get("__init__")
+        if _FIELDS not in self.namespace:
+            # the dataclass decorator hasn't been applied yet, it keeps
+            # __init__ defined in the class body
+            return init is not None
+        elif init is None:
+            # the decorator was told not to add __init__
+            return True
+        # the decorator compiles __init__ from the generated source code
+        code = getattr(init, "__code__", None)
+        return code is None or code.co_filename != "<string>"
+
+    def _get_slot_field_names(self) -> typing.List[str]:
+        return [
+            fname
+            for fname in self.field_types
+            if isinstance(
+                inspect.getattr_static(self.cls, fname, None),
+                types.MemberDescriptorType,
+            )
+        ]
+
+    def get_init_arg_names(self) -> typing.List[str]:
+        if self._init_arg_names is None:
+            self._init_arg_names = self._get_init_arg_names()
+        return self._init_arg_names
+
+    def _get_init_arg_names(self) -> typing.List[str]:
+        # the values of the leading required fields are passed to __init__
+        # positionally if it's known to take them in the same order
+        if self.can_bypass_init() or self.has_own_init():
+            return []
+        names = []
+        for fname, ftype in self.type_hints.items():
+            if is_class_var(ftype):
+                continue
+            field = self.dataclass_fields.get(fname)
+            if (
+                is_init_var(ftype)
+                or field is None
+                or not field.init
+                or getattr(field, "kw_only", False)
+                or self.defaults[fname] is not MISSING
+            ):
+                break
+            names.append(fname)
+        if _FIELDS in self.namespace:
+            try:
+                parameters = inspect.signature(self.cls.__init__).parameters
+            except (TypeError, ValueError):  # pragma no cover
+                return []
+            init_names = [
+                name
+                for name, parameter in list(parameters.items())[1:]
+                if parameter.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+            ]
+            if init_names[: len(names)] != names:
+                return []
+        return names
+
+    def _can_fill_instance_dict(self) -> bool:
+        return (
+            self.can_bypass_init()
+            and bool(self.cls.__dictoffset__)
+            and not self._get_slot_field_names()
+        )
+
+    def _get_field_target(self, fname: str) -> str:
+        if fname in self.get_init_arg_names():
+            return f"v_{fname}"
+        return f"kwargs['{fname}']"
+
+    def _add_kwargs(self) -> None:
+        if self._can_fill_instance_dict():
+            # the values are put right into the dict of the instance
+            self.add_line("obj = object.__new__(cls)")
+            self.add_line("kwargs = obj.__dict__")
+        elif len(self.get_init_arg_names()) < len(self.field_types):
+            self.add_line("kwargs = {}")
+
+    def _add_instance(self) -> str:
+        if not self.can_bypass_init():
+            args = [f"v_{fname}" for fname in self.get_init_arg_names()]
+            if len(args) < len(self.field_types):
+                args.append("**kwargs")
+            return f"cls({', '.join(args)})"
+        elif not self._can_fill_instance_dict():
+            # slots are set by their descriptors
+            self.add_line("obj = object.__new__(cls)")
+            for fname in self.field_types:
+                self.add_line(
+                    f"object.__setattr__(obj, '{fname}', kwargs['{fname}'])"
+                )
+        return "obj"
+
+    def _add_unpacked_value(self, fname, ftype, metadata) -> None:
+        self.has_inlined_code = False
+        unpacked_value = self._unpack_field_value(
+            fname=fname,
+            ftype=ftype,
+            parent=self.cls,
+            metadata=metadata,
+        )
+        target = self._get_field_target(fname)
+        if self.flags["trusted"]:
+            self.add_line(f"{target} = {unpacked_value}")
+            return
+        elif not self.has_inlined_code:
+            self._add_checked_value(fname, ftype, target, unpacked_value)
+            return
+        self.add_line("try:")
+        with self.indent():
+            self.add_line(f"{target} = {unpacked_value}")
+        self.add_line("except Exception:")
+        with self.indent():
+            self.add_line(f"{target} = MISSING")
+        # the invalid value is converted again by the code of the nested
+        # classes, so that the error is the same as without inlining
+        inline_depth, self.inline_depth = self.inline_depth, 0
+        unpacked_value = self._unpack_field_value(
+            fname=fname,
+            ftype=ftype,
+            parent=self.cls,
+            metadata=metadata,
+        )
+        self.inline_depth = inline_depth
+        self.add_line(f"if {target} is MISSING:")
+        with self.indent():
+            self._add_checked_value(fname, ftype, target, unpacked_value)
+
+    def _add_checked_value(
+        self, fname, ftype, target: str, unpacked_value: str
+    ) -> None:
+        self.add_line("try:")
+        with self.indent():
+            self.add_line(f"{target} = {unpacked_value}")
+        self.add_line("except Exception as e:")
+        with self.indent():
+            field_type = type_name(ftype)
+            self.add_line(
+                f"raise InvalidFieldValue('{fname}',{field_type},value,cls)"
+            )
+
+    def get_config(self, cls=None) -> typing.Type[BaseConfig]:
+        if cls is None:
+            cls = self.cls
+        try:
+            return self._configs[cls]
+        except KeyError:
+            pass
+        config_cls = getattr(cls, "Config", BaseConfig)
+        if not issubclass(config_cls, BaseConfig):
+            config_cls = type(
+                "Config",
+                (BaseConfig, config_cls),
+                {**BaseConfig.__dict__, **config_cls.__dict__},
+            )
+        self._configs[cls] = config_cls
+        return config_cls
+
+    def get_to_dict_flag_names(self, cls=None) -> typing.List[str]:
+        flag_names = ["use_bytes", "use_enum", "use_datetime"]
+        for option, flag in (
+            (TO_DICT_ADD_OMIT_NONE_FLAG, "omit_none"),
+            (TO_DICT_ADD_BY_ALIAS_FLAG, "by_alias"),
+        ):
+            if self.is_code_generation_option_enabled(option, cls):
+                flag_names.append(flag)
+        return flag_names
+
+    def get_to_dict_variant(self, cls=None) -> str:
+        # the pluggable flags are passed to the nested dataclass only if it
+        # has them as well, otherwise it's serialized as if they were False
+        flag_names = self.get_to_dict_flag_names(cls)
+        return get_variant(
+            self.flags[flag]
+            and (flag in flag_names or flag in NATIVE_TO_DICT_FLAGS)
+            for flag in TO_DICT_FLAGS
+        )
+
+    def get_to_dict_default_flag_values(self, cls=None) -> str:
+        pluggable_flags = self.get_to_dict_flag_names(cls)[3:]
+        if pluggable_flags:
+            pluggable_flags_str = ", *, " + ", ".join(
+                [f"{f}=False" for f in pluggable_flags]
+            )
+        else:
+            pluggable_flags_str = ""
+        return (
+            f"use_bytes=False, use_enum=False, use_datetime=False"
+            f"{pluggable_flags_str}"
+        )
+
+    def is_code_generation_option_enabled(self, option: str, cls=None):
+        return option in self.get_config(cls).code_generation_options
+
+    def add_to_dict(self, variant: typing.Optional[str] = None) -> None:
+        self.reset()
+        if variant is None:
+            method_name = "to_dict"
+            self.flags = dict.fromkeys(TO_DICT_FLAGS, False)
+        else:
+            method_name = get_variant_name("to_dict", variant)
+            self.flags = {
+                flag: bit == "1" for flag, bit in zip(TO_DICT_FLAGS, variant)
+            }
+        self.inline_depth = self.get_config().inline_nested_depth
+        self.inline_chain = (self.cls,)
+        if self.load_saved_code(method_name):
+            return
+        if variant is None:
+            self.add_line(
+                f"def to_dict(self, {self.get_to_dict_default_flag_values()}):"
+            )
+        else:
+            self.add_line(f"def {method_name}(self):")
+        with self.indent():
+            if variant is None:
+                flag_names = self.get_to_dict_flag_names()
+                self.add_line(f"if {' or '.join(flag_names)}:")
+                with self.indent():
+                    key = ", ".join(
+                        f"bool({flag})" if flag in flag_names else "False"
+                        for flag in TO_DICT_FLAGS
+                    )
+                    self.add_line(
+                        f"return self.{TO_DICT_VARIANTS}[({key})](self)"
+                    )
+            self.add_line(f"return {self._add_to_dict_body()}")
+        if variant is None:
+            self.add_line("setattr(cls, 'to_dict', to_dict)")
+        else:
+            self.add_line(
+                f"cls.{TO_DICT_VARIANTS}[{variant!r}] = {method_name}"
+            )
+        self.compile()
+        self.save_code(method_name)
+
+    def add_to_dict_many(self, variant: typing.Optional[str] = None) -> None:
+        self.reset()
+        if variant is None:
+            method_name = "to_dict_many"
+            self.flags = dict.fromkeys(TO_DICT_FLAGS, False)
+        else:
+            method_name = get_variant_name("to_dict_many", variant)
+            self.flags = {
+                flag: bit == "1" for flag, bit in zip(TO_DICT_FLAGS, variant)
+            }
+        self.inline_depth = self.get_config().inline_nested_depth
+        self.inline_chain = (self.cls,)
+        if self.load_saved_code(method_name):
+            return
+        if variant is None:
+            flag_values = self.get_to_dict_default_flag_values()
+            if "*" not in flag_values:
+                flag_values += ", *"
+            self.add_line("@classmethod")
+            self.add_line(
+                f"def to_dict_many(cls, objs, {flag_values}, errors=None):"
+            )
+        else:
+            self.add_line(f"def {method_name}(cls, objs, errors=None):")
+        with self.indent():
+            if variant is None:
+                flag_names = self.get_to_dict_flag_names()
+                self.add_line(f"if {' or '.join(flag_names)}:")
+                with self.indent():
+                    key = ", ".join(
+                        f"bool({flag})" if flag in flag_names else "False"
+                        for flag in TO_DICT_FLAGS
+                    )
+                    self.add_line(
+                        f"return cls.{TO_DICT_MANY_VARIANTS}[({key})]"
+                        f"(cls, objs, errors)"
+                    )
+            self.add_line("result = []")
+            self.add_line("for i, self in enumerate(objs):")
+            with self.indent():
+                self.add_line("try:")
+                with self.indent():
+                    # instances of subclasses are dumped by their own code
+                    self.add_line("if type(self) is not cls:")
+                    with self.indent():
+                        bits = get_variant(
+                            self.flags[flag] for flag in TO_DICT_FLAGS
+                        )
+                        if "1" not in bits:
+                            self.add_line("result.append(self.to_dict())")
+                        else:
+                            self.add_line(
+                                f"result.append(self.{TO_DICT_VARIANTS}"
+                                f"[{bits!r}](self))"
+                            )
+                        self.add_line("continue")
+                    self.add_line(f"result.append({self._add_to_dict_body()})")
+                self._add_many_error_handler()
+            self.add_line("return result")
+        if variant is None:
+            self.add_line("setattr(cls, 'to_dict_many', to_dict_many)")
+        else:
+            self.add_line(
+                f"cls.{TO_DICT_MANY_VARIANTS}[{variant!r}] = {method_name}"
+            )
+        self.compile()
+        self.save_code(method_name)
+
+    def _add_to_dict_body(self) -> str:
+        pre_serialize = self.get_declared_hook(__PRE_SERIALIZE__)
+        if pre_serialize:
+            self.add_line(f"self = self.{__PRE_SERIALIZE__}()")
+        if self.get_config().positional_encoding:
+            return self._add_to_list_body()
+        self.add_line("kwargs = {}")
+        for fname, ftype in self.field_types.items():
+            self._add_type_modules(ftype)
+            metadata = self.metadatas.get(fname, {})
+            self._to_dict_set_value(fname, ftype, metadata)
+        post_serialize = self.get_declared_hook(__POST_SERIALIZE__)
+        if post_serialize:
+            return f"self.{__POST_SERIALIZE__}(kwargs)"
+        return "kwargs"
+
+    def get_positional_fingerprints(self) -> typing.Dict[int, int]:
+        # the lists without the trailing fields that have defaults are
+        # accepted as well, so there is a fingerprint for each length
+        fields = [
+            (fname, type_name(ftype))
+            for fname, ftype in self.field_types.items()
+        ]
+        min_length = 0
+        for i, fname in enumerate(self.field_types, 1):
+            if self.defaults[fname] is MISSING:
+                min_length = i
+        return {
+            length + 1: zlib.crc32(repr(fields[:length]).encode())
+            for length in range(min_length, len(fields) + 1)
+        }
+
+    def get_json_object_classes(
+        self,
+    ) -> typing.Optional[
+        typing.List[typing.Tuple[typing.Any, frozenset, frozenset]]
+    ]:
+        """
+        Returns the dataclasses that JSON objects can be turned into as soon
+        as they are decoded along with their required and all keys, or None
+        if JSON objects of other types can be found in the data.
+        """
+        classes: typing.Dict[typing.Any, typing.Tuple[frozenset, frozenset]]
+        classes = {}
+        if not self._collect_json_object_classes(classes, set()):
+            return None
+        # an object is turned into a dataclass only if no other dataclass
+        # would accept its keys, the other objects are left to the parents
+        return [
+            (cls, required, keys)
+            for cls, (required, keys) in classes.items()
+            if not any(
+                other_required <= keys
+                for other_cls, (other_required, _) in classes.items()
+                if other_cls is not cls
+            )
+        ]
+
+    def _collect_json_object_classes(
+        self,
+        classes: typing.Dict[typing.Any, typing.Tuple[frozenset, frozenset]],
+        visited: typing.Set[typing.Any],
+    ) -> bool:
+        visited.add(self.cls)
+        # the hook would get the nested dataclasses instead of dictionaries
+        if self.get_declared_hook(__PRE_DESERIALIZE__):
+            return False
+        config = self.get_config()
+        if not config.positional_encoding:
+            required, keys = set(), set()
+            for fname in self.field_types:
+                alias = self.metadatas.get(fname, {}).get("alias")
+                key = alias or config.aliases.get(fname) or fname
+                keys.add(key)
+                if self.defaults[fname] is MISSING:
+                    required.add(key)
+            classes[self.cls] = (frozenset(required), frozenset(keys))
+        return all(
+            self._has_only_json_object_classes(
+                ftype, self.metadatas.get(fname, {}), classes, visited
+            )
+            for fname, ftype in self.field_types.items()
         )
+
+    def _has_only_json_object_classes(
+        self, t, metadata, classes, visited
+    ) -> bool:
+        # datetime parsing engines are set by strings, they take strings
+        deserialize_option = metadata.get("deserialize")
+        if not isinstance(
+            deserialize_option, str
+        ) and self._has_overridden_value(t, metadata, "deserialize"):
+            return False
+        origin_type = get_type_origin(t)
+        if t is NoneType:
+            return True
+        elif is_special_typing_primitive(origin_type):
+            if not is_union(t):
+                return False
+            args = t.__args__
+            if len(args) == 2 and args[1] is NoneType:
+                return self._has_only_json_object_classes(
+                    args[0], metadata, classes, visited
+                )
+            # the unions are unpacked by trying the arguments in turn,
+            # so only the unions of scalars are allowed
+            return all(
+                arg is NoneType or _is_json_scalar_type(get_type_origin(arg))
+                for arg in args
+            )
+        elif _is_json_scalar_type(origin_type):
+            return True
+        elif issubclass(origin_type, SerializableType):
+            return False
+        elif is_dataclass_dict_mixin_subclass(origin_type):
+            if origin_type in visited:
+                return True
+            return CodeBuilder(origin_type)._collect_json_object_classes(
+                classes, visited
+            )
+        elif issubclass(
+            origin_type, (typing.Mapping, collections.ChainMap)
+        ) or not issubclass(origin_type, typing.Collection):
+            return False
+        return all(
+            self._has_only_json_object_classes(arg, {}, classes, visited)
+            for arg in getattr(t, "__args__", ())
+            if arg is not Ellipsis
+        )
+
+    def _add_to_list_body(self) -> str:
+        fingerprints = self.get_positional_fingerprints()
+        values = [str(fingerprints[len(self.field_types) + 1])]
+        for i, (fname, ftype) in enumerate(self.field_types.items()):
+            self._add_type_modules(ftype)
+            metadata = self.metadatas.get(fname, {})
+            value_name = f"f{i}"
+            self.add_line(f"{value_name} = self.{fname}")
+            packed_value = self._pack_value(
+                fname, ftype, self.cls, value_name, metadata
+            )
+            if packed_value != value_name:
+                self.add_line(f"if {value_name} is not None:")
+                with self.indent():
+                    self.add_line(f"{value_name} = {packed_value}")
+            values.append(value_name)
+        result = f"[{', '.join(values)}]"
+        if self.get_declared_hook(__POST_SERIALIZE__):
+            return f"self.{__POST_SERIALIZE__}({result})"
+        return result
+
+    def _add_from_list_body(self) -> str:
+        fingerprints: typing.Dict[
+            int, typing.Any
+        ] = self.get_positional_fingerprints()
+        if self.flags["str_scalars"]:
+            fingerprints = {n: str(fp) for n, fp in fingerprints.items()}
+        length = len(self.field_types) + 1
+        self.add_line("if not isinstance(d, (list, tuple)):")
+        with self.indent():
+            self.add_line(
+                f"raise ValueError('Argument for "
+                f"{type_name(self.cls)}.from_dict method "
+                f"should be a list instance')"
+            )
+        self.add_line("n = len(d)")
+        self.add_line(f"if n != {length} or d[0] != {fingerprints[length]!r}:")
+        with self.indent():
+            self.add_line(f"if not n or {fingerprints!r}.get(n) != d[0]:")
+            with self.indent():
+                self.add_line(
+                    f"raise ValueError('Fingerprint of the list does not "
+                    f"match the fields of {type_name(self.cls)}')"
+                )
+        self._add_kwargs()
+        min_length = min(fingerprints)
+        for i, (fname, ftype) in enumerate(self.field_types.items(), 1):
+            self._add_type_modules(ftype)
+            metadata = self.metadatas.get(fname, {})
+            if i < min_length:
+                value_expr = f"d[{i}]"
+            else:
+                value_expr = f"d[{i}] if n > {i} else MISSING"
+            self._from_dict_set_value(
+                fname, ftype, metadata, value_expr=value_expr
+            )
+        return self._add_instance()
+
+    def _check_row_hooks(self, method_name: str, *hook_names: str) -> None:
+        for hook_name in hook_names:
+            if self.get_declared_hook(hook_name):
+                raise UnserializableDataError(
+                    f"{type_name(self.cls)}.{method_name} can't be used "
+                    f"because {hook_name} takes a dictionary of a single "
+                    f"object"
+                )
+
+    def add_to_columns(self, variant: typing.Optional[str] = None) -> None:
+        self.reset()
+        self.flags = dict.fromkeys(TO_DICT_FLAGS, False)
+        if variant is None:
+            method_name = "to_columns"
+        else:
+            method_name = get_variant_name("to_columns", variant)
+            self.flags.update(
+                (flag, bit == "1") for flag, bit in zip(TO_DICT_FLAGS, variant)
+            )
+        self.inline_depth = self.get_config().inline_nested_depth
+        self.inline_chain = (self.cls,)
+        if self.load_saved_code(method_name):
+            return
+        self._check_row_hooks("to_columns", __POST_SERIALIZE__)
+        numpy_fields = [
+            fname
+            for fname, ftype in self.field_types.items()
+            if ftype in _NUMPY_DTYPES
+            and not self._has_overridden_value(
+                ftype, self.metadatas.get(fname, {}), "serialize"
+            )
+        ]
+        if variant is None:
+            self.add_line("@classmethod")
+            self.add_line(
+                "def to_columns(cls, objs, use_bytes=False, use_enum=False, "
+                "use_datetime=False, use_numpy=False):"
+            )
+        else:
+            self.add_line(f"def {method_name}(cls, objs, use_numpy=False):")
         with self.indent():
-            pre_deserialize = self.get_declared_hook(__PRE_DESERIALIZE__)
-            if pre_deserialize:
-                if not isinstance(pre_deserialize, classmethod):
-                    raise BadHookSignature(
-                        f"`{__PRE_DESERIALIZE__}` must be a class method with "
-                        f"Callable[[Dict[Any, Any]], Dict[Any, Any]] signature"
+            if variant is None:
+                self.add_line("if use_bytes or use_enum or use_datetime:")
+                with self.indent():
+                    self.add_line(
+                        f"return cls.{TO_COLUMNS_VARIANTS}[(bool(use_bytes), "
+                        f"bool(use_enum), bool(use_datetime))]"
+                        f"(cls, objs, use_numpy)"
                     )
+            if numpy_fields:
+                self.add_line("if use_numpy and numpy is None:")
+                with self.indent():
+                    self.add_line(
+                        f"raise ThirdPartyModuleNotFoundError("
+                        f"'numpy','{numpy_fields[0]}',cls)"
+                    )
+            if self.get_declared_hook(__PRE_SERIALIZE__):
+                self.add_line(
+                    f"objs = [self.{__PRE_SERIALIZE__}() for self in objs]"
+                )
+            else:
+                self.add_line("if type(objs) is not list:")
+                with self.indent():
+                    self.add_line("objs = list(objs)")
+            self.add_line("columns = {}")
+            for fname, ftype in self.field_types.items():
+                self._add_type_modules(ftype)
+                metadata = self.metadatas.get(fname, {})
+                key = self._get_to_dict_key(fname, metadata)
+                packed_value = self._pack_value(
+                    fname=fname,
+                    ftype=ftype,
+                    parent=self.cls,
+                    metadata=metadata,
+                )
+                if packed_value == "value":
+                    column = f"[self.{fname} for self in objs]"
                 else:
-                    self.add_line(f"d = cls.{__PRE_DESERIALIZE__}(d)")
+                    column = (
+                        f"[value if value is None else {packed_value} "
+                        f"for self in objs for value in (self.{fname},)]"
+                    )
+                if fname in numpy_fields:
+                    numpy_column = (
+                        f"numpy.array([self.{fname} for self in objs], "
+                        f"dtype='{_NUMPY_DTYPES[ftype]}')"
+                    )
+                    if ftype is datetime.datetime:
+                        # NumPy converts aware datetime objects to naive UTC
+                        self.add_line(
+                            f"if use_numpy and not any(getattr(self.{fname}, "
+                            f"'tzinfo', None) is not None for self in objs):"
+                        )
+                    else:
+                        self.add_line("if use_numpy:")
+                    with self.indent():
+                        self.add_line(f"columns['{key}'] = {numpy_column}")
+                    self.add_line("else:")
+                    with self.indent():
+                        self.add_line(f"columns['{key}'] = {column}")
+                else:
+                    self.add_line(f"columns['{key}'] = {column}")
+            self.add_line("return columns")
+        if variant is None:
+            self.add_line("setattr(cls, 'to_columns', to_columns)")
+        else:
+            self.add_line(
+                f"cls.{TO_COLUMNS_VARIANTS}[{variant!r}] = {method_name}"
+            )
+        self.compile()
+        self.save_code(method_name)
+
+    def add_from_columns(self, variant: typing.Optional[str] = None) -> None:
+        config = self.get_config()
+        self.reset()
+        if variant is None:
+            method_name = "from_columns"
+            self.flags = dict.fromkeys(FROM_DICT_FLAGS, False)
+        else:
+            method_name = get_variant_name("from_columns", variant)
+            self.flags = {
+                flag: bit == "1" for flag, bit in zip(FROM_DICT_FLAGS, variant)
+            }
+        self.inline_depth = config.inline_nested_depth
+        self.inline_chain = (self.cls,)
+        if self.load_saved_code(method_name):
+            return
+        self._check_row_hooks("from_columns", __PRE_DESERIALIZE__)
+        if variant is None:
+            self.add_line("@classmethod")
+            self.add_line(
+                "def from_columns(cls, columns, use_bytes=False, "
+                "use_enum=False, use_datetime=False):"
+            )
+        else:
+            self.add_line(f"def {method_name}(cls, columns):")
+        with self.indent():
+            if variant is None:
+                self.add_line("if use_bytes or use_enum or use_datetime:")
+                with self.indent():
+                    self.add_line(
+                        f"return cls.{FROM_COLUMNS_VARIANTS}"
+                        f"[(bool(use_bytes), bool(use_enum), "
+                        f"bool(use_datetime), False, False, False, False)]"
+                        f"(cls, columns)"
+                    )
+            self.add_line("lengths = set()")
+            for i, (fname, ftype) in enumerate(self.field_types.items()):
+                self._add_type_modules(ftype)
+                metadata = self.metadatas.get(fname, {})
+                alias = metadata.get("alias")
+                if alias is None:
+                    alias = config.aliases.get(fname)
+                self._from_columns_set_value(
+                    f"c{i}", fname, ftype, metadata, alias
+                )
+            self.add_line("if not lengths:")
+            with self.indent():
+                self.add_line("return []")
+            self.add_line("if len(lengths) > 1:")
+            with self.indent():
+                self.add_line(
+                    f"raise ValueError('Columns for "
+                    f"{type_name(self.cls)}.from_columns method "
+                    f"should have the same length')"
+                )
+            kwargs = ", ".join(
+                f"{fname}=v{i}" for i, fname in enumerate(self.field_types)
+            )
+            obj = f"cls({kwargs})"
+            if self.get_declared_hook(__POST_DESERIALIZE__):
+                obj = f"cls.{__POST_DESERIALIZE__}({obj})"
+            targets = "".join(f"v{i}, " for i in range(len(self.field_types)))
+            columns = ", ".join(f"c{i}" for i in range(len(self.field_types)))
+            self.add_line(f"return [{obj} for {targets}in zip({columns})]")
+        if variant is None:
+            self.add_line("setattr(cls, 'from_columns', from_columns)")
+        else:
+            self.add_line(
+                f"cls.{FROM_COLUMNS_VARIANTS}[{variant!r}] = {method_name}"
+            )
+        self.compile()
+        self.save_code(method_name)
+
+    def _from_columns_set_value(self, name, fname, ftype, metadata, alias):
+        self.add_line(f"column = columns.get('{alias or fname}', MISSING)")
+        self.add_line("if column is MISSING:")
+        with self.indent():
+            field = f"cls.{_FIELDS}['{fname}']"
+            if self.defaults[fname] is MISSING:
+                self.add_line(
+                    f"raise MissingField('{fname}',{type_name(ftype)},cls)"
+                )
+            elif self.dataclass_fields[fname].default is MISSING:
+                self.add_line(
+                    f"{name} = iter({field}.default_factory, MISSING)"
+                )
+            else:
+                self.add_line(f"{name} = repeat({field}.default)")
+        self.add_line("else:")
+        with self.indent():
+            unpacked_value = self._unpack_field_value(
+                fname=fname,
+                ftype=ftype,
+                parent=self.cls,
+                metadata=metadata,
+            )
+            is_datetime = ftype in (
+                datetime.datetime,
+                datetime.date,
+            ) and not self._has_overridden_value(
+                ftype, metadata, "deserialize"
+            )
+            # NumPy arrays are converted to lists of Python objects
+            self.add_line(
+                "if type(column) is not list and hasattr(column, 'tolist'):"
+            )
+            with self.indent():
+                if is_datetime:
+                    self.add_line("if column.dtype.kind == 'M':")
+                    with self.indent():
+                        self.add_line(
+                            f"column = column.astype("
+                            f"'{_NUMPY_DTYPES[ftype]}').tolist()"
+                        )
+                    self.add_line("else:")
+                    with self.indent():
+                        self.add_line("column = column.tolist()")
+                else:
+                    self.add_line("column = column.tolist()")
+            self.add_line("lengths.add(len(column))")
+            if unpacked_value == "value":
+                self.add_line(f"{name} = column")
+                return
+            expr = f"value if value is None else {unpacked_value}"
+            if is_datetime:
+                # datetime objects from NumPy arrays are already loaded
+                expr = (
+                    f"value if value is None or type(value) is "
+                    f"{type_name(ftype)} else {unpacked_value}"
+                )
             self.add_line("try:")
             with self.indent():
-                self.add_line("kwargs = {}")
-                for fname, ftype in self.field_types.items():
-                    self._add_type_modules(ftype)
-                    metadata = self.metadatas.get(fname, {})
-                    alias = metadata.get("alias")
-                    if alias is None:
-                        alias = config.aliases.get(fname)
-                    self._from_dict_set_value(fname, ftype, metadata, alias)
-            self.add_line("except AttributeError:")
+                self.add_line(f"{name} = [{expr} for value in column]")
+            self.add_line("except Exception:")
             with self.indent():
-                self.add_line("if not isinstance(d, dict):")
+                # find the value that can't be loaded to report it
+                self.add_line("for value in column:")
                 with self.indent():
-                    self.add_line(
-                        f"raise ValueError('Argument for "
-                        f"{type_name(self.cls)}.from_dict method "
-                        f"should be a dict instance') from None"
-                    )
-                self.add_line("else:")
-                with self.indent():
-                    self.add_line("raise")
-            post_deserialize = self.get_declared_hook(__POST_DESERIALIZE__)
-            if post_deserialize:
-                if not isinstance(post_deserialize, classmethod):
-                    raise BadHookSignature(
-                        f"`{__POST_DESERIALIZE__}` must be a class method "
-                        f"with Callable[[{type_name(self.cls)}], "
-                        f"{type_name(self.cls)}] signature"
-                    )
-                else:
-                    self.add_line(
-                        f"return cls.{__POST_DESERIALIZE__}(cls(**kwargs))"
-                    )
+                    self.add_line("try:")
+                    with self.indent():
+                        self.add_line(expr)
+                    self.add_line("except Exception:")
+                    with self.indent():
+                        self.add_line(
+                            f"raise InvalidFieldValue('{fname}',"
+                            f"{type_name(ftype)},value,cls) from None"
+                        )
+                self.add_line("raise")
+
+    def add_to_json(self) -> None:
+        config = self.get_config()
+        self.reset()
+        self.flags = dict.fromkeys(TO_DICT_FLAGS, False)
+        self.inline_depth = config.inline_nested_depth
+        self.inline_chain = (self.cls,)
+        if self.load_saved_code("to_json"):
+            return
+        self.ensure_module_imported(json)
+        self.add_line(f"def {TO_JSON}(self):")
+        with self.indent():
+            if (
+                self.get_declared_hook(__POST_SERIALIZE__)
+                or config.positional_encoding
+            ):
+                # the hook takes the dictionary, so it has to be built
+                self.add_line("return json.dumps(self.to_dict())")
             else:
-                self.add_line("return cls(**kwargs)")
-        self.add_line("setattr(cls, 'from_dict', from_dict)")
+                self._add_to_json_body()
+        self.add_line(f"setattr(cls, '{TO_JSON}', {TO_JSON})")
         self.compile()
+        self.save_code("to_json")
 
-    def _from_dict_set_value(self, fname, ftype, metadata, alias=None):
-        self.add_line(f"value = d.get('{alias or fname}', MISSING)")
-        self.add_line("if value is None:")
-        with self.indent():
-            self.add_line(f"kwargs['{fname}'] = None")
-        if self.defaults[fname] is MISSING:
-            self.add_line("elif value is MISSING:")
-            with self.indent():
-                self.add_line(
-                    f"raise MissingField('{fname}'," f"{type_name(ftype)},cls)"
-                )
-            self.add_line("else:")
-            with self.indent():
-                unpacked_value = self._unpack_field_value(
-                    fname=fname,
-                    ftype=ftype,
-                    parent=self.cls,
-                    metadata=metadata,
-                )
-                self.add_line("try:")
-                with self.indent():
-                    self.add_line(f"kwargs['{fname}'] = {unpacked_value}")
-                self.add_line("except Exception as e:")
-                with self.indent():
-                    field_type = type_name(ftype)
-                    self.add_line(
-                        f"raise InvalidFieldValue('{fname}',"
-                        f"{field_type},value,cls)"
-                    )
+    def _add_to_json_body(self) -> None:
+        if self.get_declared_hook(__PRE_SERIALIZE__):
+            self.add_line(f"self = self.{__PRE_SERIALIZE__}()")
+        parts = []
+        prefix = "{"
+        for i, (fname, ftype) in enumerate(self.field_types.items()):
+            self._add_type_modules(ftype)
+            metadata = self.metadatas.get(fname, {})
+            key = self._get_to_dict_key(fname, metadata)
+            if is_union(ftype):
+                args = ftype.__args__
+                if len(args) == 2 and args[1] == NoneType:
+                    ftype = args[0]
+            fragment = self._get_json_fragment(fname, ftype, f"f{i}", metadata)
+            self.add_line(f"f{i} = self.{fname}")
+            # the field names are escaped once here
+            parts.append(repr(f"{prefix}{json.dumps(key)}: "))
+            parts.append(f"('null' if f{i} is None else {fragment})")
+            prefix = ", "
+        if parts:
+            parts.append(repr("}"))
+            self.add_line(f"return ''.join(({', '.join(parts)}))")
         else:
-            self.add_line("elif value is not MISSING:")
-            with self.indent():
-                unpacked_value = self._unpack_field_value(
-                    fname=fname,
-                    ftype=ftype,
-                    parent=self.cls,
-                    metadata=metadata,
-                )
-                self.add_line("try:")
-                with self.indent():
-                    self.add_line(f"kwargs['{fname}'] = {unpacked_value}")
-                self.add_line("except Exception as e:")
-                with self.indent():
-                    field_type = type_name(ftype)
-                    self.add_line(
-                        f"raise InvalidFieldValue('{fname}',"
-                        f"{field_type},value,cls)"
-                    )
+            self.add_line("return '{}'")
 
-    def get_config(self, cls=None) -> typing.Type[BaseConfig]:
-        if cls is None:
-            cls = self.cls
-        config_cls = getattr(cls, "Config", BaseConfig)
-        if not issubclass(config_cls, BaseConfig):
-            config_cls = type(
-                "Config",
-                (BaseConfig, config_cls),
-                {**BaseConfig.__dict__, **config_cls.__dict__},
+    def _get_json_fragment(
+        self,
+        fname,
+        ftype,
+        value_name,
+        metadata=MappingProxyType({}),
+        depth=0,
+    ) -> str:
+        fragment = self._get_direct_json_fragment(
+            fname, ftype, value_name, metadata, depth
+        )
+        if fragment is None:
+            packed_value = self._pack_value(
+                fname, ftype, self.cls, value_name, metadata
             )
-        return config_cls
+            return f"json.dumps({packed_value})"
+        return fragment
 
-    def get_to_dict_flags(self, cls=None) -> str:
-        config = self.get_config(cls)
-        code_generation_options = config.code_generation_options
-        parent_config = self.get_config()
-        parent_code_generation_options = parent_config.code_generation_options
-        pluggable_flags = []
-        for option, flag in (
-            (TO_DICT_ADD_OMIT_NONE_FLAG, "omit_none"),
-            (TO_DICT_ADD_BY_ALIAS_FLAG, "by_alias"),
+    def _get_direct_json_fragment(
+        self, fname, ftype, value_name, metadata, depth
+    ) -> typing.Optional[str]:
+        if self._has_overridden_value(ftype, metadata, "serialize"):
+            return None
+        with suppress(TypeError):
+            if issubclass(ftype, SerializableType):
+                return None
+        origin_type = get_type_origin(ftype)
+        if is_union(ftype):
+            args = ftype.__args__
+            if len(args) == 2 and args[1] == NoneType:
+                fragment = self._get_json_fragment(
+                    fname, args[0], value_name, depth=depth
+                )
+                return f"('null' if {value_name} is None else {fragment})"
+            return None
+        elif is_special_typing_primitive(origin_type):
+            return None
+        elif origin_type is int:
+            return f"str(int({value_name}))"
+        elif origin_type is float:
+            return f"dump_float({value_name})"
+        elif origin_type is bool:
+            return (
+                f"('true' if {value_name} is True else 'false' "
+                f"if {value_name} is False else json.dumps({value_name}))"
+            )
+        elif origin_type in (
+            datetime.datetime,
+            datetime.date,
+            datetime.time,
+            uuid.UUID,
+            Decimal,
         ):
-            if option in code_generation_options:
-                if option in parent_code_generation_options:
-                    pluggable_flags.append(f"{flag}={flag}")
-        return ",".join(
-            ["use_bytes", "use_enum", "use_datetime", *pluggable_flags]
-        )
-
-    def get_to_dict_default_flag_values(self, cls=None) -> str:
-        pluggable_flags = []
-        omit_none_feature = (
-            TO_DICT_ADD_OMIT_NONE_FLAG
-            in self.get_config(cls).code_generation_options
-        )
-        if omit_none_feature:
-            pluggable_flags.append("omit_none")
-        by_alias_feature = (
-            TO_DICT_ADD_BY_ALIAS_FLAG
-            in self.get_config().code_generation_options
-        )
-        if by_alias_feature:
-            pluggable_flags.append("by_alias")
-        if pluggable_flags:
-            pluggable_flags_str = ", *, " + ", ".join(
-                [f"{f}=False" for f in pluggable_flags]
+            packed_value = self._pack_value(fname, ftype, self.cls, value_name)
+            return f"encode_basestring_ascii({packed_value})"
+        elif issubclass(origin_type, enum.Enum):
+            value_types = {type(member.value) for member in origin_type}
+            if value_types == {str}:
+                return f"encode_basestring_ascii({value_name}.value)"
+            elif value_types == {int}:
+                return f"str({value_name}.value)"
+            return None
+        elif issubclass(origin_type, str):
+            return (
+                f"(encode_basestring_ascii({value_name}) "
+                f"if type({value_name}) is str else json.dumps({value_name}))"
             )
-        else:
-            pluggable_flags_str = ""
-        return (
-            f"use_bytes=False, use_enum=False, use_datetime=False"
-            f"{pluggable_flags_str}"
-        )
-
-    def is_code_generation_option_enabled(self, option: str, cls=None):
-        return option in self.get_config(cls).code_generation_options
-
-    def add_to_dict(self) -> None:
-        self.reset()
-        self.add_line(
-            f"def to_dict(self, {self.get_to_dict_default_flag_values()}):"
-        )
-        with self.indent():
-            pre_serialize = self.get_declared_hook(__PRE_SERIALIZE__)
-            if pre_serialize:
-                self.add_line(f"self = self.{__PRE_SERIALIZE__}()")
-            self.add_line("kwargs = {}")
-            for fname, ftype in self.field_types.items():
-                metadata = self.metadatas.get(fname, {})
-                self._to_dict_set_value(fname, ftype, metadata)
-            post_serialize = self.get_declared_hook(__POST_SERIALIZE__)
-            if post_serialize:
-                self.add_line(f"return self.{__POST_SERIALIZE__}(kwargs)")
-            else:
-                self.add_line("return kwargs")
-        self.add_line("setattr(cls, 'to_dict', to_dict)")
-        self.compile()
+        elif isinstance(ftype, type) and is_dataclass_dict_mixin_subclass(
+            ftype
+        ):
+            if getattr(ftype, TO_JSON, None) is None:
+                return None
+            packed_value = self._pack_value(fname, ftype, self.cls, value_name)
+            # the value can be an instance of a subclass with more fields
+            return (
+                f"({value_name}.{TO_JSON}() if type({value_name}) is "
+                f"{type_name(ftype)} else json.dumps({packed_value}))"
+            )
+        elif (
+            not is_generic(ftype)
+            or issubclass(origin_type, typing.ByteString)  # type: ignore
+            or issubclass(origin_type, collections.ChainMap)
+        ):
+            return None
+        args = ftype.__args__
+        item_name = f"v{depth}"
+        if issubclass(
+            origin_type, (typing.List, typing.Deque, typing.AbstractSet)
+        ) or (
+            issubclass(origin_type, typing.Tuple)  # type: ignore
+            and len(args) == 2
+            and args[1] is Ellipsis
+        ):
+            item = self._get_json_fragment(
+                fname, args[0], item_name, depth=depth + 1
+            )
+            return (
+                f"('[' + ', '.join([{item} for {item_name} in {value_name}])"
+                f" + ']')"
+            )
+        elif issubclass(origin_type, typing.Mapping) and args[0] is str:
+            key_name = f"k{depth}"
+            item = self._get_json_fragment(
+                fname, args[1], item_name, depth=depth + 1
+            )
+            return (
+                f"('{{' + ', '.join([encode_basestring_ascii({key_name}) "
+                f"+ ': ' + {item} for {key_name}, {item_name} "
+                f"in {value_name}.items()]) + '}}')"
+            )
+        return None
 
-    def _to_dict_set_value(self, fname, ftype, metadata):
-        omit_none_feature = self.is_code_generation_option_enabled(
-            TO_DICT_ADD_OMIT_NONE_FLAG
-        )
-        by_alias_feature = self.is_code_generation_option_enabled(
-            TO_DICT_ADD_BY_ALIAS_FLAG
-        )
+    def _get_to_dict_key(self, fname, metadata) -> str:
         config = self.get_config()
         alias = metadata.get("alias")
         if alias is None:
             alias = config.aliases.get(fname)
-        serialize_by_alias = self.get_config().serialize_by_alias
-        if serialize_by_alias and alias is not None:
-            fname_or_alias = alias
+        if alias is None:
+            return fname
+        elif self.is_code_generation_option_enabled(TO_DICT_ADD_BY_ALIAS_FLAG):
+            return alias if self.flags["by_alias"] else fname
+        elif config.serialize_by_alias:
+            return alias
         else:
-            fname_or_alias = fname
+            return fname
 
+    def _to_dict_set_value(self, fname, ftype, metadata):
+        key = self._get_to_dict_key(fname, metadata)
         self.add_line(f"value = getattr(self, '{fname}')")
-        self.add_line("if value is None:")
-        with self.indent():
-            if omit_none_feature:
-                self.add_line("if not omit_none:")
-                with self.indent():
-                    if by_alias_feature and alias is not None:
-                        self.add_line("if by_alias:")
-                        with self.indent():
-                            self.add_line(f"kwargs['{alias}'] = None")
-                        self.add_line("else:")
-                        with self.indent():
-                            self.add_line(f"kwargs['{fname}'] = None")
-                    else:
-                        self.add_line(f"kwargs['{fname_or_alias}'] = None")
-            else:
-                if by_alias_feature and alias is not None:
-                    self.add_line("if by_alias:")
-                    with self.indent():
-                        self.add_line(f"kwargs['{alias}'] = None")
-                    self.add_line("else:")
-                    with self.indent():
-                        self.add_line(f"kwargs['{fname}'] = None")
-                else:
-                    self.add_line(f"kwargs['{fname_or_alias}'] = None")
-        self.add_line("else:")
+        if self.flags["omit_none"]:
+            self.add_line("if value is not None:")
+        else:
+            self.add_line("if value is None:")
+            with self.indent():
+                self.add_line(f"kwargs['{key}'] = None")
+            self.add_line("else:")
         with self.indent():
             packed_value = self._pack_value(
                 fname=fname,
@@ -441,15 +1867,7 @@ class CodeBuilder:
                 parent=self.cls,
                 metadata=metadata,
             )
-            if by_alias_feature and alias is not None:
-                self.add_line("if by_alias:")
-                with self.indent():
-                    self.add_line(f"kwargs['{alias}'] = {packed_value}")
-                self.add_line("else:")
-                with self.indent():
-                    self.add_line(f"kwargs['{fname}'] = {packed_value}")
-            else:
-                self.add_line(f"kwargs['{fname_or_alias}'] = {packed_value}")
+            self.add_line(f"kwargs['{key}'] = {packed_value}")
 
     def _pack_value(
         self,
@@ -492,16 +1910,13 @@ class CodeBuilder:
                 args = getattr(ftype, "__args__", ())
                 if len(args) == 2 and args[1] == NoneType:  # it is Optional
                     return self._pack_value(
-                        fname, args[0], parent, metadata=metadata
+                        fname, args[0], parent, value_name, metadata
                     )
                 else:
                     method_name = self._add_pack_union(
                         fname, ftype, args, parent, metadata
                     )
-                    return (
-                        f"self.{method_name}({value_name},"
-                        f"{self.get_to_dict_flags()})"
-                    )
+                    return f"self.{method_name}({value_name})"
             elif origin_type is typing.AnyStr:
                 raise UnserializableDataError(
                     "AnyStr is not supported by mashumaro"
@@ -521,16 +1936,18 @@ class CodeBuilder:
         elif origin_type in (bool, NoneType):
             return overridden or value_name
         elif origin_type in (datetime.datetime, datetime.date, datetime.time):
-            if overridden:
-                return f"{value_name} if use_datetime else {overridden}"
-            return (
-                f"{value_name} if use_datetime else {value_name}.isoformat()"
-            )
+            if self.flags["use_datetime"]:
+                return value_name
+            elif self._is_native_value("native_datetime", ftype, metadata):
+                return value_name
+            return overridden or f"{value_name}.isoformat()"
         elif origin_type is datetime.timedelta:
             return overridden or f"{value_name}.total_seconds()"
         elif origin_type is datetime.timezone:
             return overridden or f"{value_name}.tzname(None)"
         elif origin_type is uuid.UUID:
+            if self._is_native_value("native_uuid", ftype, metadata):
+                return value_name
             return overridden or f"str({value_name})"
         elif origin_type in [
             ipaddress.IPv4Address,
@@ -542,8 +1959,12 @@ class CodeBuilder:
         ]:
             return overridden or f"str({value_name})"
         elif origin_type is Decimal:
+            if self._is_native_value("native_decimal", ftype, metadata):
+                return value_name
             return overridden or f"str({value_name})"
         elif origin_type is Fraction:
+            if self._is_native_value("native_fraction", ftype, metadata):
+                return value_name
             return overridden or f"str({value_name})"
         elif issubclass(origin_type, typing.Collection) and not issubclass(
             origin_type, enum.Enum
@@ -551,7 +1972,13 @@ class CodeBuilder:
             args = getattr(ftype, "__args__", ())
 
             def inner_expr(arg_num=0, v_name="value", v_type=None):
-                if v_type:
+                if v_name == "key":
+                    # the encoders may convert keys to strings differently
+                    with self.native_flags_disabled():
+                        return self._pack_value(
+                            fname, v_type or args[arg_num], parent, v_name
+                        )
+                elif v_type:
                     return self._pack_value(fname, v_type, parent, v_name)
                 else:
                     return self._pack_value(
@@ -559,10 +1986,9 @@ class CodeBuilder:
                     )
 
             if issubclass(origin_type, typing.ByteString):
-                specific = f"encodebytes({value_name}).decode()"
-                return (
-                    f"{value_name} if use_bytes else {overridden or specific}"
-                )
+                if self.flags["use_bytes"]:
+                    return value_name
+                return overridden or f"encodebytes({value_name}).decode()"
             elif issubclass(origin_type, str):
                 return overridden or value_name
             elif issubclass(
@@ -613,7 +2039,7 @@ class CodeBuilder:
                             overridden
                             or f'[{{{inner_expr(0,"key")}:{inner_expr(1)} '
                             f"for key,value in m.items()}} "
-                            f"for m in value.maps]"
+                            f"for m in {value_name}.maps]"
                         )
             elif PY_37_MIN and issubclass(origin_type, typing.OrderedDict):
                 if ftype is collections.OrderedDict:
@@ -685,11 +2111,33 @@ class CodeBuilder:
         elif issubclass(origin_type, os.PathLike):
             return overridden or f"{value_name}.__fspath__()"
         elif issubclass(origin_type, enum.Enum):
-            specific = f"{value_name}.value"
-            return f"{value_name} if use_enum else {overridden or specific}"
+            if self.flags["use_enum"]:
+                return value_name
+            elif self._is_native_value("native_enum", ftype, metadata):
+                return value_name
+            return overridden or f"{value_name}.value"
         elif is_dataclass_dict_mixin_subclass(ftype):
-            flags = self.get_to_dict_flags(ftype)
-            return overridden or f"{value_name}.to_dict({flags})"
+            if overridden:
+                return overridden
+            variant = self.get_to_dict_variant(ftype)
+            if "1" not in variant:
+                call = f"{value_name}.to_dict()"
+            else:
+                call = (
+                    f"{value_name}.{TO_DICT_VARIANTS}[{variant!r}]"
+                    f"({value_name})"
+                )
+            flags = dict(zip(TO_DICT_FLAGS, (b == "1" for b in variant)))
+            builder = None
+            if not flags["omit_none"]:
+                builder = self._get_inline_builder(ftype, "to_dict", flags)
+            if builder is None:
+                return call
+            # the value can be an instance of a subclass with more fields
+            return (
+                f"({builder._get_inline_to_dict(value_name)} "
+                f"if type({value_name}) is {type_name(ftype)} else {call})"
+            )
         elif overridden:
             return overridden
 
@@ -735,16 +2183,13 @@ class CodeBuilder:
                 args = getattr(ftype, "__args__", ())
                 if len(args) == 2 and args[1] == NoneType:  # it is Optional
                     return self._unpack_field_value(
-                        fname, args[0], parent, metadata=metadata
+                        fname, args[0], parent, value_name, metadata
                     )
                 else:
                     method_name = self._add_unpack_union(
                         fname, ftype, args, parent, metadata
                     )
-                    return (
-                        f"cls.{method_name}({value_name},"
-                        f"use_bytes,use_enum,use_datetime)"
-                    )
+                    return f"cls.{method_name}({value_name})"
             elif origin_type is typing.AnyStr:
                 raise UnserializableDataError(
                     "AnyStr is not supported by mashumaro"
@@ -757,15 +2202,25 @@ class CodeBuilder:
                 raise UnserializableDataError(
                     f"{ftype} as a field type is not supported by mashumaro"
                 )
+        elif origin_type in (int, float) and self.flags["trusted"]:
+            return overridden or value_name
         elif origin_type is int:
+            if self.flags["str_scalars"]:
+                return overridden or f"parse_int_string({value_name})"
             return overridden or f"int({value_name})"
         elif origin_type is float:
+            if self.flags["str_scalars"]:
+                return overridden or f"parse_float_string({value_name})"
             return overridden or f"float({value_name})"
+        elif origin_type is bool and self.flags["str_scalars"]:
+            return overridden or f"parse_bool_string({value_name})"
         elif origin_type in (bool, NoneType):
             return overridden or value_name
         elif origin_type in (datetime.datetime, datetime.date, datetime.time):
-            if overridden:
-                return f"{value_name} if use_datetime else {overridden}"
+            if self.flags["use_datetime"]:
+                return value_name
+            elif overridden:
+                return overridden
             elif deserialize_option is not None:
                 if deserialize_option == "ciso8601":
                     if ciso8601:
@@ -796,21 +2251,23 @@ class CodeBuilder:
                     suffix = ".date()"
                 elif origin_type is datetime.time:
                     suffix = ".time()"
-                return (
-                    f"{value_name} if use_datetime else "
-                    f"{datetime_parser}({value_name}){suffix}"
+                expr = f"{datetime_parser}({value_name}){suffix}"
+            else:
+                expr = (
+                    f"datetime.{origin_type.__name__}."
+                    f"fromisoformat({value_name})"
                 )
-            return (
-                f"{value_name} if use_datetime else "
-                f"datetime.{origin_type.__name__}."
-                f"fromisoformat({value_name})"
-            )
+            return self._unpack_native_value(origin_type, value_name, expr)
         elif origin_type is datetime.timedelta:
+            if self.flags["str_scalars"]:
+                value_name = f"parse_float_string({value_name})"
             return overridden or f"datetime.timedelta(seconds={value_name})"
         elif origin_type is datetime.timezone:
             return overridden or f"parse_timezone({value_name})"
         elif origin_type is uuid.UUID:
-            return overridden or f"uuid.UUID({value_name})"
+            return overridden or self._unpack_native_value(
+                origin_type, value_name, f"uuid.UUID({value_name})"
+            )
         elif origin_type is ipaddress.IPv4Address:
             return overridden or f"ipaddress.IPv4Address({value_name})"
         elif origin_type is ipaddress.IPv6Address:
@@ -824,14 +2281,25 @@ class CodeBuilder:
         elif origin_type is ipaddress.IPv6Interface:
             return overridden or f"ipaddress.IPv6Interface({value_name})"
         elif origin_type is Decimal:
-            return overridden or f"Decimal({value_name})"
+            return overridden or self._unpack_native_value(
+                origin_type, value_name, f"Decimal({value_name})"
+            )
         elif origin_type is Fraction:
-            return overridden or f"Fraction({value_name})"
+            return overridden or self._unpack_native_value(
+                origin_type, value_name, f"Fraction({value_name})"
+            )
         elif issubclass(origin_type, typing.Collection) and not issubclass(
             origin_type, enum.Enum
         ):
             args = getattr(ftype, "__args__", ())
 
+            # discriminator is also applied to unions in collections
+            item_metadata = {
+                key: metadata[key]
+                for key in ("discriminator",)
+                if metadata.get(key)
+            }
+
             def inner_expr(arg_num=0, v_name="value", v_type=None):
                 if v_type:
                     return self._unpack_field_value(
@@ -839,35 +2307,29 @@ class CodeBuilder:
                     )
                 else:
                     return self._unpack_field_value(
-                        fname, args[arg_num], parent, v_name
+                        fname, args[arg_num], parent, v_name, item_metadata
                     )
 
             if issubclass(origin_type, typing.ByteString):
                 if origin_type is bytes:
-                    specific = f"decodebytes({value_name}.encode())"
-                    return (
-                        f"{value_name} if use_bytes else "
-                        f"{overridden or specific}"
-                    )
+                    if self.flags["use_bytes"]:
+                        return value_name
+                    return overridden or f"decodebytes({value_name}.encode())"
                 elif origin_type is bytearray:
-                    if overridden:
-                        overridden = (
-                            f"bytearray({value_name}) if use_bytes else "
-                            f"{overridden}"
-                        )
-                    specific = (
-                        f"bytearray({value_name} if use_bytes else "
-                        f"decodebytes({value_name}.encode()))"
+                    if self.flags["use_bytes"]:
+                        return f"bytearray({value_name})"
+                    return (
+                        overridden
+                        or f"bytearray(decodebytes({value_name}.encode()))"
                     )
-                    return overridden or specific
             elif issubclass(origin_type, str):
                 return overridden or value_name
             elif issubclass(origin_type, typing.List):
                 if is_generic(ftype):
-                    return (
-                        overridden
-                        or f"[{inner_expr()} for value in {value_name}]"
-                    )
+                    expr = inner_expr()
+                    if self.flags["trusted"] and expr == "value":
+                        return overridden or value_name
+                    return overridden or f"[{expr} for value in {value_name}]"
                 elif ftype is list:
                     raise UnserializableField(
                         fname, ftype, parent, "Use typing.List[T] instead"
@@ -993,18 +2455,25 @@ class CodeBuilder:
                             "Mappings with dataclasses as keys "
                             "are not supported by mashumaro"
                         )
-                    else:
-                        return (
-                            overridden
-                            or f'{{{inner_expr(0,"key")}: {inner_expr(1)} '
-                            f"for key, value in {value_name}.items()}}"
-                        )
-            elif issubclass(origin_type, typing.Sequence):
-                if is_generic(ftype):
+                    key_expr = inner_expr(0, "key")
+                    value_expr = inner_expr(1)
+                    if (
+                        self.flags["trusted"]
+                        and key_expr == "key"
+                        and value_expr == "value"
+                    ):
+                        return overridden or value_name
                     return (
                         overridden
-                        or f"[{inner_expr()} for value in {value_name}]"
+                        or f"{{{key_expr}: {value_expr} "
+                        f"for key, value in {value_name}.items()}}"
                     )
+            elif issubclass(origin_type, typing.Sequence):
+                if is_generic(ftype):
+                    expr = inner_expr()
+                    if self.flags["trusted"] and expr == "value":
+                        return overridden or value_name
+                    return overridden or f"[{expr} for value in {value_name}]"
         elif issubclass(origin_type, os.PathLike):
             if overridden:
                 return overridden
@@ -1025,73 +2494,421 @@ class CodeBuilder:
             else:
                 return f"{type_name(origin_type)}({value_name})"
         elif issubclass(origin_type, enum.Enum):
-            specific = f"{type_name(origin_type)}({value_name})"
-            return f"{value_name} if use_enum else {overridden or specific}"
+            if self.flags["use_enum"]:
+                return value_name
+            elif overridden:
+                return overridden
+            enum_type = type_name(origin_type)
+            if self.flags["str_scalars"]:
+                value_type = _get_enum_value_type(origin_type)
+                if value_type is int:
+                    return f"{enum_type}(parse_int_string({value_name}))"
+                elif value_type is float:
+                    return f"{enum_type}(parse_float_string({value_name}))"
+            if not _has_hashable_values(origin_type):
+                return f"{enum_type}({value_name})"
+            # the map is checked first by the constructor as well, so
+            # the constructor is only called for the values it misses
+            return (
+                f"({enum_type}._value2member_map_.get({value_name})"
+                f" or {enum_type}({value_name}))"
+            )
         elif is_dataclass_dict_mixin_subclass(ftype):
-            return overridden or (
-                f"{type_name(ftype)}.from_dict({value_name}, "
-                f"use_bytes, use_enum, use_datetime)"
+            if overridden:
+                return overridden
+            builder = self._get_inline_builder(
+                ftype, "from_dict", dict(self.flags)
             )
+            variant = get_variant(self.flags[flag] for flag in FROM_DICT_FLAGS)
+            if "1" not in variant:
+                expr = f"{type_name(ftype)}.from_dict({value_name})"
+            else:
+                expr = (
+                    f"{type_name(ftype)}.{FROM_DICT_VARIANTS}[{variant!r}]"
+                    f"({type_name(ftype)}, {value_name})"
+                )
+            if builder is not None:
+                expr = builder._get_inline_from_dict(value_name, expr)
+            if self.flags["prebuilt"]:
+                return (
+                    f"({value_name} if {value_name}.__class__ is "
+                    f"{type_name(ftype)} else {expr})"
+                )
+            return expr
         elif overridden:
             return overridden
 
         raise UnserializableField(fname, ftype, parent)
 
+    def _get_inline_builder(
+        self, cls, method_name: str, flags: typing.Dict[str, bool]
+    ) -> typing.Optional["CodeBuilder"]:
+        if self.inline_depth <= 0 or cls in self.inline_chain:
+            return None
+        builder = CodeBuilder(cls)
+        if method_name == "to_dict":
+            hooks = (__PRE_SERIALIZE__, __POST_SERIALIZE__)
+        else:
+            hooks = (__PRE_DESERIALIZE__, __POST_DESERIALIZE__)
+        # only the code that doesn't need anything to be set on the nested
+        # class can be inlined into an expression
+        if (
+            builder.has_user_callables()
+            or any(builder.get_declared_hook(hook) for hook in hooks)
+            or any(map(_needs_union_helper, builder.field_types.values()))
+            or builder.get_config().positional_encoding
+        ):
+            return None
+        # the inlined code calls __init__ and takes the flags of the outer
+        # class, so it would ignore these options of the nested class
+        if method_name == "from_dict" and (
+            builder.get_config().trusted_input or builder.can_bypass_init()
+        ):
+            return None
+        self.has_inlined_code = True
+        builder.globals = self.globals
+        builder.module_names = self.module_names
+        builder.flags = flags
+        builder.inline_depth = self.inline_depth - 1
+        builder.inline_chain = self.inline_chain + (cls,)
+        return builder
+
+    def _get_inline_to_dict(self, value_name: str) -> str:
+        items = []
+        for fname, ftype in self.field_types.items():
+            self._add_type_modules(ftype)
+            metadata = self.metadatas.get(fname, {})
+            key = self._get_to_dict_key(fname, metadata)
+            attr = f"{value_name}.{fname}"
+            packed = self._pack_value(fname, ftype, self.cls, attr, metadata)
+            items.append(f"'{key}': None if {attr} is None else {packed}")
+        return f"{{{', '.join(items)}}}"
+
+    def _get_inline_from_dict(self, value_name: str, fallback: str) -> str:
+        config = self.get_config()
+        kwargs = []
+        # the values that aren't dicts or miss required keys are passed to
+        # the code of the nested class, which raises the same errors
+        conditions = [f"{value_name}.__class__ is dict"]
+        for fname, ftype in self.field_types.items():
+            self._add_type_modules(ftype)
+            metadata = self.metadatas.get(fname, {})
+            alias = metadata.get("alias")
+            if alias is None:
+                alias = config.aliases.get(fname)
+            key = alias or fname
+            item = f"{value_name}['{key}']"
+            unpacked = self._unpack_field_value(
+                fname, ftype, self.cls, item, metadata
+            )
+            value = f"None if {item} is None else {unpacked}"
+            if self.defaults[fname] is MISSING:
+                conditions.append(f"'{key}' in {value_name}")
+                kwargs.append(f"{fname}={value}")
+            else:
+                kwargs.append(
+                    f"**({{'{fname}': {value}}} "
+                    f"if '{key}' in {value_name} else {{}})"
+                )
+        return (
+            f"({type_name(self.cls)}({', '.join(kwargs)}) "
+            f"if {' and '.join(conditions)} else {fallback})"
+        )
+
+    def _get_type_expr(self, t) -> str:
+        if t is NoneType:
+            return "NoneType"
+        elif t.__module__ == "builtins":
+            return t.__qualname__
+        self._add_type_modules(t)
+        return type_name(t)
+
+    def _has_overridden_value(self, t, metadata, method_name: str) -> bool:
+        if metadata.get(method_name) or metadata.get("serialization_strategy"):
+            return True
+        return t in self.get_config().serialization_strategy
+
+    def _is_native_value(self, flag: str, t, metadata) -> bool:
+        # the values are left as they are only if they are converted in
+        # the default way in both directions, so that the overridden
+        # deserialization gets the data it expects
+        return self.flags[flag] and not (
+            self._has_overridden_value(t, metadata, "serialize")
+            or self._has_overridden_value(t, metadata, "deserialize")
+        )
+
+    def _unpack_native_value(self, t, value_name: str, expr: str) -> str:
+        if not self.flags["native_types"]:
+            return expr
+        return (
+            f"({value_name} if {value_name}.__class__ is "
+            f"{self._get_type_expr(t)} else {expr})"
+        )
+
+    def _get_pack_types(self, t, metadata) -> typing.Optional[tuple]:
+        if self._has_overridden_value(t, metadata, "serialize"):
+            return None
+        origin_type = get_type_origin(t)
+        if t is NoneType:
+            return (NoneType,)
+        elif is_special_typing_primitive(origin_type):
+            return None
+        elif issubclass(origin_type, os.PathLike):
+            return None
+        elif origin_type in _ABSTRACT_COLLECTION_TYPES:
+            return _ABSTRACT_COLLECTION_TYPES[origin_type]
+        return (origin_type,)
+
+    def _get_unpack_types(self, t, metadata) -> typing.Optional[tuple]:
+        if self._has_overridden_value(t, metadata, "deserialize"):
+            return None
+        origin_type = get_type_origin(t)
+        if t is NoneType:
+            return (NoneType,)
+        elif is_special_typing_primitive(origin_type):
+            return None
+        elif issubclass(origin_type, SerializableType):
+            return None
+        elif origin_type in (bool, int, float):
+            return (str,) if self.flags["str_scalars"] else (origin_type,)
+        elif issubclass(origin_type, str):
+            return (str,)
+        elif origin_type in (datetime.datetime, datetime.date, datetime.time):
+            if self.flags["use_datetime"]:
+                return (origin_type,)
+            elif self.flags["native_types"]:
+                return (origin_type, str)
+            return (str,)
+        elif origin_type is datetime.timedelta:
+            return (str,) if self.flags["str_scalars"] else (float,)
+        elif issubclass(origin_type, (bytes, bytearray)):
+            if self.flags["use_bytes"]:
+                return (bytes, bytearray)
+            return (str,)
+        elif issubclass(origin_type, enum.Enum):
+            if self.flags["use_enum"]:
+                return (origin_type,)
+            elif self.flags["str_scalars"]:
+                return (str,)
+            return tuple({type(member.value): None for member in origin_type})
+        elif is_dataclass_dict_mixin_subclass(origin_type):
+            if self.get_config(origin_type).positional_encoding:
+                return (list, tuple)
+            return (dict,)
+        elif issubclass(origin_type, collections.ChainMap):
+            return (list,)
+        elif issubclass(origin_type, collections.abc.Mapping):
+            return (dict,)
+        elif issubclass(origin_type, collections.abc.Collection):
+            return (list, tuple)
+        elif origin_type in (uuid.UUID, Decimal, Fraction):
+            return (origin_type, str) if self.flags["native_types"] else (str,)
+        elif issubclass(origin_type, (os.PathLike, *_STRING_TYPES)):
+            return (str,)
+        return None
+
+    def _add_union_dispatch(
+        self,
+        lines: CodeLines,
+        converters: typing.List[str],
+        value_types: typing.List[typing.Optional[tuple]],
+    ) -> None:
+        # values of the types listed here are converted only by the union
+        # arguments that could produce them, the other values are tried
+        # on each argument in turn
+        for i, arg_types in enumerate(value_types):
+            if arg_types and any(
+                "<locals>" in t.__qualname__ for t in arg_types
+            ):
+                value_types[i] = None
+        branches: typing.Dict[typing.Any, typing.List[str]] = {}
+        for arg_types in value_types:
+            for t in arg_types or ():
+                branches[t] = [
+                    converter
+                    for converter, t_types in zip(converters, value_types)
+                    if t_types is None or t in t_types
+                ]
+        if branches:
+            lines.append("value_type = type(value)")
+            keyword = "if"
+            for t, t_converters in branches.items():
+                lines.append(
+                    f"{keyword} value_type is {self._get_type_expr(t)}:"
+                )
+                with lines.indent():
+                    self._add_union_trials(lines, t_converters)
+                keyword = "elif"
+        self._add_union_trials(lines, converters)
+
+    @staticmethod
+    def _add_union_trials(lines: CodeLines, converters: typing.List[str]):
+        for converter in converters:
+            lines.append("try:")
+            with lines.indent():
+                lines.append(f"return {converter}")
+            lines.append("except Exception:")
+            with lines.indent():
+                lines.append("pass")
+
     def _add_pack_union(self, fname, ftype, args, parent, metadata) -> str:
         lines = CodeLines()
         method_name = (
             f"__pack_union_{parent.__name__}_{fname}__"
             f"{str(uuid.uuid4().hex)}"
         )
-        lines.append(
-            f"def {method_name}"
-            f"(self,value, {self.get_to_dict_default_flag_values()}):"
-        )
+        lines.append(f"def {method_name}(self, value):")
         with lines.indent():
-            for packer in [
-                self._pack_value(fname, arg_type, parent, metadata=metadata)
-                for arg_type in args
-            ]:
-                lines.append("try:")
-                with lines.indent():
-                    lines.append(f"return {packer}")
-                lines.append("except:")
-                with lines.indent():
-                    lines.append("pass")
+            self._add_union_dispatch(
+                lines,
+                [
+                    self._pack_value(
+                        fname, arg_type, parent, metadata=metadata
+                    )
+                    for arg_type in args
+                ],
+                [
+                    self._get_pack_types(arg_type, metadata)
+                    for arg_type in args
+                ],
+            )
             lines.append(
-                f"raise InvalidFieldValue('{fname}',{ftype},value,cls)"
+                f"raise InvalidFieldValue('{fname}',{ftype},value,type(self))"
             )
         lines.append(f"setattr(cls, '{method_name}', {method_name})")
         if self.get_config().debug:
             print(self.cls)
             print(lines.as_text())
-        exec(lines.as_text(), globals(), self.__dict__)
+        self._exec(lines.as_text())
         return method_name
 
+    @staticmethod
+    def _get_discriminated_classes(
+        args, discriminator: str
+    ) -> typing.List[typing.Tuple[typing.Any, str, typing.Any]]:
+        classes = []
+        for arg in args:
+            if not (
+                isinstance(arg, type) and is_dataclass_dict_mixin_subclass(arg)
+            ):
+                continue
+            builder = CodeBuilder(arg)
+            if builder.get_config().positional_encoding:
+                continue
+            field = builder.dataclass_fields.get(discriminator)
+            if field is None or field.default is MISSING:
+                continue
+            key = field.metadata.get("alias")
+            if key is None:
+                key = builder.get_config().aliases.get(discriminator)
+            classes.append((arg, key or discriminator, field.default))
+        return classes
+
+    def _get_discriminator_table(
+        self, fname, ftype, args, parent, discriminator: str
+    ) -> typing.Optional[typing.Tuple[str, str]]:
+        classes = self._get_discriminated_classes(args, discriminator)
+        if not classes:
+            return None
+        keys = {key for _, key, _ in classes}
+        if len(keys) > 1:
+            raise UnserializableField(
+                fname,
+                ftype,
+                parent,
+                f"Discriminator {discriminator} has different aliases "
+                f"in union arguments",
+            )
+        items: typing.Dict[typing.Any, typing.Tuple[str, str]] = {}
+        for cls, _, tag in classes:
+            if isinstance(tag, enum.Enum):
+                if self.flags["use_enum"]:
+                    tag_expr = f"{self._get_type_expr(type(tag))}.{tag.name}"
+                else:
+                    tag = tag.value
+                    tag_expr = repr(tag)
+            else:
+                tag_expr = repr(tag)
+            if not isinstance(
+                tag, (enum.Enum, str, int, float, bytes, NoneType)
+            ):
+                raise UnserializableField(
+                    fname,
+                    ftype,
+                    parent,
+                    f"Discriminator {discriminator} of {type_name(cls)} "
+                    f"has unsupported value {tag!r}",
+                )
+            elif tag in items:
+                raise UnserializableField(
+                    fname,
+                    ftype,
+                    parent,
+                    f"Discriminator {discriminator} has the same value "
+                    f"{tag!r} in {items[tag][0]} and {type_name(cls)}",
+                )
+            items[tag] = (type_name(cls), tag_expr)
+            self._add_type_modules(cls)
+        table = ", ".join(
+            f"{tag_expr}: {cls_name}" for cls_name, tag_expr in items.values()
+        )
+        return keys.pop(), f"{{{table}}}"
+
     def _add_unpack_union(self, fname, ftype, args, parent, metadata) -> str:
         lines = CodeLines()
         method_name = (
             f"__unpack_union_{parent.__name__}_{fname}__"
             f"{str(uuid.uuid4().hex)}"
         )
+        discriminator = metadata.get("discriminator")
+        table = None
+        if discriminator:
+            table = self._get_discriminator_table(
+                fname, ftype, args, parent, discriminator
+            )
         lines.append("@classmethod")
-        lines.append(
-            f"def {method_name}"
-            f"(cls,value,use_bytes=False,use_enum=False,use_datetime=False):"
-        )
+        if table is None:
+            lines.append(f"def {method_name}(cls, value):")
+        else:
+            lines.append(f"def {method_name}(cls, value, classes={{}}):")
         with lines.indent():
-            for unpacker in [
-                self._unpack_field_value(
-                    fname, arg_type, parent, metadata=metadata
+            if table is not None:
+                # the classes may not be importable until the first call
+                key, classes = table
+                lines.append("if not classes:")
+                with lines.indent():
+                    lines.append(f"classes.update({classes})")
+                variant = get_variant(
+                    self.flags[flag] for flag in FROM_DICT_FLAGS
                 )
-                for arg_type in args
-            ]:
                 lines.append("try:")
                 with lines.indent():
-                    lines.append(f"return {unpacker}")
-                lines.append("except:")
+                    lines.append(f"value_cls = classes[value['{key}']]")
+                lines.append("except Exception:")
                 with lines.indent():
                     lines.append("pass")
+                lines.append("else:")
+                with lines.indent():
+                    if "1" not in variant:
+                        lines.append("return value_cls.from_dict(value)")
+                    else:
+                        lines.append(
+                            f"return value_cls.{FROM_DICT_VARIANTS}"
+                            f"[{variant!r}](value_cls, value)"
+                        )
+            self._add_union_dispatch(
+                lines,
+                [
+                    self._unpack_field_value(
+                        fname, arg_type, parent, metadata=metadata
+                    )
+                    for arg_type in args
+                ],
+                [
+                    self._get_unpack_types(arg_type, metadata)
+                    for arg_type in args
+                ],
+            )
             lines.append(
                 f"raise InvalidFieldValue('{fname}',{ftype},value,cls)"
             )
@@ -1099,5 +2916,5 @@ class CodeBuilder:
         if self.get_config().debug:
             print(self.cls)
             print(lines.as_text())
-        exec(lines.as_text(), globals(), self.__dict__)
+        self._exec(lines.as_text())
         return method_name
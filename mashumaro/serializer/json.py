@@ -1,18 +1,75 @@
+import codecs
 import json
+from functools import partial
+from operator import methodcaller
 from types import MappingProxyType
-from typing import Any, Dict, Mapping, Type, TypeVar, Union
+from typing import (
+    IO,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from typing_extensions import Protocol
 
 from mashumaro.serializer.base import DataClassDictMixin
+from mashumaro.serializer.base.file_cache import (
+    FileCache,
+    PathType,
+    get_loader_key,
+    load_file,
+)
+from mashumaro.serializer.base.metaprogramming import (
+    FROM_DICT_VARIANTS,
+    TO_JSON,
+    CodeBuilder,
+    call_to_dict_variant,
+    get_native_to_dict_variant,
+    get_variant,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma no cover
+    orjson = None  # type: ignore
+try:
+    import rapidjson
+except ImportError:  # pragma no cover
+    rapidjson = None  # type: ignore
+try:
+    import ujson
+except ImportError:  # pragma no cover
+    ujson = None  # type: ignore
 
 DEFAULT_DICT_PARAMS = {
     "use_bytes": False,
     "use_enum": False,
     "use_datetime": False,
 }
+# the keyword arguments of from_dict that can be passed in dict_params
+FROM_DICT_PARAMS = frozenset(
+    ("use_bytes", "use_enum", "use_datetime", "trusted")
+)
 EncodedData = Union[str, bytes, bytearray]
 T = TypeVar("T", bound="DataClassJSONMixin")
+DEFAULT_CHUNK_SIZE = 65536
+DEFAULT_BATCH_SIZE = 1000
+# the number of key orders of objects remembered by an object hook
+MAX_KEY_ORDERS = 1024
+WHITESPACE = json.decoder.WHITESPACE  # type: ignore
 
 
 class Encoder(Protocol):  # pragma no cover
@@ -25,18 +82,312 @@ class Decoder(Protocol):  # pragma no cover
         ...
 
 
+class JSONBackend(NamedTuple):
+    """
+    Functions of a JSON library and the to_dict flags of the types that
+    the library can encode by itself, the values of these types are left as
+    they are unless their serialization is overridden.
+    """
+
+    dumps: Callable[..., EncodedData]
+    loads: Callable[..., Any]
+    native_flags: FrozenSet[str] = frozenset()
+
+
+# in the order of preference for the "auto" backend
+JSON_BACKEND_NAMES = ("orjson", "rapidjson", "ujson", "json")
+JSON_BACKENDS = {"json": JSONBackend(json.dumps, json.loads)}
+# non-string keys are converted to strings as json module does
+if orjson is not None:
+    JSON_BACKENDS["orjson"] = JSONBackend(
+        partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS),
+        orjson.loads,
+        frozenset(("native_datetime", "native_enum", "native_uuid")),
+    )
+if rapidjson is not None:
+    JSON_BACKENDS["rapidjson"] = JSONBackend(
+        partial(
+            rapidjson.dumps,
+            datetime_mode=rapidjson.DM_ISO8601,
+            uuid_mode=rapidjson.UM_CANONICAL,
+            mapping_mode=rapidjson.MM_COERCE_KEYS_TO_STRINGS,
+        ),
+        rapidjson.loads,
+        frozenset(("native_datetime", "native_uuid")),
+    )
+if ujson is not None:
+    JSON_BACKENDS["ujson"] = JSONBackend(
+        partial(ujson.dumps, escape_forward_slashes=False), ujson.loads
+    )
+
+
+def get_json_backend(name: str) -> JSONBackend:
+    if name == "auto":
+        return next(
+            JSON_BACKENDS[n] for n in JSON_BACKEND_NAMES if n in JSON_BACKENDS
+        )
+    elif name not in JSON_BACKEND_NAMES:
+        raise ValueError(
+            f"Unknown JSON backend {name!r}, "
+            f"use one of {', '.join(JSON_BACKEND_NAMES)} or auto"
+        )
+    elif name not in JSON_BACKENDS:
+        raise ModuleNotFoundError(
+            f'Install "{name}" to use it as the JSON backend'
+        )
+    return JSON_BACKENDS[name]
+
+
+class JSONArrayReader:
+    """
+    Reads the elements of a JSON array from a file object one by one,
+    so that only the current element is kept in memory. The array can be
+    the document itself or a value in nested objects found by the keys.
+    """
+
+    def __init__(
+        self,
+        fp: IO,
+        decoder: json.JSONDecoder,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self.fp = fp
+        self.decoder = decoder
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        # the position of the buffer in the document, the number of its
+        # first line and the position where this line starts
+        self.offset = 0
+        self.lineno = 1
+        self.line_start = 0
+        self._bytes_decoder: Optional[codecs.IncrementalDecoder] = None
+
+    def _read(self, size: int) -> None:
+        chunk = self.fp.read(size)
+        self.eof = not chunk
+        if isinstance(chunk, (bytes, bytearray)):
+            if self._bytes_decoder is None:
+                self._bytes_decoder = codecs.getincrementaldecoder(
+                    "utf-8-sig"
+                )()
+            chunk = self._bytes_decoder.decode(chunk, final=self.eof)
+        consumed, self.pos = self.pos, 0
+        newlines = self.buffer.count("\n", 0, consumed)
+        if newlines:
+            self.lineno += newlines
+            last_newline = self.buffer.rindex("\n", 0, consumed)
+            self.line_start = self.offset + last_newline + 1
+        self.offset += consumed
+        self.buffer = self.buffer[consumed:] + chunk
+
+    def _error(
+        self, msg: str, pos: Optional[int] = None
+    ) -> json.JSONDecodeError:
+        # the position in the buffer is converted to the one in the document
+        if pos is None:
+            pos = self.pos
+        error = json.JSONDecodeError(msg, self.buffer, pos)
+        error.pos = self.offset + pos
+        if error.lineno == 1:
+            error.colno = error.pos - self.line_start + 1
+        error.lineno += self.lineno - 1
+        error.args = (
+            f"{msg}: line {error.lineno} column {error.colno} "
+            f"(char {error.pos})",
+        )
+        return error
+
+    def _peek(self) -> str:
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            elif self.eof:
+                return ""
+            self._read(self.chunk_size)
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if not char or char not in chars:
+            expected = " or ".join(repr(c) for c in chars)
+            raise self._error(f"Expecting {expected}")
+        self.pos += 1
+        return char
+
+    def _decode(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    raise self._error(e.msg, e.pos) from None
+            else:
+                # a number at the end of the buffer may be incomplete
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            # the buffer is at least doubled to decode large values
+            # in linear time
+            self._read(max(self.chunk_size, len(self.buffer)))
+
+    def _find_key(self, key: str) -> None:
+        self._expect("{")
+        if self._peek() == "}":
+            raise self._error(f"Expecting key {key!r}")
+        while True:
+            if self._peek() != '"':
+                raise self._error("Expecting property name")
+            name = self._decode()
+            self._expect(":")
+            if name == key:
+                return
+            self._decode()
+            if self._expect(",}") == "}":
+                raise self._error(f"Expecting key {key!r}")
+
+    def iter_items(self, path: Sequence[str] = ()) -> Iterator[Any]:
+        for key in path:
+            self._find_key(key)
+        self._expect("[")
+        if self._peek() == "]":
+            return
+        while True:
+            yield self._decode()
+            if self._expect(",]") == "]":
+                return
+
+
+def get_dict_params(dict_params: Mapping) -> Dict[str, Any]:
+    params = dict(DEFAULT_DICT_PARAMS, **dict_params)
+    # the methods are called faster without keyword arguments
+    return params if any(params.values()) else {}
+
+
+def make_object_pairs_hook(
+    targets: Sequence[Tuple[frozenset, frozenset, Callable[[Dict], Any]]]
+) -> Callable[[List[Tuple[str, Any]]], Any]:
+    """
+    Makes an object_pairs_hook for json module that passes each decoded
+    object to the function of the target with the matching keys, the other
+    objects and the objects that the function fails to load are left as
+    dictionaries.
+    """
+    matches: Dict[Tuple[str, ...], Optional[Callable[[Dict], Any]]] = {}
+
+    def object_pairs_hook(pairs: List[Tuple[str, Any]]) -> Any:
+        d = dict(pairs)
+        keys = tuple(d)
+        try:
+            from_dict = matches[keys]
+        except KeyError:
+            from_dict = None
+            for required, all_keys, function in targets:
+                if required <= d.keys() <= all_keys:
+                    from_dict = function
+                    break
+            if len(matches) < MAX_KEY_ORDERS:
+                matches[keys] = from_dict
+        if from_dict is None:
+            return d
+        try:
+            return from_dict(d)
+        except Exception:
+            # the error is raised by from_dict of the enclosing object with
+            # the same context as when the data is loaded without the hook
+            return d
+
+    return object_pairs_hook
+
+
+def _get_object_pairs_hook(
+    cls: Type[T], variant: str
+) -> Optional[Callable[[List[Tuple[str, Any]]], Any]]:
+    hooks = cls.__mashumaro_json_object_hooks__
+    assert hooks is not None
+    try:
+        return hooks[variant]
+    except KeyError:
+        pass
+    # the classes are collected on the first call, when all the field types
+    # can be resolved
+    classes = CodeBuilder(cls).get_json_object_classes()
+    hook = None
+    if classes:
+        hook = make_object_pairs_hook(
+            [
+                (
+                    required,
+                    keys,
+                    partial(getattr(c, FROM_DICT_VARIANTS)[variant], c),
+                )
+                for c, required, keys in classes
+            ]
+        )
+    hooks[variant] = hook
+    return hook
+
+
+def write_lines(fp: IO, lines: List[EncodedData]) -> None:
+    if isinstance(lines[0], str):
+        fp.write("\n".join(lines) + "\n")  # type: ignore
+    else:
+        fp.write(b"\n".join(lines) + b"\n")  # type: ignore
+
+
 class DataClassJSONMixin(DataClassDictMixin):
     __slots__ = ()
 
+    __mashumaro_to_json__: ClassVar[Optional[Callable[..., str]]] = None
+    __mashumaro_json_backend__: ClassVar[JSONBackend] = JSON_BACKENDS["json"]
+    __mashumaro_json_object_hooks__: ClassVar[
+        Optional[Dict[str, Optional[Callable[..., Any]]]]
+    ] = None
+
+    def __init_subclass__(cls: Type[T], **kwargs):
+        super().__init_subclass__(**kwargs)
+        builder = CodeBuilder(cls)
+        config = builder.get_config()
+        backend = get_json_backend(config.json_backend)
+        cls.__mashumaro_json_backend__ = backend
+        if config.json_object_pairs_hook and backend.loads is json.loads:
+            cls.__mashumaro_json_object_hooks__ = {}
+        else:
+            cls.__mashumaro_json_object_hooks__ = None
+        if not config.direct_to_json or backend.dumps is not json.dumps:
+            setattr(cls, TO_JSON, None)
+        elif config.lazy_compilation:
+            builder.add_trampoline(TO_JSON, builder.add_to_json)
+        else:
+            builder.add_to_json()
+
     def to_json(
         self: T,
-        encoder: Encoder = json.dumps,
+        encoder: Optional[Encoder] = None,
         dict_params: Mapping = MappingProxyType({}),
         **encoder_kwargs,
     ) -> EncodedData:
 
+        if encoder is None:
+            if (
+                self.__mashumaro_to_json__ is not None
+                and not dict_params
+                and not encoder_kwargs
+            ):
+                return self.__mashumaro_to_json__()
+            backend = self.__mashumaro_json_backend__
+            if backend.native_flags:
+                variant = get_native_to_dict_variant(
+                    type(self), dict_params, backend.native_flags
+                )
+                d = call_to_dict_variant(variant, self)
+            else:
+                d = self.to_dict(**get_dict_params(dict_params))
+            return backend.dumps(d, **encoder_kwargs)
         return encoder(
-            self.to_dict(**dict(DEFAULT_DICT_PARAMS, **dict_params)),
+            self.to_dict(**get_dict_params(dict_params)),
             **encoder_kwargs,
         )
 
@@ -44,12 +395,145 @@ class DataClassJSONMixin(DataClassDictMixin):
     def from_json(
         cls: Type[T],
         data: EncodedData,
-        decoder: Decoder = json.loads,
+        decoder: Optional[Decoder] = None,
         dict_params: Mapping = MappingProxyType({}),
         **decoder_kwargs,
     ) -> T:
 
+        if decoder is None:
+            if (
+                cls.__mashumaro_json_object_hooks__ is not None
+                and "object_pairs_hook" not in decoder_kwargs
+                # the unknown keys are rejected by from_dict
+                and dict_params.keys() <= FROM_DICT_PARAMS
+            ):
+                params = dict(DEFAULT_DICT_PARAMS, **dict_params)
+                variant = get_variant(
+                    (
+                        params["use_bytes"],
+                        params["use_enum"],
+                        params["use_datetime"],
+                        False,
+                        True,
+                        params.get("trusted", cls.__mashumaro_trusted_input__),
+                        False,
+                    )
+                )
+                hook = _get_object_pairs_hook(cls, variant)
+                if hook is not None:
+                    obj = json.loads(
+                        data, object_pairs_hook=hook, **decoder_kwargs
+                    )
+                    if obj.__class__ is cls:
+                        return obj
+                    return getattr(cls, FROM_DICT_VARIANTS)[variant](cls, obj)
+            decoder = cls.__mashumaro_json_backend__.loads
         return cls.from_dict(
             decoder(data, **decoder_kwargs),
-            **dict(DEFAULT_DICT_PARAMS, **dict_params),
+            **get_dict_params(dict_params),
+        )
+
+    @classmethod
+    def from_json_file(
+        cls: Type[T],
+        path: PathType,
+        cache: Optional[FileCache] = None,
+        decoder: Optional[Decoder] = None,
+        dict_params: Mapping = MappingProxyType({}),
+        **decoder_kwargs,
+    ) -> T:
+
+        loader: Callable[[bytes], T] = partial(
+            cls.from_json,
+            decoder=decoder,
+            dict_params=dict_params,
+            **decoder_kwargs,
+        )
+        key = get_loader_key(
+            cls, "from_json", decoder, dict_params, decoder_kwargs
+        )
+        return load_file(path, loader, cache, key)
+
+    @classmethod
+    def iter_from_json(
+        cls: Type[T],
+        fp: IO,
+        path: Union[str, Sequence[str]] = (),
+        dict_params: Mapping = MappingProxyType({}),
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **decoder_kwargs,
+    ) -> Iterator[T]:
+
+        if isinstance(path, str):
+            path = path.split(".") if path else ()
+        reader = JSONArrayReader(
+            fp, json.JSONDecoder(**decoder_kwargs), chunk_size
+        )
+        params = dict(DEFAULT_DICT_PARAMS, **dict_params)
+        for item in reader.iter_items(path):
+            yield cls.from_dict(item, **params)
+
+    @classmethod
+    def from_json_lines(
+        cls: Type[T],
+        fp: Iterable[EncodedData],
+        decoder: Optional[Decoder] = None,
+        dict_params: Mapping = MappingProxyType({}),
+        errors: Optional[List[Any]] = None,
+        **decoder_kwargs,
+    ) -> Iterator[T]:
+
+        if decoder is None:
+            decoder = cls.__mashumaro_json_backend__.loads
+        decode: Callable[..., Any] = partial(decoder, **decoder_kwargs)
+        from_dict: Callable[..., T] = partial(
+            cls.from_dict, **get_dict_params(dict_params)
         )
+        for line_number, line in enumerate(fp, 1):
+            if not line.strip():
+                continue
+            try:
+                obj = from_dict(decode(line))
+            except Exception as e:
+                if errors is None:
+                    raise
+                errors.append((line_number, e))
+            else:
+                yield obj
+
+    @classmethod
+    def to_json_lines(
+        cls: Type[T],
+        objs: Iterable[T],
+        fp: IO,
+        encoder: Optional[Encoder] = None,
+        dict_params: Mapping = MappingProxyType({}),
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **encoder_kwargs,
+    ) -> int:
+
+        native_flags: FrozenSet[str] = frozenset()
+        if encoder is None:
+            encoder = cls.__mashumaro_json_backend__.dumps
+            native_flags = cls.__mashumaro_json_backend__.native_flags
+        encode: Callable[..., EncodedData] = partial(encoder, **encoder_kwargs)
+        to_dict: Callable[[T], Dict[str, Any]]
+        if native_flags:
+            variant = get_native_to_dict_variant(
+                cls, dict_params, native_flags
+            )
+            to_dict = partial(call_to_dict_variant, variant)
+        else:
+            to_dict = methodcaller("to_dict", **get_dict_params(dict_params))
+        count = 0
+        lines = []
+        for obj in objs:
+            lines.append(encode(to_dict(obj)))
+            if len(lines) >= batch_size:
+                write_lines(fp, lines)
+                count += len(lines)
+                lines.clear()
+        if lines:
+            write_lines(fp, lines)
+            count += len(lines)
+        return count
@@ -1,19 +1,74 @@
+import datetime
+import struct
+import uuid
+from decimal import Decimal
+from fractions import Fraction
 from functools import partial
+from operator import methodcaller
 from types import MappingProxyType
-from typing import Any, Dict, Mapping, Type, TypeVar, Union
+from typing import (
+    IO,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import msgpack
 from typing_extensions import Protocol
 
 from mashumaro.serializer.base import DataClassDictMixin
+from mashumaro.serializer.base.file_cache import (
+    FileCache,
+    PathType,
+    get_loader_key,
+    load_file,
+)
+from mashumaro.serializer.base.metaprogramming import (
+    FROM_DICT_VARIANTS,
+    CodeBuilder,
+    call_to_dict_variant,
+    get_native_from_dict_variant,
+    get_native_to_dict_variant,
+)
 
 DEFAULT_DICT_PARAMS = {
     "use_bytes": True,
     "use_enum": False,
     "use_datetime": False,
 }
+# the types packed into extension types are left as they are by to_dict
+# unless their serialization is overridden
+EXT_NATIVE_FLAGS = frozenset(
+    ("native_datetime", "native_uuid", "native_decimal", "native_fraction")
+)
 EncodedData = Union[str, bytes, bytearray]
 T = TypeVar("T", bound="DataClassMessagePackMixin")
+DEFAULT_READ_SIZE = 65536
+DEFAULT_BATCH_SIZE = 1000
+
+EXT_DATETIME = 1
+EXT_DATE = 2
+EXT_TIME = 3
+EXT_UUID = 4
+EXT_DECIMAL = 5
+EXT_FRACTION = 6
+
+_DATE = struct.Struct("<HBB")
+_TIME = struct.Struct("<BBBI")
+_DATETIME = struct.Struct("<HBBBBBI")
+_OFFSET = struct.Struct("<i")
+# the checks of ExtType arguments are skipped for the known codes
+_ext = msgpack.ExtType._make
+# the timestamp extension type is built in since msgpack 1.0
+HAS_TIMESTAMP = hasattr(msgpack, "Timestamp")
 
 
 class Encoder(Protocol):  # pragma no cover
@@ -26,30 +81,226 @@ class Decoder(Protocol):  # pragma no cover
         ...
 
 
+def _pack_offset(value: Union[datetime.datetime, datetime.time]) -> bytes:
+    offset = value.utcoffset()
+    if offset is None:
+        return b""
+    return _OFFSET.pack(offset.days * 86400 + offset.seconds)
+
+
+def _unpack_offset(data: bytes, start: int) -> datetime.timezone:
+    seconds = _OFFSET.unpack_from(data, start)[0]
+    if not seconds:
+        return datetime.timezone.utc
+    return datetime.timezone(datetime.timedelta(seconds=seconds))
+
+
+def ext_default(obj: Any) -> Any:
+    """
+    Packs the values left as they are by to_dict into MessagePack extension
+    types. Datetimes with time zones are packed by msgpack itself into
+    the timestamp type, which is restored in UTC. Other time zones are
+    restored as fixed offsets, as if they were parsed from ISO 8601 strings.
+    """
+    if isinstance(obj, datetime.datetime):
+        return _ext(
+            (
+                EXT_DATETIME,
+                _DATETIME.pack(
+                    obj.year,
+                    obj.month,
+                    obj.day,
+                    obj.hour,
+                    obj.minute,
+                    obj.second,
+                    obj.microsecond,
+                )
+                + _pack_offset(obj),
+            )
+        )
+    elif isinstance(obj, datetime.date):
+        return _ext((EXT_DATE, _DATE.pack(obj.year, obj.month, obj.day)))
+    elif isinstance(obj, datetime.time):
+        return _ext(
+            (
+                EXT_TIME,
+                _TIME.pack(obj.hour, obj.minute, obj.second, obj.microsecond)
+                + _pack_offset(obj),
+            )
+        )
+    elif isinstance(obj, uuid.UUID):
+        return _ext((EXT_UUID, obj.bytes))
+    elif isinstance(obj, Decimal):
+        return _ext((EXT_DECIMAL, str(obj).encode()))
+    elif isinstance(obj, Fraction):
+        return _ext((EXT_FRACTION, str(obj).encode()))
+    raise TypeError(f"Object of type {type(obj).__name__} is not packable")
+
+
+def ext_hook(code: int, data: bytes) -> Any:
+    if code == EXT_DATETIME:
+        value = datetime.datetime(*_DATETIME.unpack_from(data))
+        if len(data) > _DATETIME.size:
+            value = value.replace(tzinfo=_unpack_offset(data, _DATETIME.size))
+        return value
+    elif code == EXT_DATE:
+        return datetime.date(*_DATE.unpack(data))
+    elif code == EXT_TIME:
+        time = datetime.time(*_TIME.unpack_from(data))
+        if len(data) > _TIME.size:
+            time = time.replace(tzinfo=_unpack_offset(data, _TIME.size))
+        return time
+    elif code == EXT_UUID:
+        return uuid.UUID(bytes=data)
+    elif code == EXT_DECIMAL:
+        return Decimal(data.decode())
+    elif code == EXT_FRACTION:
+        return Fraction(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+PACKER_KWARGS: Dict[str, Any] = {"use_bin_type": True}
+UNPACKER_KWARGS: Dict[str, Any] = {"raw": False}
+EXT_PACKER_KWARGS = dict(PACKER_KWARGS, default=ext_default)
+EXT_UNPACKER_KWARGS = dict(UNPACKER_KWARGS, ext_hook=ext_hook)
+if HAS_TIMESTAMP:
+    # the timestamps are unpacked to datetime objects in UTC
+    EXT_PACKER_KWARGS["datetime"] = True
+    EXT_UNPACKER_KWARGS["timestamp"] = 3
+
+default_packb: Callable[..., EncodedData] = partial(
+    msgpack.packb, **PACKER_KWARGS
+)
+default_unpackb: Callable[..., Any] = partial(
+    msgpack.unpackb, **UNPACKER_KWARGS
+)
+ext_packb: Callable[..., EncodedData] = partial(
+    msgpack.packb, **EXT_PACKER_KWARGS
+)
+ext_unpackb: Callable[..., Any] = partial(
+    msgpack.unpackb, **EXT_UNPACKER_KWARGS
+)
+
+
 class DataClassMessagePackMixin(DataClassDictMixin):
     __slots__ = ()
 
+    __mashumaro_msgpack_ext_types__: ClassVar[bool] = False
+
+    def __init_subclass__(cls: Type[T], **kwargs):
+        super().__init_subclass__(**kwargs)
+        config = CodeBuilder(cls).get_config()
+        cls.__mashumaro_msgpack_ext_types__ = config.msgpack_ext_types
+
     def to_msgpack(
         self: T,
-        encoder: Encoder = partial(msgpack.packb, use_bin_type=True),
+        encoder: Optional[Encoder] = None,
         dict_params: Mapping = MappingProxyType({}),
         **encoder_kwargs,
     ) -> EncodedData:
 
-        return encoder(
-            self.to_dict(**dict(DEFAULT_DICT_PARAMS, **dict_params)),
-            **encoder_kwargs,
-        )
+        params = dict(DEFAULT_DICT_PARAMS, **dict_params)
+        if encoder is None and self.__mashumaro_msgpack_ext_types__:
+            variant = get_native_to_dict_variant(
+                type(self), params, EXT_NATIVE_FLAGS
+            )
+            return ext_packb(
+                call_to_dict_variant(variant, self), **encoder_kwargs
+            )
+        encode = default_packb if encoder is None else encoder
+        return encode(self.to_dict(**params), **encoder_kwargs)
 
     @classmethod
     def from_msgpack(
         cls: Type[T],
         data: EncodedData,
-        decoder: Decoder = partial(msgpack.unpackb, raw=False),
+        decoder: Optional[Decoder] = None,
+        dict_params: Mapping = MappingProxyType({}),
+        **decoder_kwargs,
+    ) -> T:
+        params = dict(DEFAULT_DICT_PARAMS, **dict_params)
+        if decoder is None and cls.__mashumaro_msgpack_ext_types__:
+            variant = get_native_from_dict_variant(cls, params)
+            return getattr(cls, FROM_DICT_VARIANTS)[variant](
+                cls, ext_unpackb(data, **decoder_kwargs)
+            )
+        decode = default_unpackb if decoder is None else decoder
+        return cls.from_dict(decode(data, **decoder_kwargs), **params)
+
+    @classmethod
+    def from_msgpack_file(
+        cls: Type[T],
+        path: PathType,
+        cache: Optional[FileCache] = None,
+        decoder: Optional[Decoder] = None,
         dict_params: Mapping = MappingProxyType({}),
         **decoder_kwargs,
     ) -> T:
-        return cls.from_dict(
-            decoder(data, **decoder_kwargs),
-            **dict(DEFAULT_DICT_PARAMS, **dict_params),
+
+        loader: Callable[[bytes], T] = partial(
+            cls.from_msgpack,
+            decoder=decoder,
+            dict_params=dict_params,
+            **decoder_kwargs,
+        )
+        key = get_loader_key(
+            cls, "from_msgpack", decoder, dict_params, decoder_kwargs
+        )
+        return load_file(path, loader, cache, key)
+
+    @classmethod
+    def iter_from_msgpack(
+        cls: Type[T],
+        fp: IO,
+        dict_params: Mapping = MappingProxyType({}),
+        read_size: int = DEFAULT_READ_SIZE,
+        **unpacker_kwargs,
+    ) -> Iterator[T]:
+
+        params = dict(DEFAULT_DICT_PARAMS, **dict_params)
+        kwargs = UNPACKER_KWARGS
+        from_dict: Callable[..., T] = partial(cls.from_dict, **params)
+        if cls.__mashumaro_msgpack_ext_types__:
+            kwargs = EXT_UNPACKER_KWARGS
+            variant = get_native_from_dict_variant(cls, params)
+            from_dict = partial(getattr(cls, FROM_DICT_VARIANTS)[variant], cls)
+        unpacker = msgpack.Unpacker(
+            fp, read_size=read_size, **dict(kwargs, **unpacker_kwargs)
+        )
+        for d in unpacker:
+            yield from_dict(d)
+
+    @classmethod
+    def write_msgpack(
+        cls: Type[T],
+        objs: Iterable[T],
+        fp: IO,
+        dict_params: Mapping = MappingProxyType({}),
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **packer_kwargs,
+    ) -> int:
+
+        params = dict(DEFAULT_DICT_PARAMS, **dict_params)
+        kwargs = PACKER_KWARGS
+        to_dict: Callable[[T], Dict[str, Any]]
+        if cls.__mashumaro_msgpack_ext_types__:
+            kwargs = EXT_PACKER_KWARGS
+            variant = get_native_to_dict_variant(cls, params, EXT_NATIVE_FLAGS)
+            to_dict = partial(call_to_dict_variant, variant)
+        else:
+            to_dict = methodcaller("to_dict", **params)
+        # the packed objects are accumulated in the buffer of the packer
+        # and written at once
+        packer = msgpack.Packer(
+            autoreset=False, **dict(kwargs, **packer_kwargs)
         )
+        pack = packer.pack
+        count = 0
+        for count, obj in enumerate(objs, 1):
+            pack(to_dict(obj))
+            if not count % batch_size:
+                fp.write(packer.bytes())
+                packer.reset()
+        if count % batch_size:
+            fp.write(packer.bytes())
+        return count
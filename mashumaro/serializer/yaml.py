@@ -1,10 +1,35 @@
+import re
+from functools import partial
 from types import MappingProxyType
-from typing import Any, Dict, Mapping, Type, TypeVar, Union
+from typing import (
+    IO,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import yaml
 from typing_extensions import Protocol
 
 from mashumaro.serializer.base import DataClassDictMixin
+from mashumaro.serializer.base.file_cache import (
+    FileCache,
+    PathType,
+    get_loader_key,
+    load_file,
+)
+from mashumaro.serializer.base.metaprogramming import (
+    FROM_DICT_VARIANTS,
+    CodeBuilder,
+)
 
 DEFAULT_DICT_PARAMS = {
     "use_bytes": False,
@@ -14,6 +39,52 @@ DEFAULT_DICT_PARAMS = {
 EncodedData = Union[str, bytes]
 T = TypeVar("T", bound="DataClassYAMLMixin")
 
+# the classes based on libyaml are used if PyYAML was built with it
+DefaultLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+DefaultDumper = getattr(yaml, "CDumper", yaml.Dumper)
+
+default_encoder: Callable[..., EncodedData] = partial(
+    yaml.dump, Dumper=DefaultDumper
+)
+default_decoder: Callable[..., Any] = partial(yaml.load, Loader=DefaultLoader)
+
+
+_BaseLoader = getattr(yaml, "CBaseLoader", yaml.BaseLoader)
+
+
+class StrScalarLoader(_BaseLoader):  # type: ignore
+    """
+    Loads all scalars except nulls as strings, leaving the conversion to
+    the declared field types for from_dict. Merge keys are supported.
+    """
+
+    flatten_mapping = yaml.SafeLoader.flatten_mapping
+
+    def construct_mapping(self, node, deep=False):
+        if isinstance(node, yaml.MappingNode):
+            self.flatten_mapping(node)
+        return super().construct_mapping(node, deep)
+
+    def construct_yaml_null(self, node):
+        return None
+
+
+StrScalarLoader.add_implicit_resolver(
+    "tag:yaml.org,2002:null",
+    re.compile(r"^(?:~|null|Null|NULL|)$"),
+    ["~", "n", "N", ""],
+)
+StrScalarLoader.add_implicit_resolver(
+    "tag:yaml.org,2002:merge", re.compile(r"^(?:<<)$"), ["<"]
+)
+StrScalarLoader.add_constructor(
+    "tag:yaml.org,2002:null", StrScalarLoader.construct_yaml_null
+)
+
+str_scalar_decoder: Callable[..., Any] = partial(
+    yaml.load, Loader=StrScalarLoader
+)
+
 
 class Encoder(Protocol):  # pragma no cover
     def __call__(self, o, **kwargs) -> EncodedData:
@@ -25,12 +96,35 @@ class Decoder(Protocol):  # pragma no cover
         ...
 
 
+def _get_str_scalar_from_dict(
+    cls: Type[T], dict_params: Mapping
+) -> Callable[[Any], T]:
+    params = dict(DEFAULT_DICT_PARAMS, **dict_params)
+    variant = (
+        params["use_bytes"],
+        params["use_enum"],
+        params["use_datetime"],
+        True,
+        False,
+        False,
+        False,
+    )
+    return partial(getattr(cls, FROM_DICT_VARIANTS)[variant], cls)
+
+
 class DataClassYAMLMixin(DataClassDictMixin):
     __slots__ = ()
 
+    __mashumaro_yaml_base_loader__: ClassVar[bool] = False
+
+    def __init_subclass__(cls: Type[T], **kwargs):
+        super().__init_subclass__(**kwargs)
+        config = CodeBuilder(cls).get_config()
+        cls.__mashumaro_yaml_base_loader__ = config.yaml_base_loader
+
     def to_yaml(
         self: T,
-        encoder: Encoder = yaml.dump,  # type: ignore
+        encoder: Encoder = default_encoder,  # type: ignore
         dict_params: Mapping = MappingProxyType({}),
         **encoder_kwargs,
     ) -> EncodedData:
@@ -44,11 +138,78 @@ class DataClassYAMLMixin(DataClassDictMixin):
     def from_yaml(
         cls: Type[T],
         data: EncodedData,
-        decoder: Decoder = yaml.safe_load,  # type: ignore
+        decoder: Optional[Decoder] = None,
         dict_params: Mapping = MappingProxyType({}),
         **decoder_kwargs,
     ) -> T:
+        if decoder is None:
+            if cls.__mashumaro_yaml_base_loader__:
+                from_dict = _get_str_scalar_from_dict(cls, dict_params)
+                return from_dict(str_scalar_decoder(data, **decoder_kwargs))
+            decoder = default_decoder
         return cls.from_dict(
             decoder(data, **decoder_kwargs),
             **dict(DEFAULT_DICT_PARAMS, **dict_params),
         )
+
+    @classmethod
+    def from_yaml_file(
+        cls: Type[T],
+        path: PathType,
+        cache: Optional[FileCache] = None,
+        decoder: Optional[Decoder] = None,
+        dict_params: Mapping = MappingProxyType({}),
+        **decoder_kwargs,
+    ) -> T:
+
+        loader: Callable[[bytes], T] = partial(
+            cls.from_yaml,
+            decoder=decoder,
+            dict_params=dict_params,
+            **decoder_kwargs,
+        )
+        key = get_loader_key(
+            cls, "from_yaml", decoder, dict_params, decoder_kwargs
+        )
+        return load_file(path, loader, cache, key)
+
+    @classmethod
+    def iter_from_yaml(
+        cls: Type[T],
+        stream: Union[EncodedData, IO],
+        dict_params: Mapping = MappingProxyType({}),
+        loader: Optional[Type] = None,
+    ) -> Iterator[T]:
+
+        from_dict: Callable[..., T]
+        if loader is None and cls.__mashumaro_yaml_base_loader__:
+            loader = StrScalarLoader
+            from_dict = _get_str_scalar_from_dict(cls, dict_params)
+        else:
+            from_dict = partial(
+                cls.from_dict, **dict(DEFAULT_DICT_PARAMS, **dict_params)
+            )
+        if loader is None:
+            loader = DefaultLoader
+        for d in yaml.load_all(stream, Loader=loader):
+            # empty documents, such as the one after a trailing separator,
+            # are skipped
+            if d is not None:
+                yield from_dict(d)
+
+    @classmethod
+    def to_yaml_all(
+        cls: Type[T],
+        objs: Iterable[T],
+        stream: Optional[IO] = None,
+        dict_params: Mapping = MappingProxyType({}),
+        **dumper_kwargs,
+    ) -> Optional[EncodedData]:
+
+        dict_params = dict(DEFAULT_DICT_PARAMS, **dict_params)
+        dumper_kwargs.setdefault("Dumper", DefaultDumper)
+        return yaml.dump_all(
+            (obj.to_dict(**dict_params) for obj in objs),
+            stream,
+            **dumper_kwargs,
+        )
@@ -2,9 +2,14 @@
 
 from setuptools import find_packages, setup
 
+# the version is also used by the code cache, so it's kept in one place
+version = {}
+with open("mashumaro/version.py", encoding="utf8") as f:
+    exec(f.read(), version)
+
 setup(
     name="mashumaro",
-    version="2.4",
+    version=version["__version__"],
     description="Fast serialization framework on top of dataclasses",
     long_description=open("README.md", encoding="utf8").read(),
     long_description_content_type="text/markdown",
@@ -0,0 +1,168 @@
+from dataclasses import InitVar, dataclass, field
+from typing import List, Optional
+
+import pytest
+
+from mashumaro import DataClassDictMixin
+from mashumaro.config import BaseConfig
+from mashumaro.exceptions import MissingField
+from mashumaro.serializer.base.metaprogramming import CodeBuilder
+
+
+class BypassInitConfig(BaseConfig):
+    bypass_init = True
+
+
+@dataclass
+class Item(DataClassDictMixin):
+    x: int
+    y: Optional[int] = 1
+    tags: List[str] = field(default_factory=list)
+
+    class Config(BypassInitConfig):
+        pass
+
+
+@dataclass(frozen=True)
+class FrozenItem(DataClassDictMixin):
+    x: int
+    items: List[Item] = field(default_factory=list)
+
+    class Config(BypassInitConfig):
+        pass
+
+
+@dataclass
+class SlotsItem(DataClassDictMixin):
+    __slots__ = ("x", "y")
+    x: int
+    y: int
+
+    class Config(BypassInitConfig):
+        pass
+
+
+class DictBase:
+    pass
+
+
+@dataclass
+class SlotsOnDictBase(DataClassDictMixin, DictBase):
+    __slots__ = ("x",)
+    x: int
+    y: int = 2
+
+    class Config(BypassInitConfig):
+        pass
+
+
+@dataclass
+class PositionalItem(DataClassDictMixin):
+    x: int
+    y: int = 2
+
+    class Config(BypassInitConfig):
+        positional_encoding = True
+
+
+@dataclass
+class WithPostInit(DataClassDictMixin):
+    x: int
+
+    class Config(BypassInitConfig):
+        pass
+
+    def __post_init__(self):
+        self.x += 1
+
+
+@dataclass
+class WithInitVar(DataClassDictMixin):
+    x: int
+    y: InitVar[int] = 0
+
+    class Config(BypassInitConfig):
+        pass
+
+
+@dataclass
+class WithOwnInit(DataClassDictMixin):
+    x: int
+
+    class Config(BypassInitConfig):
+        pass
+
+    def __init__(self, x):
+        self.x = x + 1
+
+
+@dataclass
+class LazyWithOwnInit(DataClassDictMixin):
+    x: int
+
+    class Config(BypassInitConfig):
+        lazy_compilation = True
+
+    def __init__(self, x):
+        self.x = x + 1
+
+
+@dataclass
+class WithoutInitField(DataClassDictMixin):
+    x: int
+    y: int = field(default=0, init=False)
+
+    class Config(BypassInitConfig):
+        pass
+
+
+def test_bypass_init_from_dict(mocker):
+    mocker.patch.object(Item, "__init__", side_effect=AssertionError)
+    obj = Item.from_dict({"x": 1, "tags": ["a"]})
+    assert (obj.x, obj.y, obj.tags) == (1, 1, ["a"])
+    obj = Item.from_dict({"x": 1, "y": None})
+    assert (obj.x, obj.y, obj.tags) == (1, None, [])
+    assert Item.from_dict({"x": 1}).tags is not obj.tags
+    assert list(vars(obj)) == ["x", "y", "tags"]
+    with pytest.raises(MissingField):
+        Item.from_dict({})
+
+
+def test_bypass_init_frozen_and_nested():
+    obj = FrozenItem.from_dict({"x": 1, "items": [{"x": 2}]})
+    assert obj.x == 1
+    assert obj.items[0].x == 2
+    assert FrozenItem.from_dict(obj.to_dict()) == obj
+
+
+def test_bypass_init_slots():
+    assert SlotsItem.from_dict({"x": 1, "y": 2}) == SlotsItem(1, 2)
+    obj = SlotsOnDictBase.from_dict({"x": 1})
+    assert (obj.x, obj.y) == (1, 2)
+    assert vars(obj) == {"y": 2}
+
+
+def test_bypass_init_positional():
+    obj = PositionalItem(1)
+    assert PositionalItem.from_dict(obj.to_dict()) == obj
+
+
+def test_bypass_init_many():
+    assert Item.from_dict_many([{"x": 1}, {"x": 2}])[1].x == 2
+
+
+def test_init_is_not_bypassed():
+    assert CodeBuilder(Item).can_bypass_init()
+    assert WithPostInit.from_dict({"x": 1}).x == 2
+    assert WithInitVar.from_dict({"x": 1}) == WithInitVar(1)
+    assert WithoutInitField.from_dict({"x": 1}) == WithoutInitField(1)
+    assert WithOwnInit.from_dict({"x": 1}).x == 2
+    assert LazyWithOwnInit.from_dict({"x": 1}).x == 2
+    for cls in (
+        WithPostInit,
+        WithInitVar,
+        WithoutInitField,
+        WithOwnInit,
+        LazyWithOwnInit,
+    ):
+        assert not CodeBuilder(cls).can_bypass_init()
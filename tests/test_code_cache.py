@@ -0,0 +1,116 @@
+import os
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional, Union
+
+from mashumaro import DataClassDictMixin, field_options
+from mashumaro.config import BaseConfig
+from mashumaro.serializer.base.code_cache import CACHE_FILE_SUFFIX
+from mashumaro.serializer.base.metaprogramming import CodeBuilder
+
+from .entities import MyDataClass
+
+
+def cached_files(cache_dir):
+    return [f for f in os.listdir(cache_dir) if f.endswith(CACHE_FILE_SUFFIX)]
+
+
+def make_dataclass(cache_dir):
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int
+        y: List[MyDataClass]
+        z: Union[int, str]
+        d: Optional[datetime] = None
+
+        class Config(BaseConfig):
+            code_cache_dir = str(cache_dir)
+
+    return DataClass
+
+
+def test_code_cache_is_written(tmp_path):
+    make_dataclass(tmp_path)
+    assert len(cached_files(tmp_path)) == 2
+
+
+def test_code_cache_hit_skips_code_generation(tmp_path, mocker):
+    make_dataclass(tmp_path)
+    compile_ = mocker.patch.object(CodeBuilder, "compile")
+    DataClass = make_dataclass(tmp_path)
+    compile_.assert_not_called()
+    dumped = {
+        "x": 1,
+        "y": [{"a": 1, "b": 2}],
+        "z": "a",
+        "d": "2021-01-02T03:04:05",
+    }
+    instance = DataClass(
+        x=1,
+        y=[MyDataClass(1, 2)],
+        z="a",
+        d=datetime(2021, 1, 2, 3, 4, 5),
+    )
+    assert DataClass.from_dict(dumped) == instance
+    assert instance.to_dict() == dumped
+
+
+def test_code_cache_key_depends_on_class_definition(tmp_path):
+    make_dataclass(tmp_path)
+
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: str
+
+        class Config(BaseConfig):
+            code_cache_dir = str(tmp_path)
+
+    assert len(cached_files(tmp_path)) == 4
+    assert DataClass.from_dict({"x": "1"}) == DataClass("1")
+
+
+def test_code_cache_is_not_used_with_user_callables(tmp_path):
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int = field(metadata=field_options(serialize=lambda v: v * 2))
+
+        class Config(BaseConfig):
+            code_cache_dir = str(tmp_path)
+
+    assert DataClass(1).to_dict() == {"x": 2}
+    assert cached_files(tmp_path) == []
+
+
+def test_corrupted_code_cache_is_ignored(tmp_path):
+    make_dataclass(tmp_path)
+    for filename in cached_files(tmp_path):
+        with open(os.path.join(tmp_path, filename), "wb") as f:
+            f.write(b"garbage")
+    DataClass = make_dataclass(tmp_path)
+    assert DataClass.from_dict({"x": 1, "y": [], "z": 1}) == DataClass(
+        1, [], 1
+    )
+
+
+def make_enum_dataclass(cache_dir, color_type):
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Union[int, color_type]
+
+        class Config(BaseConfig):
+            code_cache_dir = str(cache_dir)
+
+    return DataClass
+
+
+def test_code_cache_key_depends_on_enum_value_types(tmp_path, monkeypatch):
+    # the generated code refers to the enum by the module attribute
+    for values in ({"a": 1}, {"a": "1"}):
+        Color = Enum("Color", values, module=__name__)
+        monkeypatch.setattr(sys.modules[__name__], "Color", Color, False)
+        DataClass = make_enum_dataclass(tmp_path, Color)
+    assert len(cached_files(tmp_path)) == 4
+    assert DataClass.from_dict({"x": "1"}) == DataClass(Color.a)
+    assert DataClass.from_dict({"x": 1}) == DataClass(1)
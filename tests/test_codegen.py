@@ -0,0 +1,107 @@
+import importlib
+import os
+import subprocess
+import sys
+import uuid
+
+import pytest
+
+import mashumaro
+from mashumaro.serializer.base.metaprogramming import CodeBuilder
+
+MODELS = """
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional, Union
+
+from mashumaro import DataClassDictMixin, field_options
+
+
+@dataclass
+class Inner(DataClassDictMixin):
+    x: int
+
+
+@dataclass
+class Outer(DataClassDictMixin):
+    inner: List[Inner]
+    u: Union[int, str]
+    dt: Optional[datetime] = None
+
+    @dataclass
+    class Nested(DataClassDictMixin):
+        y: str
+
+
+@dataclass
+class WithCallable(DataClassDictMixin):
+    x: int = field(metadata=field_options(serialize=lambda v: v * 2))
+"""
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    name = f"codegen_{uuid.uuid4().hex}"
+    package_dir = tmp_path / name
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "models.py").write_text(MODELS)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+    for module_name in list(sys.modules):
+        if module_name.startswith(name):
+            del sys.modules[module_name]
+
+
+def run_codegen(module_name):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(mashumaro.__file__)), *sys.path]
+    )
+    return subprocess.run(
+        [sys.executable, "-m", "mashumaro.codegen", module_name],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+
+def compiled_classes(compile_):
+    return [call[0][0].cls.__name__ for call in compile_.call_args_list]
+
+
+def test_generated_module_is_used(package, tmp_path, mocker):
+    result = run_codegen(package)
+    generated_path = tmp_path / package / "_mashumaro_models.py"
+    assert generated_path.exists()
+    assert str(generated_path) in result.stdout
+    assert "WithCallable" in result.stderr
+
+    compile_ = mocker.spy(CodeBuilder, "compile")
+    models = importlib.import_module(f"{package}.models")
+    assert compiled_classes(compile_) == ["WithCallable"] * 2
+
+    dumped = {"inner": [{"x": 1}], "u": "a", "dt": "2021-01-01T00:00:00"}
+    instance = models.Outer.from_dict(dumped)
+    assert instance.inner == [models.Inner(1)]
+    assert instance.to_dict() == dumped
+    assert models.Outer.Nested.from_dict({"y": "b"}).to_dict() == {"y": "b"}
+    assert models.WithCallable(1).to_dict() == {"x": 2}
+
+
+def test_stale_generated_code_is_not_used(package, tmp_path, mocker):
+    run_codegen(package)
+    models_path = tmp_path / package / "models.py"
+    models_path.write_text(
+        MODELS.replace("    x: int\n", "    x: int\n    z: int = 0\n", 1)
+    )
+
+    compile_ = mocker.spy(CodeBuilder, "compile")
+    models = importlib.import_module(f"{package}.models")
+    assert compiled_classes(compile_) == ["Inner"] * 2 + ["WithCallable"] * 2
+    assert models.Inner.from_dict({"x": 1, "z": 2}).to_dict() == {
+        "x": 1,
+        "z": 2,
+    }
@@ -0,0 +1,157 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional
+
+import numpy
+import pytest
+
+from mashumaro import DataClassDictMixin
+from mashumaro.exceptions import (
+    InvalidFieldValue,
+    MissingField,
+    UnserializableDataError,
+)
+
+from .entities import MyEnum
+
+
+@dataclass
+class Record(DataClassDictMixin):
+    x: int
+    ratio: float
+    day: date
+    created: Optional[datetime] = None
+    kind: MyEnum = MyEnum.a
+    tags: List[str] = field(default_factory=list)
+    flag: bool = False
+
+
+@dataclass
+class SubRecord(Record):
+    y: int = 0
+
+
+@dataclass
+class RecordWithHook(DataClassDictMixin):
+    x: int
+
+    @classmethod
+    def __pre_deserialize__(cls, d):
+        return d  # pragma no cover
+
+
+RECORDS = [
+    Record(1, 0.5, date(2021, 1, 1), datetime(2021, 1, 1, 12)),
+    Record(2, 1.5, date(2021, 1, 2), kind=MyEnum.b, tags=["a"], flag=True),
+]
+COLUMNS = {
+    "x": [1, 2],
+    "ratio": [0.5, 1.5],
+    "day": ["2021-01-01", "2021-01-02"],
+    "created": ["2021-01-01T12:00:00", None],
+    "kind": ["letter a", "letter b"],
+    "tags": [[], ["a"]],
+    "flag": [False, True],
+}
+
+
+def test_to_columns():
+    assert Record.to_columns(RECORDS) == COLUMNS
+    assert Record.to_columns(iter(RECORDS)) == COLUMNS
+    assert Record.to_columns([SubRecord(1, 0.5, date(2021, 1, 1))]) == {
+        "x": [1],
+        "ratio": [0.5],
+        "day": ["2021-01-01"],
+        "created": [None],
+        "kind": ["letter a"],
+        "tags": [[]],
+        "flag": [False],
+    }
+
+
+def test_from_columns():
+    assert Record.from_columns(COLUMNS) == RECORDS
+    assert Record.from_columns(
+        {"x": (1,), "ratio": [2], "day": ["2021-01-01"]}
+    )
+    assert Record.from_columns(
+        {"x": [1, 2], "ratio": [0, 0], "day": ["2021-01-01"] * 2}
+    ) == [Record(1, 0, date(2021, 1, 1)), Record(2, 0, date(2021, 1, 1))]
+
+
+def test_from_columns_defaults_are_not_shared():
+    records = Record.from_columns(
+        {"x": [1, 2], "ratio": [0, 0], "day": ["2021-01-01"] * 2}
+    )
+    assert records[0].tags is not records[1].tags
+
+
+def test_columns_with_flags():
+    columns = Record.to_columns(RECORDS, use_enum=True, use_datetime=True)
+    assert columns["kind"] == [MyEnum.a, MyEnum.b]
+    assert columns["created"] == [datetime(2021, 1, 1, 12), None]
+    assert Record.from_columns(columns, use_enum=True, use_datetime=True) == (
+        RECORDS
+    )
+
+
+def test_from_columns_errors():
+    with pytest.raises(MissingField):
+        Record.from_columns({"x": [1], "ratio": [1]})
+    with pytest.raises(InvalidFieldValue) as exc_info:
+        Record.from_columns({**COLUMNS, "x": [1, "a"]})
+    assert exc_info.value.field_value == "a"
+    with pytest.raises(ValueError):
+        Record.from_columns({**COLUMNS, "x": [1]})
+
+
+def test_columns_with_row_hooks():
+    with pytest.raises(UnserializableDataError):
+        RecordWithHook.from_columns({"x": [1]})
+    assert RecordWithHook.to_columns([RecordWithHook(1)]) == {"x": [1]}
+
+
+def test_numpy_columns():
+    columns = Record.to_columns(RECORDS, use_numpy=True)
+    assert columns["x"].dtype == numpy.int64
+    assert columns["ratio"].dtype == numpy.float64
+    assert columns["flag"].dtype == numpy.bool_
+    assert columns["day"].dtype == numpy.dtype("datetime64[D]")
+    assert columns["created"] == COLUMNS["created"]
+    assert columns["tags"] == COLUMNS["tags"]
+    assert Record.from_columns(columns) == RECORDS
+
+
+@dataclass
+class Event(DataClassDictMixin):
+    at: datetime
+
+
+def test_numpy_columns_with_aware_datetime():
+    tz = timezone(timedelta(hours=3))
+    events = [
+        Event(datetime(2021, 1, 1, 12)),
+        Event(datetime(2021, 1, 1, tzinfo=tz)),
+    ]
+    columns = Event.to_columns(events, use_numpy=True)
+    assert columns == {
+        "at": ["2021-01-01T12:00:00", "2021-01-01T00:00:00+03:00"]
+    }
+    loaded = Event.from_columns(columns)
+    assert loaded == events
+    assert loaded[1].at.tzinfo == tz
+    columns = Event.to_columns(events[:1], use_numpy=True)
+    assert columns["at"].dtype == numpy.dtype("datetime64[us]")
+    assert Event.from_columns(columns) == events[:1]
+
+
+def test_from_numpy_columns():
+    columns = {
+        **COLUMNS,
+        "x": numpy.array([1, 2], dtype="int32"),
+        "day": numpy.array(
+            ["2021-01-01", "2021-01-02"], dtype="datetime64[ns]"
+        ),
+        "created": numpy.array(["2021-01-01T12:00:00", None], dtype=object),
+    }
+    assert Record.from_columns(columns) == RECORDS
@@ -1042,3 +1042,46 @@ def test_serializable_type_dataclass():
     s_value = SerializableTypeDataClass(a=9, b=9)
     assert DataClass.from_dict({"s": {"a": 10, "b": 10}}) == DataClass(s_value)
     assert DataClass(s_value).to_dict() == {"s": {"a": 10, "b": 10}}
+
+
+class EnumWithMissing(Enum):
+    a = "a"
+    b = "b"
+
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, str):
+            return cls.__members__.get(value.lower())
+
+
+class EnumWithUnhashableValues(Enum):
+    a = [1]
+    b = [2]
+
+
+def test_enum_value_lookup():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        flags: List[MyFlag]
+        int_flags: List[MyIntFlag]
+        int_enums: List[MyIntEnum]
+        missing: List[EnumWithMissing]
+        unhashable: List[EnumWithUnhashableValues]
+
+    dumped = {
+        "flags": [1, 3, 0],
+        "int_flags": [2, 3, 0],
+        "int_enums": [1, 2],
+        "missing": ["a", "B"],
+        "unhashable": [[2]],
+    }
+    assert DataClass.from_dict(dumped) == DataClass(
+        flags=[MyFlag.a, MyFlag.a | MyFlag.b, MyFlag(0)],
+        int_flags=[MyIntFlag.b, MyIntFlag.a | MyIntFlag.b, MyIntFlag(0)],
+        int_enums=[MyIntEnum.a, MyIntEnum.b],
+        missing=[EnumWithMissing.a, EnumWithMissing.b],
+        unhashable=[EnumWithUnhashableValues.b],
+    )
+    for value in (3, [1]):
+        with pytest.raises(InvalidFieldValue):
+            DataClass.from_dict({**dumped, "int_enums": [value]})
@@ -0,0 +1,169 @@
+import json
+import os
+from dataclasses import dataclass
+from typing import List
+
+import msgpack
+import pytest
+
+from mashumaro import (
+    DataClassJSONMixin,
+    DataClassMessagePackMixin,
+    DataClassYAMLMixin,
+    FileCache,
+)
+
+
+@dataclass
+class Fixture(
+    DataClassJSONMixin, DataClassMessagePackMixin, DataClassYAMLMixin
+):
+    x: List[int]
+
+
+@dataclass
+class OtherFixture(DataClassJSONMixin):
+    x: List[int]
+
+
+def write(path, data, mtime_ns=None):
+    mode = "wb" if isinstance(data, bytes) else "w"
+    with open(path, mode) as f:
+        f.write(data)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def json_path(tmp_path):
+    path = tmp_path / "fixture.json"
+    write(path, '{"x": [1]}', 10 ** 18)
+    return path
+
+
+def test_from_file_without_cache(tmp_path):
+    json_path = tmp_path / "fixture.json"
+    yaml_path = tmp_path / "fixture.yaml"
+    msgpack_path = tmp_path / "fixture.msgpack"
+    write(json_path, '{"x": [1]}')
+    write(yaml_path, "x: [1]")
+    write(msgpack_path, msgpack.packb({"x": [1]}))
+    assert Fixture.from_json_file(json_path) == Fixture([1])
+    assert Fixture.from_json_file(str(json_path)) == Fixture([1])
+    assert Fixture.from_yaml_file(yaml_path) == Fixture([1])
+    assert Fixture.from_msgpack_file(msgpack_path) == Fixture([1])
+    assert Fixture.from_json_file(json_path) is not Fixture.from_json_file(
+        json_path
+    )
+
+
+def test_from_file_with_cache(tmp_path):
+    cache = FileCache()
+    for suffix, data, method in (
+        ("json", '{"x": [1]}', Fixture.from_json_file),
+        ("yaml", "x: [1]", Fixture.from_yaml_file),
+        ("msgpack", msgpack.packb({"x": [1]}), Fixture.from_msgpack_file),
+    ):
+        path = tmp_path / f"fixture.{suffix}"
+        write(path, data)
+        obj = method(path, cache)
+        assert obj == Fixture([1])
+        assert method(path, cache) is obj
+    assert len(cache) == 3
+
+
+def test_cache_reloads_changed_file(json_path):
+    cache = FileCache()
+    obj = Fixture.from_json_file(json_path, cache)
+    write(json_path, '{"x": [1, 2]}', 10 ** 18)
+    assert Fixture.from_json_file(json_path, cache) == Fixture([1, 2])
+    obj = Fixture.from_json_file(json_path, cache)
+    # the same size but another modification time
+    write(json_path, '{"x": [3, 4]}', 2 * 10 ** 18)
+    assert Fixture.from_json_file(json_path, cache) == Fixture([3, 4])
+    assert obj == Fixture([1, 2])
+    assert len(cache) == 1
+
+
+def test_cache_with_hash(json_path):
+    cache = FileCache(use_hash=True)
+    obj = Fixture.from_json_file(json_path, cache)
+    write(json_path, '{"x": [1]}', 2 * 10 ** 18)
+    assert Fixture.from_json_file(json_path, cache) is obj
+    # the same size and modification time but another content
+    write(json_path, '{"x": [2]}', 2 * 10 ** 18)
+    assert Fixture.from_json_file(json_path, cache) == Fixture([2])
+
+
+def test_cache_keys(json_path):
+    cache = FileCache()
+    obj = Fixture.from_json_file(json_path, cache)
+    other = OtherFixture.from_json_file(json_path, cache)
+    assert other == OtherFixture([1])
+    with_params = Fixture.from_json_file(
+        json_path, cache, dict_params={"use_bytes": True}
+    )
+    assert with_params == obj and with_params is not obj
+    assert Fixture.from_json_file(json_path, cache) is obj
+    assert len(cache) == 3
+
+
+def select_keys(data, keys):
+    d = json.loads(data)
+    return {k: d[k] for k in keys}
+
+
+def test_cache_with_unhashable_options(json_path):
+    cache = FileCache()
+    obj = Fixture.from_json_file(
+        json_path, cache, decoder=select_keys, keys=["x"]
+    )
+    assert obj == Fixture([1])
+    other = Fixture.from_json_file(
+        json_path, cache, decoder=select_keys, keys=["x"]
+    )
+    assert other == obj and other is not obj
+    assert len(cache) == 0
+
+
+def test_cache_eviction(tmp_path):
+    cache = FileCache(maxsize=2)
+    paths = [tmp_path / f"fixture{i}.json" for i in range(3)]
+    for i, path in enumerate(paths):
+        write(path, f'{{"x": [{i}]}}')
+    objs = [Fixture.from_json_file(path, cache) for path in paths[:2]]
+    assert Fixture.from_json_file(paths[0], cache) is objs[0]
+    Fixture.from_json_file(paths[2], cache)
+    assert len(cache) == 2
+    assert Fixture.from_json_file(paths[0], cache) is objs[0]
+    assert Fixture.from_json_file(paths[1], cache) is not objs[1]
+
+
+def test_cache_invalidation(tmp_path, json_path):
+    cache = FileCache()
+    other_path = tmp_path / "other.json"
+    write(other_path, '{"x": [2]}')
+    obj = Fixture.from_json_file(json_path, cache)
+    OtherFixture.from_json_file(json_path, cache)
+    other_obj = Fixture.from_json_file(other_path, cache)
+    cache.invalidate(json_path)
+    assert len(cache) == 1
+    assert Fixture.from_json_file(json_path, cache) is not obj
+    assert Fixture.from_json_file(other_path, cache) is other_obj
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_cache_does_not_store_errors(json_path):
+    cache = FileCache()
+    write(json_path, '{"x": "a"}')
+    with pytest.raises(ValueError):
+        Fixture.from_json_file(json_path, cache)
+    assert len(cache) == 0
+    with pytest.raises(FileNotFoundError):
+        Fixture.from_json_file(json_path.with_name("missing.json"), cache)
+
+
+def test_cache_maxsize():
+    with pytest.raises(ValueError):
+        FileCache(maxsize=0)
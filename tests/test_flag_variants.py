@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+from mashumaro import DataClassDictMixin
+from mashumaro.config import TO_DICT_ADD_OMIT_NONE_FLAG, BaseConfig
+from mashumaro.serializer.base.metaprogramming import CodeBuilder
+
+DT = datetime(2021, 1, 1)
+
+
+@dataclass
+class Inner(DataClassDictMixin):
+    x: Optional[datetime] = None
+
+
+@dataclass
+class Outer(DataClassDictMixin):
+    inner: List[Inner]
+    y: Optional[int] = None
+
+    class Config(BaseConfig):
+        code_generation_options = [TO_DICT_ADD_OMIT_NONE_FLAG]
+
+
+@dataclass
+class Base(DataClassDictMixin):
+    x: datetime
+
+
+@dataclass
+class Derived(Base):
+    y: int = 0
+
+
+@dataclass
+class Holder(DataClassDictMixin):
+    item: Base
+
+
+def test_variant_is_compiled_once_per_flag_combination(mocker):
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: datetime
+
+    compile_ = mocker.spy(CodeBuilder, "compile")
+    assert DataClass(DT).to_dict() == {"x": DT.isoformat()}
+    assert compile_.call_count == 0
+    assert DataClass(DT).to_dict(use_datetime=True) == {"x": DT}
+    assert compile_.call_count == 1
+    assert DataClass(DT).to_dict(use_datetime=1) == {"x": DT}
+    assert DataClass.from_dict({"x": DT}, use_datetime=True) == DataClass(DT)
+    assert DataClass.from_dict({"x": DT}, use_datetime="yes") == DataClass(DT)
+    assert compile_.call_count == 2
+
+
+def test_generated_code_has_no_flag_checks():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: datetime
+
+    builder = CodeBuilder(DataClass)
+    builder.add_to_dict("00100")
+    assert "use_datetime" not in builder.sources[-1]
+    assert "isoformat" not in builder.sources[-1]
+
+
+def test_flags_are_passed_to_nested_variants():
+    instance = Outer([Inner(DT), Inner()])
+    assert instance.to_dict(use_datetime=True, omit_none=True) == {
+        "inner": [{"x": DT}, {"x": None}]
+    }
+    assert Outer.from_dict({"inner": [{"x": DT}]}, use_datetime=True) == Outer(
+        [Inner(DT)]
+    )
+
+
+def test_subclass_uses_own_variants():
+    assert Holder(Derived(DT, 1)).to_dict(use_datetime=True) == {
+        "item": {"x": DT, "y": 1}
+    }
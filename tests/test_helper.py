@@ -8,6 +8,7 @@ def test_field_options_helper():
         "deserialize": None,
         "serialization_strategy": None,
         "alias": None,
+        "discriminator": None,
     }
 
     def serialize(x):
@@ -25,15 +26,18 @@ def test_field_options_helper():
 
     serialization_strategy = TestSerializationStrategy()
     alias = "alias"
+    discriminator = "type"
 
     assert field_options(
         serialize=serialize,
         deserialize=deserialize,
         serialization_strategy=serialization_strategy,
         alias=alias,
+        discriminator=discriminator,
     ) == {
         "serialize": serialize,
         "deserialize": deserialize,
         "serialization_strategy": serialization_strategy,
         "alias": alias,
+        "discriminator": discriminator,
     }
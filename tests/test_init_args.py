@@ -0,0 +1,85 @@
+from dataclasses import InitVar, dataclass, field
+from typing import Optional
+
+from mashumaro import DataClassDictMixin
+from mashumaro.config import BaseConfig
+from mashumaro.serializer.base.metaprogramming import CodeBuilder
+
+
+@dataclass
+class Point(DataClassDictMixin):
+    x: int
+    y: int
+    label: Optional[str] = None
+
+
+@dataclass
+class Point3D(Point):
+    z: int = 0
+
+
+@dataclass
+class WithInitVar(DataClassDictMixin):
+    x: int
+    scale: InitVar[int]
+    y: int
+
+    def __post_init__(self, scale):
+        self.x *= scale
+
+
+@dataclass
+class WithoutInitField(DataClassDictMixin):
+    x: int
+    y: int = field(default=0, init=False)
+    z: int = 0
+
+    def __post_init__(self):
+        self.y = self.x + 1
+
+
+@dataclass
+class WithOwnInit(DataClassDictMixin):
+    x: int
+    y: int
+
+    def __init__(self, y, x):
+        self.x = x
+        self.y = y
+
+
+@dataclass
+class LazyWithOwnInit(DataClassDictMixin):
+    x: int
+    y: int
+
+    class Config(BaseConfig):
+        lazy_compilation = True
+
+    def __init__(self, y, x):
+        self.x = x
+        self.y = y
+
+
+def test_init_arg_names():
+    assert CodeBuilder(Point).get_init_arg_names() == ["x", "y"]
+    assert CodeBuilder(Point3D).get_init_arg_names() == ["x", "y"]
+    assert CodeBuilder(WithInitVar).get_init_arg_names() == ["x"]
+    assert CodeBuilder(WithoutInitField).get_init_arg_names() == ["x"]
+    assert CodeBuilder(WithOwnInit).get_init_arg_names() == []
+    assert CodeBuilder(LazyWithOwnInit).get_init_arg_names() == []
+
+
+def test_from_dict_with_positional_init_args():
+    assert Point.from_dict({"x": 1, "y": 2}) == Point(1, 2)
+    assert Point.from_dict({"x": 1, "y": 2, "label": "a"}) == Point(1, 2, "a")
+    assert Point3D.from_dict({"x": 1, "y": 2, "z": 3}) == Point3D(1, 2, z=3)
+    assert Point.from_dict_many([{"x": 1, "y": None}]) == [Point(1, None)]
+
+
+def test_from_dict_with_keyword_init_args():
+    obj = WithOwnInit.from_dict({"x": 1, "y": 2})
+    assert (obj.x, obj.y) == (1, 2)
+    obj = LazyWithOwnInit.from_dict({"x": 1, "y": 2})
+    assert (obj.x, obj.y) == (1, 2)
+    assert WithoutInitField.from_dict({"x": 1, "z": 3}).y == 2
@@ -0,0 +1,219 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional, Union
+
+import pytest
+
+from mashumaro import DataClassDictMixin, field_options
+from mashumaro.config import BaseConfig
+from mashumaro.exceptions import InvalidFieldValue, MissingField
+from mashumaro.serializer.base.metaprogramming import CodeBuilder
+
+
+class InlineConfig(BaseConfig):
+    inline_nested_depth = 2
+
+
+@dataclass
+class Point(DataClassDictMixin):
+    x: int
+    y: int = 0
+    tags: List[str] = field(default_factory=list)
+    created: Optional[datetime] = field(
+        default=None, metadata=field_options(alias="ts")
+    )
+
+
+@dataclass
+class Point3D(Point):
+    z: int = 0
+
+
+@dataclass
+class Segment(DataClassDictMixin):
+    start: Point
+    end: Point
+
+
+@dataclass
+class Polyline(DataClassDictMixin):
+    segments: List[Segment]
+
+    class Config(BaseConfig):
+        inline_nested_depth = 1
+
+
+@dataclass
+class Shape(DataClassDictMixin):
+    points: List[Point]
+    label: Optional[Segment] = None
+
+    class Config(InlineConfig):
+        pass
+
+
+@dataclass
+class Node(DataClassDictMixin):
+    value: int
+    children: List["Node"]
+
+    class Config(InlineConfig):
+        pass
+
+
+@dataclass
+class WithUnion(DataClassDictMixin):
+    x: Union[int, str]
+
+
+@dataclass
+class UnionHolder(DataClassDictMixin):
+    items: List[WithUnion]
+
+    class Config(InlineConfig):
+        pass
+
+
+@dataclass
+class NotInlinedShape(DataClassDictMixin):
+    points: List[Point]
+    label: Optional[Segment] = None
+
+
+@dataclass
+class TrustedPoint(DataClassDictMixin):
+    x: float
+
+    class Config(BaseConfig):
+        trusted_input = True
+
+
+@dataclass
+class BypassInitPoint(DataClassDictMixin):
+    x: int
+
+    class Config(BaseConfig):
+        bypass_init = True
+
+
+@dataclass
+class ConfiguredHolder(DataClassDictMixin):
+    trusted: TrustedPoint
+    bypass_init: BypassInitPoint
+
+    class Config(InlineConfig):
+        pass
+
+
+def test_nested_code_is_inlined(mocker):
+    dumped = {
+        "points": [{"x": 1, "y": 2, "tags": ["a"], "ts": None}, {"x": 3}],
+        "label": {"start": {"x": 1}, "end": {"x": 2, "y": 3}},
+    }
+    from_dict = mocker.spy(Point, "from_dict")
+    to_dict = mocker.spy(Point, "to_dict")
+    instance = Shape.from_dict(dumped)
+    assert instance == Shape(
+        [Point(1, 2, ["a"]), Point(3)],
+        Segment(Point(1), Point(2, 3)),
+    )
+    assert instance.to_dict() == {
+        "points": [
+            {"x": 1, "y": 2, "tags": ["a"], "created": None},
+            {"x": 3, "y": 0, "tags": [], "created": None},
+        ],
+        "label": {
+            "start": {"x": 1, "y": 0, "tags": [], "created": None},
+            "end": {"x": 2, "y": 3, "tags": [], "created": None},
+        },
+    }
+    from_dict.assert_not_called()
+    to_dict.assert_not_called()
+
+
+def test_nested_code_is_inlined_with_flags():
+    dt = datetime(2021, 1, 1)
+    instance = Shape([Point(1, created=dt)])
+    dumped = {
+        "points": [{"x": 1, "y": 0, "tags": [], "created": dt}],
+        "label": None,
+    }
+    assert instance.to_dict(use_datetime=True) == dumped
+    dumped["points"][0]["ts"] = dumped["points"][0].pop("created")
+    assert Shape.from_dict(dumped, use_datetime=True) == instance
+
+
+def test_inlining_depth_is_limited(mocker):
+    from_dict = mocker.spy(Point, "from_dict")
+    to_dict = mocker.spy(Point, "to_dict")
+    segment = {"start": {"x": 1}, "end": {"x": 2}}
+    instance = Polyline.from_dict({"segments": [segment]})
+    assert instance == Polyline([Segment(Point(1), Point(2))])
+    assert from_dict.call_count == 2
+    instance.to_dict()
+    assert to_dict.call_count == 2
+
+
+def test_subclass_instance_is_not_inlined():
+    assert Shape([Point3D(1, z=2)]).to_dict()["points"] == [
+        {"x": 1, "y": 0, "tags": [], "created": None, "z": 2}
+    ]
+
+
+def test_recursive_type_is_not_inlined():
+    dumped = {"value": 1, "children": [{"value": 2, "children": []}]}
+    assert Node.from_dict(dumped) == Node(1, [Node(2, [])])
+    assert Node.from_dict(dumped).to_dict() == dumped
+
+
+def test_class_with_union_is_not_inlined(mocker):
+    from_dict = mocker.spy(WithUnion, "from_dict")
+    dumped = {"items": [{"x": 1}, {"x": "a"}]}
+    assert UnionHolder.from_dict(dumped).to_dict() == dumped
+    assert from_dict.call_count == 2
+
+
+def test_inlined_code_depends_on_nested_class_shape():
+    builder = CodeBuilder(Shape)
+    fingerprint = builder.get_code_fingerprint("from_dict")
+    assert fingerprint is not None
+    assert repr(CodeBuilder(Point).get_shape()) in repr(builder.get_shape(2))
+
+
+def get_error(cls, d, trusted):
+    with pytest.raises(Exception) as exc_info:
+        cls.from_dict(d, trusted=trusted)
+    e = exc_info.value
+    return type(e), str(e).replace(cls.__name__, ""), type(e.__context__)
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+@pytest.mark.parametrize(
+    "dumped",
+    [
+        {"points": [{"y": 1}]},
+        {"points": [1]},
+        {"points": [{"x": 1, "ts": "a"}]},
+        {"points": [], "label": {"start": {}, "end": {"x": 1}}},
+        {"points": [], "label": {"start": [1], "end": {"x": 1}}},
+        {"points": [], "label": {"start": {"x": 1}}},
+        {"points": [], "label": 1},
+    ],
+)
+def test_inlined_code_raises_the_same_errors(dumped, trusted):
+    error = get_error(Shape, dumped, trusted)
+    assert error == get_error(NotInlinedShape, dumped, trusted)
+    assert error[0] in (InvalidFieldValue, MissingField, ValueError)
+
+
+def test_nested_class_options_are_kept(mocker):
+    from_dict = mocker.spy(TrustedPoint, "from_dict")
+    dumped = {"trusted": {"x": 1}, "bypass_init": {"x": 2}}
+    init = mocker.patch.object(
+        BypassInitPoint, "__init__", side_effect=AssertionError
+    )
+    instance = ConfiguredHolder.from_dict(dumped)
+    assert type(instance.trusted.x) is int
+    assert instance.bypass_init.x == 2
+    from_dict.assert_called_once()
+    init.assert_not_called()
@@ -1,14 +1,23 @@
+import io
 import json
+import math
+import uuid
 from binascii import hexlify
-from dataclasses import dataclass
-from datetime import datetime
-from typing import List
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from functools import partial
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import pytest
 
-from mashumaro import DataClassJSONMixin, MissingField
+from mashumaro import DataClassJSONMixin, MissingField, field_options
+from mashumaro.config import BaseConfig
+from mashumaro.exceptions import InvalidFieldValue
+from mashumaro.serializer.base.metaprogramming import TO_JSON, CodeBuilder
+from mashumaro.serializer.json import JSON_BACKEND_NAMES, JSON_BACKENDS
 
-from .entities import MyEnum
+from .entities import MyDataClass, MyEnum, MyIntEnum, MyStrEnum
 
 
 def test_to_json():
@@ -251,3 +260,629 @@ def test_json_use_datetime(use_datetime):
             )
             == instance
         )
+
+
+@dataclass
+class StreamItem(DataClassJSONMixin):
+    x: int
+    tags: List[str]
+    created: Optional[datetime] = None
+
+
+STREAM_ITEMS = [
+    StreamItem(123, ["a", "b"], datetime(2021, 1, 1)),
+    StreamItem(-4, ['"]', "юникод"]),
+    StreamItem(5, []),
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 65536])
+@pytest.mark.parametrize("binary", [False, True])
+def test_iter_from_json_array(chunk_size, binary):
+    dumped = json.dumps([i.to_dict() for i in STREAM_ITEMS], indent=2)
+    fp = io.BytesIO(dumped.encode()) if binary else io.StringIO(dumped)
+    assert (
+        list(StreamItem.iter_from_json(fp, chunk_size=chunk_size))
+        == STREAM_ITEMS
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+def test_iter_from_json_path(chunk_size):
+    dumped = json.dumps(
+        {
+            "meta": {"items": [1], "count": 3},
+            "data": {
+                "total": 1.5,
+                "items": [i.to_dict() for i in STREAM_ITEMS],
+                "next": None,
+            },
+        }
+    )
+    items = StreamItem.iter_from_json(
+        io.StringIO(dumped), "data.items", chunk_size=chunk_size
+    )
+    assert list(items) == STREAM_ITEMS
+    items = StreamItem.iter_from_json(
+        io.StringIO(dumped), ["data", "items"], chunk_size=chunk_size
+    )
+    assert list(items) == STREAM_ITEMS
+
+
+def test_iter_from_json_is_lazy():
+    fp = io.StringIO('[{"x": 1, "tags": []}, {"x": "a"}, !!!')
+    items = StreamItem.iter_from_json(fp, chunk_size=4)
+    assert next(items) == StreamItem(1, [])
+    with pytest.raises(InvalidFieldValue):
+        next(items)
+
+
+def test_iter_from_json_with_params():
+    dumped = '{"items": [{"x": 1, "tags": [], "created": 1}]}'
+    items = StreamItem.iter_from_json(
+        io.StringIO(dumped),
+        "items",
+        dict_params={"use_datetime": True},
+        parse_int=str,
+    )
+    assert list(items) == [StreamItem(1, [], "1")]
+
+
+@pytest.mark.parametrize(
+    "dumped,path",
+    [
+        ("[]", "items"),
+        ('{"item": []}', "items"),
+        ("{}", "items"),
+        ('{"items": {}}', "items"),
+        ('[{"x": 1, "tags": []} {"x": 2, "tags": []}]', ""),
+        ('[{"x": 1, "tags": []}', ""),
+        ('[{"x": 1, "tags": []},', ""),
+    ],
+)
+def test_iter_from_json_invalid_document(dumped, path):
+    with pytest.raises(json.JSONDecodeError):
+        list(StreamItem.iter_from_json(io.StringIO(dumped), path))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 65536])
+@pytest.mark.parametrize(
+    "dumped",
+    [
+        '[\n  {"x": 1, "tags": []},\n  {"x": 2, "tags": [}\n]',
+        '[\n  {"x": 1, "tags": []},\n  {"x": 2, "tags": []}\n  {"x": 3}]',
+        '[{"x": 1, "tags": []}, {"x": 2, "tags": ["a",\n]}]',
+    ],
+)
+def test_iter_from_json_error_position(dumped, chunk_size):
+    with pytest.raises(json.JSONDecodeError) as exc_info:
+        json.loads(dumped)
+    expected = exc_info.value
+    items = StreamItem.iter_from_json(
+        io.StringIO(dumped), chunk_size=chunk_size
+    )
+    with pytest.raises(json.JSONDecodeError) as exc_info:
+        list(items)
+    e = exc_info.value
+    assert (e.pos, e.lineno, e.colno) == (
+        expected.pos,
+        expected.lineno,
+        expected.colno,
+    )
+    assert str(e).endswith(f"line {e.lineno} column {e.colno} (char {e.pos})")
+
+
+def test_iter_from_json_empty_array():
+    assert list(StreamItem.iter_from_json(io.StringIO(" [ ] "))) == []
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_json_lines(binary):
+    fp = io.BytesIO() if binary else io.StringIO()
+    encoder = (lambda d: json.dumps(d).encode()) if binary else json.dumps
+    count = StreamItem.to_json_lines(
+        STREAM_ITEMS, fp, encoder=encoder, batch_size=2
+    )
+    assert count == 3
+    dumped = fp.getvalue()
+    assert dumped.count(b"\n" if binary else "\n") == 3
+    fp.seek(0)
+    assert list(StreamItem.from_json_lines(fp)) == STREAM_ITEMS
+
+
+def test_json_lines_with_params():
+    fp = io.StringIO()
+    StreamItem.to_json_lines(
+        STREAM_ITEMS[:1],
+        fp,
+        dict_params={"use_datetime": True},
+        default=lambda v: v.timestamp(),
+        sort_keys=True,
+    )
+    assert fp.getvalue().startswith('{"created": 1609')
+    fp.seek(0)
+    items = StreamItem.from_json_lines(
+        fp, dict_params={"use_datetime": True}, parse_float=str
+    )
+    assert isinstance(next(items).created, str)
+
+
+def test_from_json_lines_errors():
+    lines = [
+        '{"x": 1, "tags": []}\n',
+        "\n",
+        "{\n",
+        '{"x": "a", "tags": []}\n',
+        '{"x": 2, "tags": []}',
+    ]
+    errors = []
+    items = StreamItem.from_json_lines(lines, errors=errors)
+    assert list(items) == [StreamItem(1, []), StreamItem(2, [])]
+    assert [line_number for line_number, _ in errors] == [3, 4]
+    assert isinstance(errors[0][1], json.JSONDecodeError)
+    assert isinstance(errors[1][1], InvalidFieldValue)
+    with pytest.raises(json.JSONDecodeError):
+        list(StreamItem.from_json_lines(lines))
+
+
+class DirectConfig(BaseConfig):
+    direct_to_json = True
+
+
+@dataclass
+class DirectInner(DataClassJSONMixin):
+    name: str
+    score: float = 0.0
+
+    class Config(DirectConfig):
+        pass
+
+
+@dataclass
+class DirectInnerSubclass(DirectInner):
+    extra: int = 0
+
+
+@dataclass
+class DirectOuter(DataClassJSONMixin):
+    i: int
+    f: float
+    b: bool
+    s: str
+    dt: datetime
+    d: date
+    u: uuid.UUID
+    dec: Decimal
+    enum: MyEnum
+    int_enum: MyIntEnum
+    str_enum: MyStrEnum
+    inner: DirectInner
+    inners: List[DirectInner]
+    mapping: Dict[str, Set[int]]
+    tuple_: Tuple[int, ...]
+    any_: Any
+    union: Union[int, str]
+    other: MyDataClass
+    bytes_: bytes = b"\x00"
+    optional: Optional[float] = None
+    aliased: int = field(default=0, metadata=field_options(alias='al"ias'))
+
+    class Config(DirectConfig):
+        serialize_by_alias = True
+
+
+@dataclass
+class DirectWithHooks(DataClassJSONMixin):
+    x: int
+
+    def __pre_serialize__(self):
+        return DirectWithHooks(self.x * 2)
+
+    class Config(DirectConfig):
+        pass
+
+
+@dataclass
+class DirectWithPostHook(DataClassJSONMixin):
+    x: int
+
+    def __post_serialize__(self, d):
+        d["hooked"] = True
+        return d
+
+    class Config(DirectConfig):
+        pass
+
+
+@dataclass
+class LazyDirect(DataClassJSONMixin):
+    x: List[int]
+
+    class Config(DirectConfig):
+        lazy_compilation = True
+
+
+DIRECT_OUTER = DirectOuter(
+    i=1,
+    f=math.nan,
+    b=True,
+    s='"quoted" \\ \n юникод',
+    dt=datetime(2021, 1, 1, 12, 30, 1, 5),
+    d=date(2021, 1, 1),
+    u=uuid.UUID(int=1),
+    dec=Decimal("1.10"),
+    enum=MyEnum.a,
+    int_enum=MyIntEnum.b,
+    str_enum=MyStrEnum.b,
+    inner=DirectInnerSubclass("subclass", math.inf, 1),
+    inners=[DirectInner("a", -0.0), DirectInner("b", 1e100)],
+    mapping={"ключ": {1, 2}, "": set()},
+    tuple_=(1, 2),
+    any_={"x": [None, 1.5]},
+    union="1",
+    other=MyDataClass(1, 2),
+)
+
+
+def test_direct_to_json():
+    assert DIRECT_OUTER.to_json() == json.dumps(DIRECT_OUTER.to_dict())
+    assert DirectInner("x").to_json() == '{"name": "x", "score": 0.0}'
+
+
+def test_direct_to_json_with_none_values():
+    instance = DirectInner(None, None)  # type: ignore
+    assert instance.to_json() == '{"name": null, "score": null}'
+
+
+def test_direct_to_json_is_not_used_with_params():
+    instance = DirectInner("x")
+    assert instance.to_json(indent=2) == json.dumps(
+        instance.to_dict(), indent=2
+    )
+    assert instance.to_json(encoder=lambda d: "encoded") == "encoded"
+
+
+def test_direct_to_json_with_hooks():
+    assert DirectWithHooks(1).to_json() == '{"x": 2}'
+    assert DirectWithPostHook(1).to_json() == '{"x": 1, "hooked": true}'
+
+
+def test_direct_to_json_is_disabled_by_default():
+    assert getattr(MyDataClass, TO_JSON, None) is None
+
+    @dataclass
+    class DataClass(DataClassJSONMixin):
+        x: int
+
+    assert DataClass.__mashumaro_to_json__ is None
+    assert DataClass(1).to_json() == '{"x": 1}'
+
+
+def test_direct_to_json_with_lazy_compilation():
+    assert LazyDirect([1, 2]).to_json() == '{"x": [1, 2]}'
+
+
+def make_backend_class(backend_name, direct=False):
+    @dataclass
+    class DataClass(DataClassJSONMixin):
+        dt: datetime
+        d: date
+        u: uuid.UUID
+        enum: MyEnum
+        str_enum: MyStrEnum
+        mapping: Dict[int, str]
+        s: str
+        x: float = 1.5
+
+        class Config(BaseConfig):
+            json_backend = backend_name
+            direct_to_json = direct
+
+    return DataClass
+
+
+def make_backend_instance(cls):
+    return cls(
+        dt=datetime(2021, 1, 1, 12, 30, 1, 5),
+        d=date(2021, 1, 1),
+        u=uuid.UUID(int=1),
+        enum=MyEnum.a,
+        str_enum=MyStrEnum.b,
+        mapping={1: "a/b"},
+        s="юникод",
+    )
+
+
+@pytest.mark.parametrize("backend_name", list(JSON_BACKENDS))
+def test_json_backend(backend_name):
+    cls = make_backend_class(backend_name)
+    assert cls.__mashumaro_json_backend__ is JSON_BACKENDS[backend_name]
+    instance = make_backend_instance(cls)
+    dumped = instance.to_json()
+    assert json.loads(dumped) == json.loads(json.dumps(instance.to_dict()))
+    assert cls.from_json(dumped) == instance
+
+
+@pytest.mark.parametrize("backend_name", list(JSON_BACKENDS))
+def test_json_backend_json_lines(backend_name):
+    cls = make_backend_class(backend_name)
+    instance = make_backend_instance(cls)
+    binary = isinstance(instance.to_json(), bytes)
+    fp = io.BytesIO() if binary else io.StringIO()
+    assert cls.to_json_lines([instance, instance], fp) == 2
+    fp.seek(0)
+    assert list(cls.from_json_lines(fp)) == [instance, instance]
+
+
+NATIVE_BACKEND_NAMES = [
+    n for n in JSON_BACKENDS if JSON_BACKENDS[n].native_flags
+]
+
+
+def spy_backend_dumps(cls, mocker):
+    backend = cls.__mashumaro_json_backend__
+    dumps = mocker.Mock(wraps=backend.dumps)
+    mocker.patch.object(
+        cls, "__mashumaro_json_backend__", backend._replace(dumps=dumps)
+    )
+    return dumps
+
+
+@pytest.mark.parametrize("backend_name", NATIVE_BACKEND_NAMES)
+def test_json_backend_native_values(backend_name, mocker):
+    cls = make_backend_class(backend_name)
+    instance = make_backend_instance(cls)
+    dumps = spy_backend_dumps(cls, mocker)
+    native_enum = "native_enum" in JSON_BACKENDS[backend_name].native_flags
+    instance.to_json()
+    d = dumps.call_args[0][0]
+    assert d["dt"] is instance.dt
+    assert d["u"] is instance.u
+    assert (d["enum"] is instance.enum) is native_enum
+    assert d["mapping"] == {1: "a/b"}
+    instance.to_json(dict_params={"use_bytes": True})
+    assert dumps.call_args[0][0]["dt"] is instance.dt
+    binary = isinstance(instance.to_json(), bytes)
+    cls.to_json_lines([instance], io.BytesIO() if binary else io.StringIO())
+    assert dumps.call_args[0][0]["u"] is instance.u
+    assert instance.to_json(encoder=dumps)
+    assert dumps.call_args[0][0] == instance.to_dict()
+    with pytest.raises(TypeError):
+        instance.to_json(dict_params={"omit_none": True})
+
+
+@pytest.mark.parametrize("backend_name", NATIVE_BACKEND_NAMES)
+def test_json_backend_overridden_serialization(backend_name):
+    @dataclass
+    class DataClass(DataClassJSONMixin):
+        dt: datetime = field(
+            metadata=field_options(serialize=lambda v: v.strftime("%Y"))
+        )
+        u: uuid.UUID
+        enum: MyEnum
+        dt_keys: Dict[datetime, int]
+
+        class Config(BaseConfig):
+            json_backend = backend_name
+            serialization_strategy = {
+                uuid.UUID: {"serialize": lambda v: v.hex},
+                MyEnum: {"serialize": lambda v: v.name},
+            }
+
+    instance = DataClass(
+        dt=datetime(2021, 1, 1),
+        u=uuid.UUID(int=1),
+        enum=MyEnum.a,
+        dt_keys={datetime(2021, 1, 1): 1},
+    )
+    assert json.loads(instance.to_json()) == {
+        "dt": "2021",
+        "u": uuid.UUID(int=1).hex,
+        "enum": "a",
+        "dt_keys": {"2021-01-01T00:00:00": 1},
+    }
+
+
+def test_auto_json_backend():
+    backend_name = next(n for n in JSON_BACKEND_NAMES if n in JSON_BACKENDS)
+    cls = make_backend_class("auto")
+    assert cls.__mashumaro_json_backend__ is JSON_BACKENDS[backend_name]
+
+
+def test_direct_to_json_is_used_only_with_json_backend():
+    assert make_backend_class("json", direct=True).__mashumaro_to_json__
+    for backend_name in set(JSON_BACKENDS) - {"json"}:
+        cls = make_backend_class(backend_name, direct=True)
+        assert cls.__mashumaro_to_json__ is None
+
+
+def test_unknown_json_backend():
+    with pytest.raises(ValueError):
+        make_backend_class("simplejson")
+
+
+def test_json_backend_not_installed(monkeypatch):
+    monkeypatch.delitem(JSON_BACKENDS, "ujson", raising=False)
+    with pytest.raises(ModuleNotFoundError, match="ujson"):
+        make_backend_class("ujson")
+
+
+class HookConfig(BaseConfig):
+    json_object_pairs_hook = True
+
+
+@dataclass
+class HookLeaf(DataClassJSONMixin):
+    a: int
+    when: datetime
+    tag: Union[int, str] = 0
+
+
+@dataclass
+class HookNode(DataClassJSONMixin):
+    name: str
+    leaves: List[HookLeaf]
+    child: Optional["HookNode"] = None
+
+    class Config(HookConfig):
+        aliases = {"name": "node_name"}
+        serialize_by_alias = True
+
+
+@dataclass
+class HookRoot(DataClassJSONMixin):
+    nodes: List[HookNode]
+    leaf: HookLeaf
+
+    class Config(HookConfig):
+        pass
+
+
+@dataclass
+class HookAmbiguousA(DataClassJSONMixin):
+    x: int
+
+
+@dataclass
+class HookAmbiguousB(DataClassJSONMixin):
+    x: int
+    y: int = 0
+
+
+@dataclass
+class HookAmbiguousRoot(DataClassJSONMixin):
+    a: HookAmbiguousA
+    b: List[HookAmbiguousB]
+
+    class Config(HookConfig):
+        pass
+
+
+@dataclass
+class HookWithDict(DataClassJSONMixin):
+    leaf: HookLeaf
+    extra: Dict[str, int]
+
+    class Config(HookConfig):
+        pass
+
+
+@dataclass
+class HookWithPreDeserialize(DataClassJSONMixin):
+    leaf: HookLeaf
+
+    class Config(HookConfig):
+        pass
+
+    @classmethod
+    def __pre_deserialize__(cls, d):
+        return d
+
+
+HOOK_ROOT = HookRoot(
+    nodes=[
+        HookNode(
+            "n", [HookLeaf(1, datetime(2021, 1, 1), "a")], HookNode("m", [])
+        )
+    ],
+    leaf=HookLeaf(2, datetime(2021, 1, 2)),
+)
+
+
+def test_json_object_classes():
+    classes = CodeBuilder(HookRoot).get_json_object_classes()
+    assert classes == [
+        (HookRoot, frozenset({"nodes", "leaf"}), frozenset({"nodes", "leaf"})),
+        (
+            HookNode,
+            frozenset({"node_name", "leaves"}),
+            frozenset({"node_name", "leaves", "child"}),
+        ),
+        (HookLeaf, frozenset({"a", "when"}), frozenset({"a", "when", "tag"})),
+    ]
+    assert CodeBuilder(HookAmbiguousRoot).get_json_object_classes() == [
+        (HookAmbiguousRoot, frozenset({"a", "b"}), frozenset({"a", "b"}))
+    ]
+    assert CodeBuilder(HookWithDict).get_json_object_classes() is None
+    assert (
+        CodeBuilder(HookWithPreDeserialize).get_json_object_classes() is None
+    )
+
+
+def test_from_json_with_object_pairs_hook(mocker):
+    spy = mocker.spy(json, "loads")
+    dumped = HOOK_ROOT.to_json()
+    assert HookRoot.from_json(dumped) == HOOK_ROOT
+    assert HookRoot.from_json(dumped.encode()) == HOOK_ROOT
+    assert "object_pairs_hook" in spy.call_args[1]
+    assert (
+        HookNode.from_json(HOOK_ROOT.nodes[0].to_json()) == HOOK_ROOT.nodes[0]
+    )
+    data = HOOK_ROOT.to_dict()
+    data["leaf"]["unknown"] = 1
+    assert HookRoot.from_json(json.dumps(data)) == HOOK_ROOT
+
+
+def test_from_json_with_object_pairs_hook_fallback():
+    obj = HookAmbiguousRoot(HookAmbiguousA(1), [HookAmbiguousB(2, 3)])
+    assert HookAmbiguousRoot.from_json(obj.to_json()) == obj
+    obj = HookWithDict(HOOK_ROOT.leaf, {"a": 1, "when": 2})
+    assert HookWithDict.from_json(obj.to_json()) == obj
+    assert HookWithDict.__mashumaro_json_object_hooks__ == {"0000100": None}
+
+
+def get_error_chain(load, data):
+    with pytest.raises(Exception) as exc_info:
+        load(json.dumps(data))
+    chain = []
+    e = exc_info.value
+    while e is not None:
+        # the invalid values in the messages can have the objects that
+        # have already been built by the hook
+        chain.append(
+            (
+                type(e),
+                getattr(e, "field_name", None),
+                getattr(e, "holder_class", None),
+            )
+        )
+        e = e.__context__
+    return chain
+
+
+def invalidate_leaf_value(d):
+    d["nodes"][0]["leaves"][0]["a"] = "a"
+
+
+def delete_leaf_key(d):
+    del d["leaf"]["a"]
+
+
+def invalidate_node_value(d):
+    d["nodes"][0]["child"]["leaves"] = 1
+
+
+@pytest.mark.parametrize(
+    "invalidate",
+    [invalidate_leaf_value, delete_leaf_key, invalidate_node_value],
+)
+def test_from_json_with_object_pairs_hook_invalid_value(invalidate):
+    data = HOOK_ROOT.to_dict()
+    invalidate(data)
+    chain = get_error_chain(HookRoot.from_json, data)
+    assert chain == get_error_chain(
+        partial(HookRoot.from_json, decoder=json.loads), data
+    )
+    assert chain[0][:3:2] == (InvalidFieldValue, HookRoot)
+    assert len(chain) > 1
+
+
+def test_from_json_with_object_pairs_hook_unknown_dict_params():
+    with pytest.raises(TypeError):
+        HookRoot.from_json(HOOK_ROOT.to_json(), dict_params={"unknown": 1})
+
+
+def test_from_json_with_object_pairs_hook_and_decoder(mocker):
+    decoder = mocker.Mock(wraps=json.loads)
+    assert HookRoot.from_json(HOOK_ROOT.to_json(), decoder) == HOOK_ROOT
+    assert decoder.call_args[1] == {}
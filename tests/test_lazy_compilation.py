@@ -0,0 +1,106 @@
+import threading
+from dataclasses import dataclass, field
+from typing import List
+
+import pytest
+
+from mashumaro import DataClassDictMixin
+from mashumaro.config import BaseConfig
+from mashumaro.exceptions import UnserializableField
+from mashumaro.serializer.base.metaprogramming import CodeBuilder
+
+
+class LazyConfig(BaseConfig):
+    lazy_compilation = True
+
+
+@dataclass
+class Parent(DataClassDictMixin):
+    children: List["Child"]
+
+    class Config(LazyConfig):
+        pass
+
+
+@dataclass
+class Child(DataClassDictMixin):
+    x: int
+
+
+def test_code_is_compiled_on_first_call(mocker):
+    compile_ = mocker.spy(CodeBuilder, "compile")
+
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int
+
+        class Config(LazyConfig):
+            pass
+
+    assert compile_.call_count == 0
+    assert DataClass.from_dict({"x": 1}) == DataClass(1)
+    assert compile_.call_count == 1
+    assert DataClass.from_dict({"x": 2}) == DataClass(2)
+    assert compile_.call_count == 1
+    assert DataClass(1).to_dict() == {"x": 1}
+    assert compile_.call_count == 2
+
+
+def test_forward_reference_is_resolved_on_first_call():
+    dumped = {"children": [{"x": 1}, {"x": 2}]}
+    instance = Parent([Child(1), Child(2)])
+    assert Parent.from_dict(dumped) == instance
+    assert instance.to_dict() == dumped
+
+
+def test_unserializable_field_error_is_raised_on_first_call():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: list
+
+        class Config(LazyConfig):
+            pass
+
+    with pytest.raises(UnserializableField):
+        DataClass.from_dict({"x": []})
+    with pytest.raises(UnserializableField):
+        DataClass([]).to_dict()
+
+
+def test_code_is_compiled_once_in_concurrent_calls(mocker):
+    compile_ = mocker.spy(CodeBuilder, "compile")
+
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int
+
+        class Config(LazyConfig):
+            pass
+
+    barrier = threading.Barrier(8)
+    results = []
+
+    def worker(i):
+        barrier.wait()
+        results.append(DataClass.from_dict({"x": i}))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(r.x for r in results) == list(range(8))
+    assert compile_.call_count == 1
+
+
+def test_defaults_are_taken_from_processed_dataclass():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int = 1
+        y: List[int] = field(default_factory=list)
+
+        class Config(LazyConfig):
+            pass
+
+    assert DataClass.from_dict({}) == DataClass()
+    assert DataClass.from_dict({"y": [1]}) == DataClass(y=[1])
@@ -0,0 +1,105 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+import pytest
+
+from mashumaro import DataClassDictMixin
+from mashumaro.config import TO_DICT_ADD_OMIT_NONE_FLAG, BaseConfig
+from mashumaro.exceptions import InvalidFieldValue, MissingField
+from mashumaro.serializer.base.metaprogramming import CodeBuilder
+
+DT = datetime(2021, 1, 1)
+
+
+@dataclass
+class Item(DataClassDictMixin):
+    x: int
+    tags: List[str]
+    created: Optional[datetime] = None
+
+    class Config(BaseConfig):
+        code_generation_options = [TO_DICT_ADD_OMIT_NONE_FLAG]
+
+
+@dataclass
+class SubItem(Item):
+    y: int = 0
+
+
+@dataclass
+class ItemWithHooks(DataClassDictMixin):
+    x: int
+
+    @classmethod
+    def __pre_deserialize__(cls, d):
+        return {"x": d["x"] * 2}
+
+    def __post_serialize__(self, d):
+        d["hooked"] = True
+        return d
+
+
+def test_from_dict_many():
+    dumped = [{"x": 1, "tags": ["a"]}, {"x": "2", "tags": []}]
+    assert Item.from_dict_many(dumped) == [Item(1, ["a"]), Item(2, [])]
+    assert Item.from_dict_many(iter(dumped)) == [Item(1, ["a"]), Item(2, [])]
+    assert Item.from_dict_many([]) == []
+
+
+def test_to_dict_many():
+    instances = [Item(1, ["a"]), SubItem(2, [], y=3)]
+    assert Item.to_dict_many(instances) == [
+        {"x": 1, "tags": ["a"], "created": None},
+        {"x": 2, "tags": [], "created": None, "y": 3},
+    ]
+    assert Item.to_dict_many(instances, omit_none=True) == [
+        {"x": 1, "tags": ["a"]},
+        {"x": 2, "tags": [], "y": 3},
+    ]
+
+
+def test_many_with_flags():
+    instances = [Item(1, [], DT)]
+    dumped = [{"x": 1, "tags": [], "created": DT}]
+    assert Item.to_dict_many(instances, use_datetime=True) == dumped
+    assert Item.from_dict_many(dumped, use_datetime=True) == instances
+
+
+def test_many_with_hooks():
+    assert ItemWithHooks.from_dict_many([{"x": 1}]) == [ItemWithHooks(2)]
+    assert ItemWithHooks.to_dict_many([ItemWithHooks(1)]) == [
+        {"x": 1, "hooked": True}
+    ]
+
+
+def test_from_dict_many_stops_at_first_error():
+    with pytest.raises(InvalidFieldValue):
+        Item.from_dict_many([{"x": "a", "tags": []}, {"tags": []}])
+    with pytest.raises(ValueError):
+        Item.from_dict_many([1])
+
+
+def test_many_collects_errors():
+    errors = []
+    dumped = [{"x": "a", "tags": []}, {"x": 1, "tags": []}, {"tags": []}]
+    assert Item.from_dict_many(dumped, errors=errors) == [Item(1, [])]
+    assert [i for i, _ in errors] == [0, 2]
+    assert isinstance(errors[0][1], InvalidFieldValue)
+    assert isinstance(errors[1][1], MissingField)
+    errors = []
+    assert Item.to_dict_many([None, Item(1, [])], errors=errors) == [
+        {"x": 1, "tags": [], "created": None}
+    ]
+    assert [i for i, _ in errors] == [0]
+
+
+def test_many_methods_are_compiled_on_first_call(mocker):
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: int
+
+    compile_ = mocker.spy(CodeBuilder, "compile")
+    assert DataClass.from_dict_many([{"x": 1}]) == [DataClass(1)]
+    assert DataClass.from_dict_many([{"x": 2}]) == [DataClass(2)]
+    assert compile_.call_count == 1
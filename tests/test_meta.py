@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+import typing
+from dataclasses import dataclass, field
+from typing import List, Optional
 from unittest.mock import patch
 
 import pytest
@@ -98,3 +100,32 @@ def test_is_dataclass_dict_mixin_subclass():
     assert is_dataclass_dict_mixin_subclass(DataClassDictMixin)
     assert is_dataclass_dict_mixin_subclass(DataClassJSONMixin)
     assert is_dataclass_dict_mixin_subclass(MyDataClass)
+
+
+def test_code_builder_resolves_type_hints_once(mocker):
+    get_type_hints = mocker.spy(typing, "get_type_hints")
+
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        a: int
+        b: Optional[str] = None
+        c: List[int] = field(default_factory=list)
+
+    assert get_type_hints.call_count == 1
+
+    @dataclass
+    class SubDataClass(DataClass):
+        d: int = 0
+
+    # annotations of the ancestors are taken from the cache
+    assert get_type_hints.call_count == 2
+
+
+def test_code_builder_memoizes_config():
+    class DataClass(DataClassDictMixin):
+        class Config:
+            debug = False
+
+    builder = CodeBuilder(DataClass)
+    assert builder.get_config() is builder.get_config()
+    assert builder.get_config(MyDataClass) is builder.get_config(MyDataClass)
@@ -1,10 +1,26 @@
-from dataclasses import dataclass
-from datetime import datetime
-from typing import List
+import io
+import uuid
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from fractions import Fraction
+from functools import partial
+from operator import methodcaller
+from typing import Any, List
 
 import msgpack
+import pytest
 
-from mashumaro import DataClassMessagePackMixin
+from mashumaro import DataClassMessagePackMixin, MissingField, field_options
+from mashumaro.config import BaseConfig
+from mashumaro.serializer.msgpack import (
+    EXT_DATETIME,
+    EXT_DECIMAL,
+    EXT_FRACTION,
+    EXT_UUID,
+    ext_packb,
+    ext_unpackb,
+)
 
 
 def test_to_msgpack():
@@ -33,3 +49,210 @@ def test_to_msg_pack_datetime():
     dt = datetime(2018, 10, 29, 12, 46, 55, 308495)
     dumped = msgpack.packb({"x": dt.isoformat()})
     assert DataClass(dt).to_msgpack() == dumped
+
+
+@dataclass
+class ExtTypes(DataClassMessagePackMixin):
+    dt: datetime
+    dt_utc: datetime
+    dt_offset: datetime
+    d: date
+    t: time
+    t_offset: time
+    u: uuid.UUID
+    b: bytes
+    any_: Any
+
+    class Config(BaseConfig):
+        msgpack_ext_types = True
+
+
+EXT_TYPES = ExtTypes(
+    dt=datetime(2018, 10, 29, 12, 46, 55, 308495),
+    dt_utc=datetime(2018, 10, 29, 12, 46, 55, 308495, tzinfo=timezone.utc),
+    dt_offset=datetime(
+        2018, 10, 29, 12, 46, 55, tzinfo=timezone(timedelta(hours=-3))
+    ),
+    d=date(2018, 10, 29),
+    t=time(12, 46, 55, 308495),
+    t_offset=time(12, 46, tzinfo=timezone(timedelta(minutes=330))),
+    u=uuid.UUID(int=1),
+    b=b"123",
+    any_=[uuid.UUID(int=2), Decimal("1.10"), Fraction(1, 3), date(2021, 1, 1)],
+)
+
+
+def test_msgpack_ext_types():
+    dumped = EXT_TYPES.to_msgpack()
+    assert ExtTypes.from_msgpack(dumped) == EXT_TYPES
+    loaded = msgpack.unpackb(dumped, raw=False)
+    assert isinstance(loaded["dt_utc"], msgpack.Timestamp)
+    assert loaded["dt"].code == EXT_DATETIME
+    assert loaded["u"] == msgpack.ExtType(EXT_UUID, EXT_TYPES.u.bytes)
+    assert loaded["any_"][0] == msgpack.ExtType(
+        EXT_UUID, uuid.UUID(int=2).bytes
+    )
+
+
+def test_msgpack_ext_types_are_smaller():
+    instance = replace(EXT_TYPES, any_=None)
+    dumped = instance.to_msgpack()
+    assert len(dumped) < len(instance.to_msgpack(encoder=msgpack.packb))
+
+
+def test_msgpack_ext_types_time_zones():
+    loaded = ExtTypes.from_msgpack(EXT_TYPES.to_msgpack())
+    assert loaded.dt_offset == EXT_TYPES.dt_offset
+    assert loaded.dt_offset.tzinfo is timezone.utc
+    assert loaded.t_offset.tzinfo == EXT_TYPES.t_offset.tzinfo
+
+
+def test_msgpack_ext_types_with_custom_encoder():
+    dumped = EXT_TYPES.to_msgpack(encoder=partial(msgpack.packb, default=str))
+    assert msgpack.unpackb(dumped)["dt"] == EXT_TYPES.dt.isoformat()
+
+
+def test_msgpack_ext_types_with_dict_params():
+    dumped = EXT_TYPES.to_msgpack(dict_params={"use_bytes": False})
+    assert msgpack.unpackb(dumped)["b"] == "MTIz\n"
+    assert msgpack.unpackb(dumped)["dt"].code == EXT_DATETIME
+    loaded = ExtTypes.from_msgpack(dumped, dict_params={"use_bytes": False})
+    assert loaded == EXT_TYPES
+    with pytest.raises(TypeError):
+        EXT_TYPES.to_msgpack(dict_params={"omit_none": True})
+
+
+@dataclass
+class ExtTypesOverridden(DataClassMessagePackMixin):
+    dt: datetime = field(
+        metadata=field_options(
+            serialize=lambda v: v.strftime("%Y%m%d"),
+            deserialize=lambda v: datetime.strptime(v, "%Y%m%d"),
+        )
+    )
+    d: date = field(metadata=field_options(deserialize="pendulum"))
+    u: uuid.UUID
+    amount: Decimal
+    ratio: Fraction
+
+    class Config(BaseConfig):
+        msgpack_ext_types = True
+        serialization_strategy = {
+            uuid.UUID: {
+                "serialize": lambda v: v.hex,
+                "deserialize": lambda v: uuid.UUID(hex=v),
+            }
+        }
+
+
+def test_msgpack_ext_types_with_overridden_serialization():
+    instance = ExtTypesOverridden(
+        dt=datetime(2021, 1, 2),
+        d=date(2021, 1, 2),
+        u=uuid.UUID(int=1),
+        amount=Decimal("1.10"),
+        ratio=Fraction(1, 3),
+    )
+    dumped = instance.to_msgpack()
+    loaded = msgpack.unpackb(dumped)
+    assert loaded["dt"] == "20210102"
+    assert loaded["d"] == "2021-01-02"
+    assert loaded["u"] == uuid.UUID(int=1).hex
+    assert loaded["amount"] == msgpack.ExtType(EXT_DECIMAL, b"1.10")
+    assert loaded["ratio"] == msgpack.ExtType(EXT_FRACTION, b"1/3")
+    assert ExtTypesOverridden.from_msgpack(dumped) == instance
+
+
+def test_msgpack_ext_types_load_strings():
+    # the data written without the extension types for some of the fields
+    d = EXT_TYPES.to_dict(use_bytes=True)
+    assert ExtTypes.from_msgpack(ext_packb(d)) == EXT_TYPES
+    dumped = ext_packb(dict(d, dt=EXT_TYPES.dt, d=EXT_TYPES.d))
+    assert ExtTypes.from_msgpack(dumped) == EXT_TYPES
+    fp = io.BytesIO(ext_packb(d) + EXT_TYPES.to_msgpack())
+    assert list(ExtTypes.iter_from_msgpack(fp)) == [EXT_TYPES, EXT_TYPES]
+
+
+def test_unknown_msgpack_ext_types():
+    with pytest.raises(TypeError):
+        ext_packb(object())
+    ext = msgpack.ExtType(42, b"42")
+    assert ext_unpackb(msgpack.packb(ext)) == ext
+
+
+def test_msgpack_ext_types_are_disabled_by_default():
+    @dataclass
+    class DataClass(DataClassMessagePackMixin):
+        x: date
+
+    assert msgpack.unpackb(DataClass(date(2021, 1, 1)).to_msgpack()) == {
+        "x": "2021-01-01"
+    }
+
+
+@dataclass
+class StreamRecord(DataClassMessagePackMixin):
+    x: int
+    created: datetime
+    data: bytes = b""
+
+
+STREAM_RECORDS = [
+    StreamRecord(i, datetime(2021, 1, 1, i), bytes([i])) for i in range(5)
+]
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_write_msgpack(batch_size):
+    fp = io.BytesIO()
+    count = StreamRecord.write_msgpack(
+        STREAM_RECORDS, fp, batch_size=batch_size
+    )
+    assert count == len(STREAM_RECORDS)
+    assert fp.getvalue() == b"".join(r.to_msgpack() for r in STREAM_RECORDS)
+
+
+def test_write_msgpack_empty():
+    fp = io.BytesIO()
+    assert StreamRecord.write_msgpack([], fp) == 0
+    assert fp.getvalue() == b""
+
+
+@pytest.mark.parametrize("read_size", [1, 7, 65536])
+def test_iter_from_msgpack(read_size):
+    fp = io.BytesIO(b"".join(r.to_msgpack() for r in STREAM_RECORDS))
+    loaded = StreamRecord.iter_from_msgpack(fp, read_size=read_size)
+    assert list(loaded) == STREAM_RECORDS
+
+
+def test_iter_from_msgpack_is_lazy():
+    fp = io.BytesIO(b"".join(r.to_msgpack() for r in STREAM_RECORDS))
+    loaded = StreamRecord.iter_from_msgpack(fp, read_size=1)
+    assert next(loaded) == STREAM_RECORDS[0]
+    assert fp.tell() < len(fp.getvalue())
+
+
+def test_msgpack_stream_with_params():
+    fp = io.BytesIO()
+    StreamRecord.write_msgpack(
+        STREAM_RECORDS,
+        fp,
+        dict_params={"use_datetime": True},
+        default=methodcaller("isoformat", " "),
+    )
+    fp.seek(0)
+    loaded = StreamRecord.iter_from_msgpack(fp, use_list=False)
+    assert list(loaded) == STREAM_RECORDS
+    fp.seek(0)
+    # keys are loaded as bytes
+    loaded = StreamRecord.iter_from_msgpack(fp, raw=True)
+    with pytest.raises(MissingField):
+        list(loaded)
+
+
+def test_msgpack_stream_with_ext_types():
+    fp = io.BytesIO()
+    assert ExtTypes.write_msgpack([EXT_TYPES, EXT_TYPES], fp) == 2
+    assert fp.getvalue() == EXT_TYPES.to_msgpack() * 2
+    fp.seek(0)
+    assert list(ExtTypes.iter_from_msgpack(fp)) == [EXT_TYPES, EXT_TYPES]
@@ -0,0 +1,181 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, List, Optional, Union
+
+import msgpack
+import pytest
+
+from mashumaro import (
+    DataClassDictMixin,
+    DataClassJSONMixin,
+    DataClassMessagePackMixin,
+)
+from mashumaro.config import BaseConfig
+from mashumaro.exceptions import InvalidFieldValue
+from mashumaro.serializer.base.metaprogramming import CodeBuilder
+
+
+class PositionalConfig(BaseConfig):
+    positional_encoding = True
+
+
+@dataclass
+class Point(DataClassJSONMixin, DataClassMessagePackMixin):
+    x: int
+    y: int = 0
+    label: Optional[str] = None
+
+    class Config(PositionalConfig):
+        pass
+
+
+@dataclass
+class Named(DataClassDictMixin):
+    name: str
+
+
+@dataclass
+class Shape(DataClassJSONMixin, DataClassMessagePackMixin):
+    points: List[Point]
+    created: datetime
+    named: Named
+    extra: Union[int, Point]
+    tags: List[str] = field(default_factory=list)
+
+    class Config(PositionalConfig):
+        pass
+
+
+@dataclass
+class PointV1(DataClassDictMixin):
+    x: int
+
+    class Config(PositionalConfig):
+        pass
+
+
+@dataclass
+class PointRenamed(DataClassDictMixin):
+    z: int
+    y: int = 0
+    label: Optional[str] = None
+
+    class Config(PositionalConfig):
+        pass
+
+
+@dataclass
+class WithHooks(DataClassDictMixin):
+    x: int
+
+    class Config(PositionalConfig):
+        pass
+
+    @classmethod
+    def __pre_deserialize__(cls, d: Any) -> Any:
+        return [d[0], d[1] - 1]
+
+    def __post_serialize__(self, d: Any) -> Any:
+        return [d[0], d[1] + 1]
+
+
+@dataclass
+class InlinedHolder(DataClassDictMixin):
+    point: Point
+
+    class Config(BaseConfig):
+        inline_nested_depth = 1
+
+
+SHAPE = Shape(
+    points=[Point(1, 2, "a"), Point(3)],
+    created=datetime(2021, 1, 1),
+    named=Named("n"),
+    extra=Point(4),
+)
+
+
+def test_positional_to_dict():
+    fingerprint = CodeBuilder(Point).get_positional_fingerprints()[4]
+    assert Point(1, 2, "a").to_dict() == [fingerprint, 1, 2, "a"]
+    dumped = SHAPE.to_dict()
+    assert dumped[1] == [Point(1, 2, "a").to_dict(), Point(3).to_dict()]
+    assert dumped[2:] == ["2021-01-01T00:00:00", {"name": "n"}, dumped[4], []]
+    assert dumped[4] == Point(4).to_dict()
+
+
+def test_positional_from_dict():
+    assert Shape.from_dict(SHAPE.to_dict()) == SHAPE
+    assert Shape.from_dict(tuple(SHAPE.to_dict())) == SHAPE
+
+
+def test_positional_json_and_msgpack():
+    assert Shape.from_json(SHAPE.to_json()) == SHAPE
+    assert Shape.from_msgpack(SHAPE.to_msgpack()) == SHAPE
+    assert Shape.from_msgpack(SHAPE.to_msgpack(), use_list=False) == SHAPE
+    packed = msgpack.packb(
+        {
+            "points": [{"x": 1, "y": 2, "label": "a"}, {"x": 3, "y": 0}],
+            "created": "2021-01-01T00:00:00",
+            "named": {"name": "n"},
+            "extra": {"x": 4, "y": 0, "label": None},
+            "tags": [],
+        }
+    )
+    assert len(SHAPE.to_msgpack()) < len(packed)
+
+
+def test_trailing_fields_with_defaults_are_optional():
+    dumped = PointV1(1).to_dict()
+    assert Point.from_dict(dumped) == Point(1)
+
+
+def test_fingerprint_mismatch():
+    with pytest.raises(ValueError, match="Fingerprint"):
+        Point.from_dict(PointRenamed(1).to_dict())
+    with pytest.raises(ValueError, match="Fingerprint"):
+        PointV1.from_dict(Point(1).to_dict())
+    with pytest.raises(ValueError, match="Fingerprint"):
+        Point.from_dict(Point(1).to_dict()[:-1])
+    with pytest.raises(ValueError, match="Fingerprint"):
+        Point.from_dict([])
+
+
+def test_positional_from_dict_with_dict():
+    with pytest.raises(ValueError, match="should be a list"):
+        Point.from_dict({"x": 1})
+
+
+def test_positional_invalid_field_value():
+    dumped = Point(1).to_dict()
+    dumped[1] = "a"
+    with pytest.raises(InvalidFieldValue):
+        Point.from_dict(dumped)
+
+
+def test_positional_with_hooks():
+    dumped = WithHooks(1).to_dict()
+    assert dumped[1] == 2
+    assert WithHooks.from_dict(dumped) == WithHooks(1)
+
+
+def test_positional_class_is_not_inlined():
+    dumped = InlinedHolder(Point(1)).to_dict()
+    assert dumped == {"point": Point(1).to_dict()}
+    assert InlinedHolder.from_dict(dumped) == InlinedHolder(Point(1))
+
+
+def test_positional_many():
+    dumped = Point.to_dict_many([Point(1), Point(2)])
+    assert dumped == [Point(1).to_dict(), Point(2).to_dict()]
+    assert Point.from_dict_many(dumped) == [Point(1), Point(2)]
+
+
+def test_positional_fingerprints():
+    fingerprints = CodeBuilder(Point).get_positional_fingerprints()
+    assert list(fingerprints) == [2, 3, 4]
+    assert (
+        fingerprints[2]
+        == CodeBuilder(PointV1).get_positional_fingerprints()[2]
+    )
+    assert len(set(fingerprints.values())) == 3
@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Union
+
+import pytest
+
+from mashumaro import DataClassDictMixin, DataClassJSONMixin
+from mashumaro.config import BaseConfig
+from mashumaro.exceptions import InvalidFieldValue
+from mashumaro.serializer.base.metaprogramming import CodeBuilder
+
+
+@dataclass
+class Item(DataClassDictMixin):
+    values: List[int]
+    weight: float = 0.0
+
+
+@dataclass
+class Catalog(DataClassJSONMixin):
+    items: List[Item]
+    counts: Dict[str, int]
+    tags: Set[str]
+    created: datetime
+    note: Optional[str] = None
+
+
+@dataclass
+class TrustedCatalog(DataClassJSONMixin):
+    items: List[Item]
+    counts: Dict[str, int]
+
+    class Config(BaseConfig):
+        trusted_input = True
+
+
+@dataclass
+class UnionItems(DataClassDictMixin):
+    values: List[Union[int, str]]
+    mapping: Dict[str, Union[int, str]]
+
+
+def get_catalog_dict():
+    return {
+        "items": [{"values": [1, 2], "weight": 1.5}],
+        "counts": {"a": 1},
+        "tags": ["x"],
+        "created": "2021-01-01T00:00:00",
+    }
+
+
+def test_trusted_from_dict():
+    d = get_catalog_dict()
+    obj = Catalog.from_dict(d, trusted=True)
+    assert obj == Catalog.from_dict(d)
+    assert obj.counts is d["counts"]
+    assert obj.items[0].values is d["items"][0]["values"]
+    assert obj.tags == {"x"}
+    assert obj.created == datetime(2021, 1, 1)
+    assert Catalog.from_dict(d).counts is not d["counts"]
+
+
+def test_trusted_from_dict_skips_coercions():
+    obj = Item.from_dict({"values": [1], "weight": 1}, trusted=True)
+    assert type(obj.weight) is int
+    obj = Item.from_dict({"values": [1], "weight": 1})
+    assert type(obj.weight) is float
+
+
+def test_trusted_from_dict_errors_are_not_wrapped():
+    d = dict(get_catalog_dict(), created="a")
+    with pytest.raises(InvalidFieldValue):
+        Catalog.from_dict(d)
+    with pytest.raises(ValueError) as exc_info:
+        Catalog.from_dict(d, trusted=True)
+    assert not isinstance(exc_info.value, InvalidFieldValue)
+
+
+def test_trusted_input_config_option():
+    d = {"items": [{"values": [1]}], "counts": {"a": 1}}
+    obj = TrustedCatalog.from_dict(d)
+    assert obj.items[0].values is d["items"][0]["values"]
+    obj = TrustedCatalog.from_dict(d, trusted=False)
+    assert obj.items[0].values is not d["items"][0]["values"]
+    assert obj == TrustedCatalog.from_dict(d)
+
+
+def test_trusted_from_dict_many():
+    d = get_catalog_dict()
+    objs = Catalog.from_dict_many([d, d], trusted=True)
+    assert objs == [Catalog.from_dict(d)] * 2
+    assert objs[0].counts is d["counts"]
+
+
+def test_trusted_from_json():
+    obj = Catalog.from_dict(get_catalog_dict())
+    data = obj.to_json()
+    assert Catalog.from_json(data, dict_params={"trusted": True}) == obj
+    obj = TrustedCatalog(items=[Item([1], 2.5)], counts={"a": 1})
+    assert TrustedCatalog.from_json(obj.to_json()) == obj
+
+
+def test_trusted_item_code_is_generated_once(mocker):
+    add_unpack_union = mocker.spy(CodeBuilder, "_add_unpack_union")
+    d = {"values": [1, "a"], "mapping": {"a": 1}}
+    assert UnionItems.from_dict(d, trusted=True) == UnionItems.from_dict(d)
+    # the trusted variant is compiled on the first call
+    assert add_unpack_union.call_count == 2
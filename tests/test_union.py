@@ -1,9 +1,13 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
 from typing import Any, Dict, List, Union
 
 import pytest
 
-from mashumaro import DataClassDictMixin
+from mashumaro import DataClassDictMixin, field_options
+from mashumaro.exceptions import InvalidFieldValue, UnserializableField
+from mashumaro.types import SerializableType
 
 
 @dataclass
@@ -32,3 +36,148 @@ def test_union(test_case):
     instance = DataClass(x=test_case.loaded)
     assert DataClass.from_dict({"x": test_case.dumped}) == instance
     assert instance.to_dict() == {"x": test_case.dumped}
+
+
+@dataclass
+class UnionMemberA(DataClassDictMixin):
+    a: int
+
+
+@dataclass
+class UnionMemberB(DataClassDictMixin):
+    b: int
+
+
+class Interrupting(SerializableType):
+    def _serialize(self):
+        raise KeyboardInterrupt
+
+    @classmethod
+    def _deserialize(cls, value):
+        raise KeyboardInterrupt
+
+
+@dataclass
+class DataClassWithUnion(DataClassDictMixin):
+    x: Union[float, int, str, datetime]
+    y: Union[UnionMemberA, UnionMemberB, int] = 0
+
+
+@pytest.mark.parametrize(
+    ["dumped", "loaded"],
+    [
+        (1, 1),
+        (1.5, 1.5),
+        ("a", "a"),
+        ("2021-01-01T00:00:00", "2021-01-01T00:00:00"),
+    ],
+)
+def test_union_value_is_dispatched_by_type(dumped, loaded):
+    instance = DataClassWithUnion.from_dict({"x": dumped})
+    assert instance.x == loaded
+    assert type(instance.x) is type(loaded)
+    assert instance.to_dict()["x"] == dumped
+    assert type(instance.to_dict()["x"]) is type(dumped)
+
+
+def test_union_value_of_unknown_type_is_tried_on_each_argument():
+    assert DataClassWithUnion.from_dict({"x": True}).x == 1.0
+    assert DataClassWithUnion(True).to_dict() == {"x": 1.0, "y": 0}
+
+
+def test_union_dataclass_value_is_packed_without_trials(mocker):
+    to_dict = mocker.spy(UnionMemberA, "to_dict")
+    instance = DataClassWithUnion(1, UnionMemberB(2))
+    assert instance.to_dict() == {"x": 1, "y": {"b": 2}}
+    to_dict.assert_not_called()
+    assert DataClassWithUnion.from_dict({"x": 1, "y": {"b": 2}}) == instance
+
+
+def test_union_value_that_cannot_be_packed():
+    with pytest.raises(InvalidFieldValue):
+        DataClassWithUnion(1, object()).to_dict()
+
+
+def test_union_does_not_swallow_keyboard_interrupt():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Union[Interrupting, int]
+
+    with pytest.raises(KeyboardInterrupt):
+        DataClass.from_dict({"x": "a"})
+    with pytest.raises(KeyboardInterrupt):
+        DataClass(Interrupting()).to_dict()
+
+
+class EventType(Enum):
+    CLICK = "click"
+    SCROLL = "scroll"
+
+
+@dataclass
+class Click(DataClassDictMixin):
+    x: int
+    type: EventType = EventType.CLICK
+
+
+@dataclass
+class Scroll(DataClassDictMixin):
+    offset: int
+    type: EventType = EventType.SCROLL
+
+
+@dataclass
+class DoubleClick(Click):
+    pass
+
+
+@dataclass
+class Tagged(DataClassDictMixin):
+    value: int
+    kind: str = field(default="tagged", metadata=field_options(alias="@kind"))
+
+
+@dataclass
+class Session(DataClassDictMixin):
+    events: List[Union[Click, Scroll, int]] = field(
+        metadata=field_options(discriminator="type")
+    )
+
+
+def test_union_with_discriminator(mocker):
+    from_dict = mocker.spy(Click, "from_dict")
+    dumped = {"events": [{"type": "scroll", "offset": 1}, {"x": 2}, 3]}
+    instance = Session([Scroll(1), Click(2), 3])
+    assert Session.from_dict(dumped) == instance
+    assert from_dict.call_count == 1
+    dumped["events"][1]["type"] = "click"
+    assert instance.to_dict() == dumped
+
+
+def test_union_with_discriminator_and_flags():
+    dumped = {"events": [{"type": EventType.SCROLL, "offset": 1}]}
+    instance = Session([Scroll(1)])
+    assert Session.from_dict(dumped, use_enum=True) == instance
+    assert instance.to_dict(use_enum=True) == dumped
+
+
+def test_union_with_aliased_discriminator():
+    @dataclass
+    class DataClass(DataClassDictMixin):
+        x: Union[Click, Tagged] = field(
+            metadata=field_options(discriminator="kind")
+        )
+
+    assert DataClass.from_dict({"x": {"@kind": "tagged", "value": 1}}) == (
+        DataClass(Tagged(1))
+    )
+
+
+def test_union_with_ambiguous_discriminator():
+    with pytest.raises(UnserializableField):
+
+        @dataclass
+        class DataClass(DataClassDictMixin):
+            x: Union[Click, DoubleClick] = field(
+                metadata=field_options(discriminator="type")
+            )
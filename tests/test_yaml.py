@@ -1,9 +1,85 @@
+import io
 from dataclasses import dataclass
-from typing import List
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Union
 
+import pytest
 import yaml
 
 from mashumaro import DataClassYAMLMixin
+from mashumaro.config import BaseConfig
+from mashumaro.exceptions import InvalidFieldValue
+from mashumaro.serializer.yaml import (
+    DefaultDumper,
+    DefaultLoader,
+    StrScalarLoader,
+)
+
+from .entities import MyEnum, MyIntEnum
+
+
+@dataclass
+class YAMLInner(DataClassYAMLMixin):
+    flag: bool
+    ratio: float
+
+
+@dataclass
+class YAMLConfig(DataClassYAMLMixin):
+    name: str
+    port: int
+    debug: bool
+    ratio: float
+    timeout: timedelta
+    day: date
+    int_enum: MyIntEnum
+    str_enum: MyEnum
+    inner: YAMLInner
+    inners: Dict[int, YAMLInner]
+    either: Union[int, str]
+    optional: Optional[int] = None
+    optional_str: Optional[str] = "x"
+
+    class Config(BaseConfig):
+        yaml_base_loader = True
+
+
+YAML_CONFIG_DATA = """
+base: &base
+  flag: no
+  ratio: .inf
+name: no
+port: 80
+debug: yes
+ratio: 1e3
+timeout: 1.5
+day: 2021-01-01
+int_enum: 2
+str_enum: letter a
+inner:
+  <<: *base
+  ratio: 2
+inners:
+  1: {flag: on, ratio: -.inf}
+either: 5
+optional: ~
+optional_str: 'null'
+"""
+YAML_CONFIG = YAMLConfig(
+    name="no",
+    port=80,
+    debug=True,
+    ratio=1000.0,
+    timeout=timedelta(seconds=1.5),
+    day=date(2021, 1, 1),
+    int_enum=MyIntEnum.b,
+    str_enum=MyEnum.a,
+    inner=YAMLInner(False, 2.0),
+    inners={1: YAMLInner(True, float("-inf"))},
+    either=5,
+    optional=None,
+    optional_str="null",
+)
 
 
 def test_to_yaml():
@@ -22,3 +98,143 @@ def test_from_yaml():
 
     dumped = yaml.dump({"x": [1, 2, 3]})
     assert DataClass.from_yaml(dumped) == DataClass([1, 2, 3])
+
+
+def test_default_loader_and_dumper():
+    if yaml.__with_libyaml__:
+        assert DefaultLoader is yaml.CSafeLoader
+        assert DefaultDumper is yaml.CDumper
+    else:
+        assert DefaultLoader is yaml.SafeLoader
+        assert DefaultDumper is yaml.Dumper
+
+
+def test_from_yaml_is_safe():
+    @dataclass
+    class DataClass(DataClassYAMLMixin):
+        x: List[int]
+
+    with pytest.raises(yaml.YAMLError):
+        DataClass.from_yaml("x: !!python/object/apply:os.getcwd []")
+
+
+def test_iter_from_yaml():
+    @dataclass
+    class DataClass(DataClassYAMLMixin):
+        x: List[int]
+
+    data = "x: [1]\n---\nx: [2, 3]\n---\n"
+    expected = [DataClass([1]), DataClass([2, 3])]
+    assert list(DataClass.iter_from_yaml(data)) == expected
+    assert list(DataClass.iter_from_yaml(io.StringIO(data))) == expected
+    assert list(DataClass.iter_from_yaml(data.encode())) == expected
+    assert list(DataClass.iter_from_yaml("")) == []
+    loaded = DataClass.iter_from_yaml(data, loader=yaml.SafeLoader)
+    assert list(loaded) == expected
+
+
+def test_iter_from_yaml_is_lazy():
+    @dataclass
+    class DataClass(DataClassYAMLMixin):
+        x: List[int]
+
+    loaded = DataClass.iter_from_yaml("x: [1]\n---\nx: a\n")
+    assert next(loaded) == DataClass([1])
+    with pytest.raises(InvalidFieldValue):
+        next(loaded)
+
+
+def test_to_yaml_all():
+    @dataclass
+    class DataClass(DataClassYAMLMixin):
+        x: List[int]
+
+    objs = [DataClass([1]), DataClass([2, 3])]
+    dumped = yaml.dump_all([{"x": [1]}, {"x": [2, 3]}])
+    assert DataClass.to_yaml_all(objs) == dumped
+    stream = io.StringIO()
+    assert DataClass.to_yaml_all(iter(objs), stream) is None
+    assert stream.getvalue() == dumped
+    assert list(DataClass.iter_from_yaml(dumped)) == objs
+    dumped = DataClass.to_yaml_all(objs, explicit_start=True)
+    assert dumped.startswith("---")
+    assert list(DataClass.iter_from_yaml(dumped)) == objs
+
+
+def test_str_scalar_loader():
+    loaded = yaml.load(
+        "a: [1, yes, 1.5, 2021-01-01, ~, '~', null, '']", StrScalarLoader
+    )
+    assert loaded == {
+        "a": ["1", "yes", "1.5", "2021-01-01", None, "~", None, ""]
+    }
+    loaded = yaml.load(
+        "a: &a {x: 1, y: 2}\nb: {<<: *a, y: 3}", StrScalarLoader
+    )
+    assert loaded["b"] == {"x": "1", "y": "3"}
+
+
+def test_from_yaml_with_base_loader():
+    assert YAMLConfig.from_yaml(YAML_CONFIG_DATA) == YAML_CONFIG
+    assert YAMLConfig.from_yaml(YAML_CONFIG.to_yaml()) == YAML_CONFIG
+    dumped = YAMLConfig.to_yaml_all([YAML_CONFIG, YAML_CONFIG])
+    loaded = list(YAMLConfig.iter_from_yaml(dumped))
+    assert loaded == [YAML_CONFIG, YAML_CONFIG]
+
+
+def test_from_yaml_with_base_loader_and_decoder():
+    with pytest.raises(InvalidFieldValue):
+        YAMLConfig.from_yaml(YAML_CONFIG_DATA, decoder=yaml.safe_load)
+    loaded = YAMLConfig.iter_from_yaml(
+        YAML_CONFIG.to_yaml(), loader=DefaultLoader
+    )
+    assert list(loaded) == [YAML_CONFIG]
+
+
+def test_from_yaml_with_base_loader_invalid_bool():
+    data = YAML_CONFIG_DATA.replace("debug: yes", "debug: maybe")
+    with pytest.raises(InvalidFieldValue) as exc_info:
+        YAMLConfig.from_yaml(data)
+    assert exc_info.value.field_name == "debug"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "0",
+        "17",
+        "-17",
+        "+17",
+        "017",
+        "-017",
+        "0x1A",
+        "-0x1a",
+        "0b101",
+        "1_000",
+        "1:30",
+        "-1:00:30",
+    ],
+)
+def test_from_yaml_with_base_loader_int_strings(value):
+    data = YAML_CONFIG_DATA.replace("port: 80", f"port: {value}")
+    expected = yaml.safe_load(data)["port"]
+    assert type(expected) is int
+    assert YAMLConfig.from_yaml(data).port == expected
+
+
+@pytest.mark.parametrize("value, expected", [("0o17", 15), ("08", 8)])
+def test_from_yaml_with_base_loader_other_int_strings(value, expected):
+    data = YAML_CONFIG_DATA.replace("port: 80", f"port: {value}")
+    assert YAMLConfig.from_yaml(data).port == expected
+
+
+def test_from_yaml_with_base_loader_invalid_int():
+    data = YAML_CONFIG_DATA.replace("port: 80", "port: 0xZ")
+    with pytest.raises(InvalidFieldValue) as exc_info:
+        YAMLConfig.from_yaml(data)
+    assert exc_info.value.field_name == "port"
+
+
+def test_from_dict_is_not_affected_by_base_loader():
+    dumped = YAML_CONFIG.to_dict()
+    assert YAMLConfig.from_dict(dumped) == YAML_CONFIG